@@ -6,7 +6,6 @@ from PyQt6.QtWidgets import (
     QProgressBar, QPushButton, QFrame, QGridLayout
 )
 from PyQt6.QtCore import Qt, QTimer
-from ..utils.constants import COLORS, STYLES
 
 class ChargingPopup(QWidget):
     def __init__(self, parent=None):
@@ -26,61 +25,31 @@ class ChargingPopup(QWidget):
         
         # Create main container with styling
         self.container = QFrame(self)
-        self.container.setStyleSheet("""
-            QFrame {
-                background-color: rgba(0, 0, 0, 0.9);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 10px;
-            }
-            QLabel {
-                color: white;
-            }
-        """)
+        self.container.setObjectName("charging_popup")
         container_layout = QVBoxLayout(self.container)
         
         # Header
         header_layout = QHBoxLayout()
         title = QLabel("Charging Status")
-        title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        title.setObjectName("popup_title")
         header_layout.addWidget(title)
         
         # Close button
         self.close_button = QPushButton("×")
-        self.close_button.setStyleSheet("""
-            QPushButton {
-                color: white;
-                background: transparent;
-                border: none;
-                font-size: 20px;
-                padding: 5px;
-            }
-            QPushButton:hover {
-                color: #ff4444;
-            }
-        """)
+        self.close_button.setObjectName("popup_close")
         self.close_button.clicked.connect(self.hide)
         header_layout.addWidget(self.close_button, alignment=Qt.AlignmentFlag.AlignRight)
         container_layout.addLayout(header_layout)
         
         # Charge percentage
-        self.percentage_label = QLabel("67%")
-        self.percentage_label.setStyleSheet("font-size: 48px; font-weight: bold;")
+        self.percentage_label = QLabel("--%")
+        self.percentage_label.setObjectName("charge_percentage")
         self.percentage_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         container_layout.addWidget(self.percentage_label)
         
         # Progress bar
         self.progress_bar = QProgressBar()
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #2196F3;
-                border-radius: 5px;
-                text-align: center;
-                background-color: rgba(255, 255, 255, 0.1);
-            }
-            QProgressBar::chunk {
-                background-color: #2196F3;
-            }
-        """)
+        self.progress_bar.setObjectName("charge_progress")
         self.progress_bar.setMinimum(0)
         self.progress_bar.setMaximum(100)
         container_layout.addWidget(self.progress_bar)
@@ -90,27 +59,33 @@ class ChargingPopup(QWidget):
         
         # Time remaining
         self.time_label = QLabel("Time Remaining:")
-        self.time_value = QLabel("2h 15m")
+        self.time_value = QLabel("--")
         info_layout.addWidget(self.time_label, 0, 0)
         info_layout.addWidget(self.time_value, 0, 1)
         
         # Power
         self.power_label = QLabel("Charging Power:")
-        self.power_value = QLabel("7.2 kW")
+        self.power_value = QLabel("--")
         info_layout.addWidget(self.power_label, 1, 0)
         info_layout.addWidget(self.power_value, 1, 1)
         
         # Range
         self.range_label = QLabel("Est. Range:")
-        self.range_value = QLabel("285 mi")
+        self.range_value = QLabel("--")
         info_layout.addWidget(self.range_label, 2, 0)
         info_layout.addWidget(self.range_value, 2, 1)
         
         # Battery temp
         self.temp_label = QLabel("Battery Temp:")
-        self.temp_value = QLabel("25°C")
+        self.temp_value = QLabel("--")
         info_layout.addWidget(self.temp_label, 3, 0)
         info_layout.addWidget(self.temp_value, 3, 1)
+
+        # Energy delivered this session
+        self.energy_label = QLabel("Energy Added:")
+        self.energy_value = QLabel("--")
+        info_layout.addWidget(self.energy_label, 4, 0)
+        info_layout.addWidget(self.energy_value, 4, 1)
         
         container_layout.addLayout(info_layout)
         main_layout.addWidget(self.container)
@@ -118,38 +93,36 @@ class ChargingPopup(QWidget):
         # Set fixed size
         self.setFixedSize(300, 400)
         
-    def update_data(self, data):
-        """Update the charging display with new data"""
-        if not data:
-            return
-            
-        # Update charge percentage
-        charge_percent = data.get("charge_percent", 0)
-        self.percentage_label.setText(f"{charge_percent}%")
-        self.progress_bar.setValue(charge_percent)
-        
-        # Update power
-        power = data.get("charging_rate", 0)
-        self.power_value.setText(f"{power} kW")
-        
-        # Update battery temp
-        temp = data.get("battery_temp", 0)
-        self.temp_value.setText(f"{temp}°C")
-        
-        # Update range (estimated based on charge percentage)
-        max_range = 350  # Maximum range in miles
-        est_range = int(max_range * charge_percent / 100)
-        self.range_value.setText(f"{est_range} mi")
-        
-        # Update time remaining (estimated)
-        if power > 0:
-            remaining_charge = 100 - charge_percent
-            hours_remaining = remaining_charge / (power * 100 / max_range)
-            hours = int(hours_remaining)
-            minutes = int((hours_remaining - hours) * 60)
-            self.time_value.setText(f"{hours}h {minutes}m")
+    def update_session(self, estimate):
+        """Update the charging display from a ChargingSession estimate"""
+        percent = estimate["charge_percent"]
+        if percent is not None:
+            self.set_text(self.percentage_label, f"{percent:.0f}%")
+            if self.progress_bar.value() != int(percent):
+                self.progress_bar.setValue(int(percent))
+
+        power = estimate["charging_rate"]
+        self.set_text(self.power_value, f"{power:.1f} kW" if power is not None else "--")
+
+        temp = estimate["battery_temp"]
+        self.set_text(self.temp_value, f"{temp:.0f}°C" if temp is not None else "--")
+
+        est_range = estimate["range"]
+        self.set_text(self.range_value, f"{est_range:.0f} mi" if est_range is not None else "--")
+
+        minutes = estimate["minutes_remaining"]
+        if minutes is not None:
+            hours, minutes = divmod(int(round(minutes)), 60)
+            self.set_text(self.time_value, f"{hours}h {minutes}m")
         else:
-            self.time_value.setText("--")
+            self.set_text(self.time_value, "--")
+
+        self.set_text(self.energy_value, f"{estimate['kwh_delivered']:.1f} kWh")
+
+    def set_text(self, label, text):
+        """Set label text only when it differs"""
+        if label.text() != text:
+            label.setText(text)
             
     def show(self):
         """Show popup in the parent's center"""
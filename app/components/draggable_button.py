@@ -4,7 +4,6 @@ Draggable app button that includes layout position information in drag data
 from PyQt6.QtWidgets import QPushButton, QVBoxLayout, QLabel
 from PyQt6.QtGui import QDrag
 from PyQt6.QtCore import Qt, QMimeData, QTimer, QSize
-from ..utils.constants import COLORS
 
 class DraggableButton(QPushButton):
     def __init__(self, text, icon_name=""):
@@ -21,33 +20,14 @@ class DraggableButton(QPushButton):
         
         # Add text label
         text_label = QLabel(text)
-        text_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 11px;
-            }
-        """)
         text_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(text_label)
         
         self.setLayout(layout)
         self.setFixedSize(70, 70)
         
-        # Enhanced styling
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: rgba(255, 255, 255, 0.1);
-                border: 1px solid {COLORS['BORDER']};
-                border-radius: 10px;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(255, 255, 255, 0.2);
-                border: 1px solid rgba(255, 255, 255, 0.3);
-            }}
-            QPushButton:pressed {{
-                background-color: rgba(255, 255, 255, 0.15);
-            }}
-        """)
+        # Styled by the theme, including the text label
+        self.setObjectName("app_button")
 
     def mousePressEvent(self, event):
         """Handle mouse press for dragging with position information"""
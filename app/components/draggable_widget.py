@@ -15,13 +15,8 @@ class DraggableWidget(QWidget):
         
     def setup_ui(self):
         """Initialize widget UI"""
-        self.setStyleSheet("""
-            QWidget {
-                background-color: rgba(255, 255, 255, 0.9);
-                border: 1px solid rgba(0, 0, 0, 0.1);
-                border-radius: 10px;
-            }
-        """)
+        self.setObjectName("draggable_widget")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
         
         # Main layout
         self.layout = QVBoxLayout(self)
@@ -31,14 +26,8 @@ class DraggableWidget(QWidget):
         # Header for drag handle
         self.header = QWidget()
         self.header.setFixedHeight(30)
-        self.header.setStyleSheet("""
-            QWidget {
-                background-color: rgba(0, 0, 0, 0.1);
-                border-top-left-radius: 10px;
-                border-top-right-radius: 10px;
-                border: none;
-            }
-        """)
+        self.header.setObjectName("drag_header")
+        self.header.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
         
         # Header layout
         header_layout = QVBoxLayout(self.header)
@@ -46,14 +35,7 @@ class DraggableWidget(QWidget):
         
         # Title in header
         self.title = QLabel(self.widget_type)
-        self.title.setStyleSheet("""
-            QLabel {
-                color: rgba(0, 0, 0, 0.8);
-                font-weight: bold;
-                background: transparent;
-                border: none;
-            }
-        """)
+        self.title.setObjectName("drag_title")
         header_layout.addWidget(self.title)
         
         # Add header to main layout
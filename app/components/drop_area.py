@@ -2,33 +2,40 @@
 Drop area for dashboard widgets with intelligent layout management
 """
 from PyQt6.QtWidgets import QFrame, QGridLayout
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import QTimer
 from .vehicle_widget import VehicleWidget
+from .spec_widget import SpecWidget
+from .fault_history_view import FaultHistoryView
+from ..utils.constants import LAYOUT_STATE, LAYOUT_TEMPLATES, DROP_LAYOUT, WIDGET_SPECS
+from ..utils.layout_engine import LayoutEngine
 import ast
 
 class DropArea(QFrame):
-    def __init__(self):
+    # Specs with a bespoke card; every other WIDGET_SPECS entry gets a SpecWidget
+    SPEC_CARDS = {
+        "Vehicle Info": VehicleWidget
+    }
+
+    def __init__(self, fault_history=None, layout_store=None):
         super().__init__()
+        self.fault_history = fault_history
+        self.layout_store = layout_store
         self.setAcceptDrops(True)
         self.setup_ui()
         
     def setup_ui(self):
         """Initialize the UI"""
-        self.setStyleSheet("""
-            QFrame {
-                background-color: transparent;
-                border: none;
-            }
-        """)
+        self.setObjectName("drop_area")
         
         # Main layout
         self.layout = QGridLayout(self)
         self.layout.setContentsMargins(20, 20, 20, 20)
         self.layout.setSpacing(20)
         
-        # Widget tracking
+        # Widget tracking; positions are slot indexes of the template for the widget count
         self.widgets = []
         self.widget_positions = {}
+        self.layout_engine = LayoutEngine(LAYOUT_TEMPLATES[DROP_LAYOUT["templates"]])
         
         # Update handling
         self._update_pending = False
@@ -36,6 +43,12 @@ class DropArea(QFrame):
         self._update_timer.timeout.connect(self._do_update)
         self._update_timer.setSingleShot(True)
 
+        # Layout persistence, debounced so a burst of changes is written once
+        self._save_timer = QTimer(self)
+        self._save_timer.timeout.connect(self.save_layout)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(LAYOUT_STATE["save_delay"])
+
     def dragEnterEvent(self, event):
         """Accept drag entry if it has text data"""
         if event.mimeData().hasText():
@@ -58,13 +71,13 @@ class DropArea(QFrame):
             is_existing = False
 
         # Check for removal zone
-        if is_existing and relative_y < 0.15:
+        if is_existing and relative_y < DROP_LAYOUT["removal_zone"]:
             self.showRemovalIndicator()
             event.acceptProposedAction()
             return
 
         # Calculate and show appropriate drop zones
-        self.updateDropZones(relative_x, len(self.widgets))
+        self.updateDropZones(relative_x, relative_y, len(self.widgets))
         event.acceptProposedAction()
 
     def dropEvent(self, event):
@@ -82,32 +95,21 @@ class DropArea(QFrame):
             is_new = data.get("type") == "new_widget"
             
             # Handle widget removal
-            if not is_new and relative_y < 0.15:
+            if not is_new and relative_y < DROP_LAYOUT["removal_zone"]:
                 self.remove_widget(widget_type)
                 if len(self.widgets) == 0:
                     self.parent().parent().restore_background()
                 event.acceptProposedAction()
                 return
 
-            # Calculate desired position based on layout
+            if len(self.widgets) >= self.layout_engine.max_slots:
+                return
+
+            # Slot under the drop point in the layout with the new widget added
             if len(self.widgets) == 0:
-                # First widget - full screen
-                if len(self.widgets) == 0:
-                    self.parent().parent().set_blurred_background()
-                self.add_widget(widget_type, 0)
-            elif len(self.widgets) == 1:
-                # Second widget - split into halves
-                position = 0 if relative_x < 0.5 else 1
-                self.add_widget(widget_type, position)
-            else:
-                # Third widget - split into thirds
-                if relative_x < 0.33:
-                    position = 0
-                elif relative_x < 0.66:
-                    position = 1
-                else:
-                    position = 2
-                self.add_widget(widget_type, position)
+                self.parent().parent().set_blurred_background()
+            position = self.layout_engine.drop_slot(len(self.widgets) + 1, relative_x, relative_y)
+            self.add_widget(widget_type, position)
 
             event.acceptProposedAction()
 
@@ -115,32 +117,34 @@ class DropArea(QFrame):
             print(f"Error handling drop: {e}")
             return
 
+    def create_widget(self, widget_type):
+        """Create a widget of the given type, or None for unsupported types"""
+        if widget_type in WIDGET_SPECS:
+            widget = self.SPEC_CARDS.get(widget_type, SpecWidget)(widget_type, self)
+        elif widget_type == "Fault History" and self.fault_history is not None:
+            widget = FaultHistoryView(self.fault_history, widget_type, self)
+        else:
+            return None  # Only handle WIDGET_SPECS entries and Fault History for now
+        if hasattr(widget, "config_changed"):
+            widget.config_changed.connect(self.schedule_save)
+        return widget
+
     def add_widget(self, widget_type, desired_position):
-        """Add a new widget to the specified position"""
+        """Add a new widget at the specified slot, shifting later widgets along"""
+        if len(self.widgets) >= self.layout_engine.max_slots:
+            return  # Every slot of the largest template is taken
+
         # Create appropriate widget based on type
-        if widget_type == "Vehicle Info":
-            widget = VehicleWidget(widget_type, self)
-        else:
-            return  # Only handle Vehicle Info for now
-            
-        if len(self.widgets) >= 3:
-            return  # Maximum 3 widgets
-            
+        widget = self.create_widget(widget_type)
+        if widget is None:
+            return
+
+        ordered = self.ordered_widgets()
+        ordered.insert(min(max(desired_position, 0), len(ordered)), widget)
         self.widgets.append(widget)
-        
-        # Handle positioning
-        taken_positions = set(self.widget_positions.values())
-        if desired_position in taken_positions:
-            if len(self.widgets) < 3:
-                available = set(range(3)) - taken_positions
-                position = min(available, key=lambda x: abs(x - desired_position))
-            else:
-                position = desired_position
-        else:
-            position = desired_position
-            
-        self.widget_positions[widget] = position
+        self.widget_positions = {w: position for position, w in enumerate(ordered)}
         self.schedule_update()
+        self.schedule_save()
 
     def remove_widget(self, widget_type):
         """Remove a widget and adjust layout"""
@@ -149,8 +153,17 @@ class DropArea(QFrame):
         if widget_to_remove:
             self.widgets.remove(widget_to_remove)
             del self.widget_positions[widget_to_remove]
+            # Hidden first so views stop their refresh timers and queries
+            widget_to_remove.hide()
             widget_to_remove.setParent(None)
+            # Close the gap so the remaining widgets fill the smaller template
+            self.widget_positions = {w: position for position, w in enumerate(self.ordered_widgets())}
             self.schedule_update()
+            self.schedule_save()
+
+    def ordered_widgets(self):
+        """Widgets in slot order"""
+        return [w for w, _ in sorted(self.widget_positions.items(), key=lambda x: x[1])]
 
     def schedule_update(self):
         """Schedule a layout update"""
@@ -163,8 +176,68 @@ class DropArea(QFrame):
         self._update_pending = False
         self.rearrange_widgets()
 
+    def schedule_save(self):
+        """Save the layout once changes have settled"""
+        if self.layout_store is not None:
+            self._save_timer.start()
+
+    def layout_state(self):
+        """Slot assignment and configuration of every widget"""
+        return [
+            {
+                "type": widget.text(),
+                "position": position,
+                "config": widget.layout_config() if hasattr(widget, "layout_config") else {}
+            }
+            for widget, position in sorted(self.widget_positions.items(), key=lambda x: x[1])
+        ]
+
+    def save_layout(self):
+        """Write the current layout to the layout store"""
+        if self.layout_store is not None:
+            self.layout_store.save(self.layout_state())
+
+    def save_pending_layout(self):
+        """Write a layout change still waiting for its debounce delay"""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.save_layout()
+
+    def restore_layout(self):
+        """
+        Rebuild the saved layout in a single pass, without the deferred update per widget
+        Returns:
+            int: Number of widgets restored
+        """
+        if self.layout_store is None:
+            return 0
+        saved = self.layout_store.load()
+        if not saved:
+            return 0
+
+        max_slots = self.layout_engine.max_slots
+        for entry in saved[:max_slots]:
+            position = entry["position"]
+            if position in self.widget_positions.values() or not 0 <= position < max_slots:
+                continue
+            widget = self.create_widget(entry["type"])
+            if widget is None:
+                continue
+            if hasattr(widget, "apply_layout_config"):
+                widget.apply_layout_config(entry.get("config") or {})
+            self.widgets.append(widget)
+            self.widget_positions[widget] = position
+
+        # Saved positions may have gaps once a widget type is gone; keep their order
+        self.widget_positions = {w: position for position, w in enumerate(self.ordered_widgets())}
+
+        self.setUpdatesEnabled(False)
+        self.rearrange_widgets()
+        self.setUpdatesEnabled(True)
+        return len(self.widgets)
+
     def rearrange_widgets(self):
-        """Rearrange all widgets in the layout"""
+        """Rearrange all widgets into the template for the current widget count"""
         self.layout.blockSignals(True)
         
         # Clear current layout
@@ -173,21 +246,28 @@ class DropArea(QFrame):
             if item.widget():
                 item.widget().setParent(None)
 
-        # Add widgets in their new positions
-        for widget, position in sorted(self.widget_positions.items(), key=lambda x: x[1]):
-            # Adjust column span based on widget count
-            colspan = 1
-            if len(self.widgets) == 1:
-                colspan = self.layout.columnCount()
-            elif len(self.widgets) == 2:
-                colspan = self.layout.columnCount() // 2
-                
-            self.layout.addWidget(widget, 0, position * colspan, 1, colspan)
+        # Reset stretch factors left over from a larger template
+        for row in range(self.layout.rowCount()):
+            self.layout.setRowStretch(row, 0)
+        for column in range(self.layout.columnCount()):
+            self.layout.setColumnStretch(column, 0)
+
+        if self.widgets:
+            template = self.layout_engine.template(len(self.widgets))
+            for row, stretch in enumerate(template.row_stretch):
+                self.layout.setRowStretch(row, stretch)
+            for column, stretch in enumerate(template.column_stretch):
+                self.layout.setColumnStretch(column, stretch)
+
+            # Add widgets in their slots
+            for widget, position in sorted(self.widget_positions.items(), key=lambda x: x[1]):
+                row, column, row_span, column_span = template.cells[position]
+                self.layout.addWidget(widget, row, column, row_span, column_span)
             
         self.layout.blockSignals(False)
         self.layout.update()
 
-    def updateDropZones(self, relative_x, widget_count):
+    def updateDropZones(self, relative_x, relative_y, widget_count):
         """Update visual drop zone indicators"""
         # Implementation for visual feedback during drag
         # This would show where the widget will be placed
@@ -0,0 +1,187 @@
+"""
+Fault history view querying the fault event store off the UI thread
+"""
+import time
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QTableWidget,
+    QTableWidgetItem, QHeaderView, QAbstractItemView
+)
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from ..utils.constants import FAULT_SOURCES, FAULT_TYPES, FAULT_HISTORY
+
+COLUMNS = ("Time", "Source", "Type", "Severity", "Duration")
+
+
+def format_event(event):
+    """Table cells of one FaultEvent"""
+    start = time.strftime("%H:%M:%S", time.localtime(event.start))
+    duration = "active" if event.active else f"{event.duration():.1f}s"
+    return (
+        start,
+        FAULT_SOURCES.get(event.source, event.source or "--"),
+        FAULT_TYPES.get(event.type, event.type or "--"),
+        str(event.severity) if event.severity is not None else "--",
+        duration
+    )
+
+
+class QuerySignals(QObject):
+    # (generation, rows)
+    finished = pyqtSignal(int, list)
+
+
+class QueryTask(QRunnable):
+    """Runs a fault history query, persisted events included, and formats the rows off the UI"""
+    def __init__(self, history, generation, filters, signals):
+        super().__init__()
+        self.history = history
+        self.generation = generation
+        self.filters = filters
+        self.signals = signals
+
+    def run(self):
+        events = self.history.query_persisted(**self.filters)
+        rows = [format_event(event) for event in events]
+        self.signals.finished.emit(self.generation, rows)
+
+
+class FaultHistoryView(QWidget):
+    # Emitted when the filters saved with the layout change
+    config_changed = pyqtSignal()
+
+    def __init__(self, history, widget_type="Fault History", parent=None):
+        super().__init__(parent)
+        self.history = history
+        self.widget_type = widget_type
+        self.drag_start_position = None
+
+        # Query bookkeeping: one query at a time, results of superseded queries are dropped
+        self.generation = 0
+        self.query_running = False
+        self.shown_version = None
+        # Unparented so a query finishing after the view was deleted emits on a live object
+        self.signals = QuerySignals()
+        self.signals.finished.connect(self.show_results)
+
+        self.setup_ui()
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.start(FAULT_HISTORY["view_refresh"])
+        self.refresh()
+
+    def setup_ui(self):
+        """Initialize the fault history UI"""
+        self.setObjectName("fault_history_view")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
+        layout = QVBoxLayout(self)
+        layout.setSpacing(10)
+
+        # Header
+        header = QLabel("Fault History")
+        header.setObjectName("card_header")
+        header.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(header)
+
+        # Filters
+        filter_layout = QHBoxLayout()
+        self.source_filter = QComboBox()
+        self.source_filter.addItem("All sources", None)
+        for key, name in FAULT_SOURCES.items():
+            self.source_filter.addItem(name, key)
+        self.type_filter = QComboBox()
+        self.type_filter.addItem("All types", None)
+        for key, name in FAULT_TYPES.items():
+            self.type_filter.addItem(name, key)
+        self.source_filter.currentIndexChanged.connect(self.filters_changed)
+        self.type_filter.currentIndexChanged.connect(self.filters_changed)
+        filter_layout.addWidget(self.source_filter)
+        filter_layout.addWidget(self.type_filter)
+        layout.addLayout(filter_layout)
+
+        # Event table
+        self.table = QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        layout.addWidget(self.table)
+
+        self.setMinimumSize(500, 400)
+
+    def filters_changed(self):
+        """Re-query for new filters, at once or when the query in flight returns"""
+        self.generation += 1
+        self.shown_version = None
+        self.refresh()
+        self.config_changed.emit()
+
+    def layout_config(self):
+        """Filters saved with the layout"""
+        return {
+            "source": self.source_filter.currentData(),
+            "fault_type": self.type_filter.currentData()
+        }
+
+    def apply_layout_config(self, config):
+        """Restore filters saved with the layout"""
+        for combo, value in ((self.source_filter, config.get("source")),
+                             (self.type_filter, config.get("fault_type"))):
+            index = combo.findData(value)
+            if index >= 0:
+                combo.blockSignals(True)
+                combo.setCurrentIndex(index)
+                combo.blockSignals(False)
+        self.filters_changed()
+
+    def refresh(self):
+        """Start a background query if the history changed since the last one"""
+        if self.query_running or self.history.version == self.shown_version:
+            return
+        self.generation += 1
+        self.query_running = True
+        self.queried_version = self.history.version
+        filters = {
+            "source": self.source_filter.currentData(),
+            "fault_type": self.type_filter.currentData(),
+            "limit": FAULT_HISTORY["view_limit"]
+        }
+        QThreadPool.globalInstance().start(
+            QueryTask(self.history, self.generation, filters, self.signals))
+
+    def show_results(self, generation, rows):
+        """Fill the table with the rows of the latest query"""
+        self.query_running = False
+        if generation != self.generation:
+            # The filters changed while this query ran
+            self.refresh()
+            return
+        self.shown_version = self.queried_version
+
+        self.table.setUpdatesEnabled(False)
+        self.table.setRowCount(len(rows))
+        for row, cells in enumerate(rows):
+            for column, text in enumerate(cells):
+                item = self.table.item(row, column)
+                if item is None:
+                    self.table.setItem(row, column, QTableWidgetItem(text))
+                elif item.text() != text:
+                    item.setText(text)
+        self.table.setUpdatesEnabled(True)
+
+    def text(self):
+        """Return widget type for drag and drop compatibility"""
+        return self.widget_type
+
+    def hideEvent(self, event):
+        """Stop refreshing while the view is not shown"""
+        self.refresh_timer.stop()
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        """Resume refreshing, catching up on changes made while hidden"""
+        if not self.refresh_timer.isActive():
+            self.refresh_timer.start(FAULT_HISTORY["view_refresh"])
+            self.refresh()
+        super().showEvent(event)
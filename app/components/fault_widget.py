@@ -3,16 +3,23 @@ Widget for displaying vehicle fault information and system status
 """
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame
 from PyQt6.QtCore import Qt
-from ..utils.constants import COLORS, STYLES
+from ..utils.constants import FAULT_QUEUE
+from ..utils.theme import set_style_property
+from ..services.fault_queue import FaultQueue
 
 class FaultWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.fault_queue = FaultQueue()
+        self.shown_faults = None
         self.setup_ui()
         
     def setup_ui(self):
         """Initialize the fault widget UI"""
-        self.setStyleSheet(STYLES["fault_widget"])
+        # Tinted by the theme according to the level property
+        self.setObjectName("fault_widget")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
+        self.setProperty("level", "")
         layout = QVBoxLayout(self)
         
         # Header section
@@ -23,18 +30,26 @@ class FaultWidget(QWidget):
         # Primary fault status
         self.fault_status = QLabel("✓ System Normal")
         self.fault_status.setObjectName("fault_active")
+        self.fault_status.setProperty("active", False)
         self.fault_status.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         # Divider line
         divider = QFrame()
         divider.setFrameShape(QFrame.Shape.HLine)
-        divider.setStyleSheet("background-color: rgba(0, 0, 0, 0.1);")
+        divider.setObjectName("divider")
         
         # Fault details section
         self.source_label = QLabel("Source: --")
         self.type_label = QLabel("Type: --")
         self.severity_label = QLabel("Severity: --")
         self.time_label = QLabel("Time: --")
+
+        # Further concurrent faults, most severe first
+        self.other_labels = []
+        for _ in range(FAULT_QUEUE["max_rows"] - 1):
+            label = QLabel()
+            label.hide()
+            self.other_labels.append(label)
         
         # Add all elements to layout
         layout.addWidget(self.header_label)
@@ -44,63 +59,81 @@ class FaultWidget(QWidget):
         layout.addWidget(self.type_label)
         layout.addWidget(self.severity_label)
         layout.addWidget(self.time_label)
+        for label in self.other_labels:
+            layout.addWidget(label)
         
         # Set minimum size for the widget
         self.setMinimumSize(200, 200)
         
     def update_fault_status(self, fault_data):
-        """Update the fault display with new data"""
+        """Update the fault display from a FaultStatus payload"""
         if not fault_data:
             return
-            
-        fault_active = fault_data.get("active", False)
-        
-        if fault_active:
-            # Update status for active fault
-            self.fault_status.setText("⚠️ FAULT ACTIVE")
-            self.fault_status.setStyleSheet(f"color: {COLORS['FAULT_ACTIVE']}; font-weight: bold;")
-            
+
+        if self.fault_queue.sync(fault_data.entries()) or self.shown_faults is None:
+            self.render_faults(self.fault_queue.top(FAULT_QUEUE["max_rows"]))
+        elif self.shown_faults:
+            # Only the elapsed time of the primary fault moves between changes
+            primary = self.fault_queue.get(self.shown_faults[0].key)
+            if primary is not None:
+                self.set_text(self.time_label, f"Time: {primary.timestamp/1000:.1f}s ago")
+
+    def set_text(self, label, text):
+        """Set label text only when it differs, avoiding a relayout and repaint"""
+        if label.text() != text:
+            label.setText(text)
+
+    def render_faults(self, faults):
+        """Show the most severe faults, touching only labels whose text changed"""
+        previous = self.shown_faults
+        self.shown_faults = faults
+
+        if faults:
+            primary = faults[0]
+            if len(faults) > 1:
+                self.set_text(self.fault_status, f"⚠️ {len(self.fault_queue)} FAULTS ACTIVE")
+            else:
+                self.set_text(self.fault_status, "⚠️ FAULT ACTIVE")
+
             # Update fault details
-            source = fault_data.get("source", "UNKNOWN")
-            fault_type = fault_data.get("type", "UNKNOWN")
-            severity = fault_data.get("severity", 0)
-            
-            self.source_label.setText(f"Source: {source}")
-            self.type_label.setText(f"Type: {fault_type}")
-            self.severity_label.setText(f"Severity: {severity}")
-            
+            self.set_text(self.source_label, f"Source: {primary.source}")
+            self.set_text(self.type_label, f"Type: {primary.type}")
+            self.set_text(self.severity_label, f"Severity: {primary.severity}")
+
             # Format timestamp to show time since fault
-            timestamp = fault_data.get("timestamp", 0)
-            time_str = f"Time: {timestamp/1000:.1f}s ago"
-            self.time_label.setText(time_str)
-            
-            # Apply critical styling if severity is high
-            if severity > 1:
-                self.setStyleSheet(STYLES["fault_widget"] + f"""
-                    QWidget {{
-                        background-color: rgba(244, 67, 54, 0.1);
-                    }}
-                """)
-            else:
-                # Standard fault styling
-                self.setStyleSheet(STYLES["fault_widget"] + f"""
-                    QWidget {{
-                        background-color: rgba(255, 152, 0, 0.1);
-                    }}
-                """)
+            self.set_text(self.time_label, f"Time: {primary.timestamp/1000:.1f}s ago")
+
+            for label, fault in zip(self.other_labels, faults[1:] + [None] * len(self.other_labels)):
+                if fault is None:
+                    label.hide()
+                else:
+                    self.set_text(label, f"{fault.source} · {fault.type} (severity {fault.severity})")
+                    label.show()
         else:
-            # Reset to normal state
-            self.fault_status.setText("✓ System Normal")
-            self.fault_status.setStyleSheet(f"color: {COLORS['FAULT_CLEARED']}; font-weight: bold;")
-            
             # Clear fault details
-            self.source_label.setText("Source: --")
-            self.type_label.setText("Type: --")
-            self.severity_label.setText("Severity: --")
-            self.time_label.setText("Time: --")
-            
-            # Reset styling
-            self.setStyleSheet(STYLES["fault_widget"])
+            self.set_text(self.fault_status, "✓ System Normal")
+            self.set_text(self.source_label, "Source: --")
+            self.set_text(self.type_label, "Type: --")
+            self.set_text(self.severity_label, "Severity: --")
+            self.set_text(self.time_label, "Time: --")
+            for label in self.other_labels:
+                label.hide()
+
+        # Restyle only when the fault level changes
+        level = self.fault_level(faults)
+        if previous is None or level != self.fault_level(previous):
+            self.apply_level_style(level)
+
+    def fault_level(self, faults):
+        """Styling level of a fault list: None, fault or critical"""
+        if not faults:
+            return None
+        return "critical" if faults[0].severity > 1 else "fault"
+
+    def apply_level_style(self, level):
+        """Switch the theme's header and background styling to a fault level"""
+        set_style_property(self.fault_status, "active", level is not None)
+        set_style_property(self, "level", level or "")
             
     def showEvent(self, event):
         """Handle widget show event"""
@@ -0,0 +1,41 @@
+"""
+Debug overlay showing data-to-pixel latency percentiles per topic
+"""
+from PyQt6.QtWidgets import QLabel
+from PyQt6.QtCore import Qt, QObject, QEvent, QTimer
+from ..services.latency_tracer import tracer
+from ..utils.constants import LATENCY_TRACING
+
+
+class PaintProbe(QObject):
+    """Event filter completing traced payloads on the first paint inside a watched widget"""
+    def __init__(self, watched, parent=None):
+        super().__init__(parent)
+        self.watched = watched
+
+    def eventFilter(self, obj, event):
+        if (event.type() == QEvent.Type.Paint and tracer.pending
+                and (obj is self.watched or self.watched.isAncestorOf(obj))):
+            tracer.mark_paint()
+        return False
+
+
+class LatencyOverlay(QLabel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setObjectName("latency_overlay")
+        self.setText("latency: waiting for samples")
+        self.adjustSize()
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.start(LATENCY_TRACING["overlay_interval"])
+
+    def refresh(self):
+        """Redraw the percentile summary"""
+        summary = tracer.format_summary()
+        if summary:
+            self.setText(summary)
+            self.adjustSize()
+        self.raise_()
@@ -0,0 +1,248 @@
+"""
+Custom-painted panel of metric tiles, replacing one QWidget/QLabel tree per metric
+"""
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtGui import (
+    QPainter, QStaticText, QFont, QFontMetrics, QColor, QTransform, QPen, QPolygonF
+)
+from PyQt6.QtCore import Qt, QRect, QRectF, QPointF, QSize
+from ..utils.constants import THEMES, THEME, TREND_HISTORY
+from ..utils.theme import parse_color
+from ..utils.trend_buffer import TrendBuffer
+
+
+def paint_colors(palette):
+    """QColors painted by the metric tiles and the tire diagram for a THEMES palette"""
+    def color(name):
+        return QColor(*parse_color(palette[name]))
+
+    return {
+        # Tile colors per severity: (text, background)
+        "severity": {
+            None: (color("TEXT"), color("TILE")),
+            "NORMAL": (color("NORMAL"), color("TILE_NORMAL")),
+            "WARNING": (color("WARNING"), color("TILE_WARNING")),
+            "CRITICAL": (color("CRITICAL"), color("TILE_CRITICAL"))
+        },
+        "title": color("TEXT"),
+        # Sparkline colors for multi-series trends (e.g. the four tires)
+        "series": (color("PARK"), color("DRIVE"), color("REVERSE"), color("CHARGE")),
+        "body": color("DIAGRAM_BODY"),
+        "outline": color("DIAGRAM_OUTLINE")
+    }
+
+
+# Built once per theme; PAINT_COLORS holds the active theme's and is switched in place
+THEME_PAINT_COLORS = {name: paint_colors(palette) for name, palette in THEMES.items()}
+PAINT_COLORS = dict(THEME_PAINT_COLORS[THEME["default"]])
+
+
+def use_theme_colors(name):
+    """Switch the painted colors to a theme, taking effect on the next repaint"""
+    PAINT_COLORS.update(THEME_PAINT_COLORS[name])
+
+
+class MetricsPanel(QWidget):
+    # Geometry in pixels
+    TILE_MARGIN = 5
+    TILE_PADDING = 6
+    TILE_SPACING = 4
+    SECTION_SPACING = 10
+    TILE_RADIUS = 4
+
+    def __init__(self, sections, trends=None, parent=None):
+        """
+        Args:
+            sections (list): (title, [(key, name, unit), ...]) per section
+            trends (dict): Metric key -> number of sparkline series drawn under its tile
+            parent (QWidget): Parent widget
+        """
+        super().__init__(parent)
+        self.sections = sections
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, False)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+
+        self.title_font = QFont(self.font())
+        self.title_font.setPixelSize(14)
+        self.title_font.setBold(True)
+        self.value_font = QFont(self.font())
+        self.value_font.setPixelSize(13)
+        self.title_height = QFontMetrics(self.title_font).height() + 2 * self.TILE_MARGIN
+        self.tile_height = QFontMetrics(self.value_font).height() + 2 * self.TILE_PADDING
+
+        # Per-metric state
+        self.texts = {}
+        self.severities = {}
+        self.static_texts = {}
+        self.tile_rects = {}
+        self.trend_rects = {}
+        self.title_texts = []
+        self.trend_height = TREND_HISTORY["height"]
+        self.trends = {
+            key: [TrendBuffer(TREND_HISTORY["capacity"]) for _ in range(series)]
+            for key, series in (trends or {}).items()
+        }
+
+        for title, metrics in sections:
+            self.title_texts.append(self._prepare(title, self.title_font))
+            for key, name, unit in metrics:
+                self.set_metric(key, f"{name}: --{unit}")
+
+        self._layout_tiles()
+
+    def _prepare(self, text, font):
+        """Build a QStaticText with its glyph layout cached for font"""
+        static_text = QStaticText(text)
+        static_text.setTextFormat(Qt.TextFormat.PlainText)
+        static_text.prepare(QTransform(), font)
+        return static_text
+
+    def _layout_tiles(self):
+        """Compute title positions and tile rectangles for the current width"""
+        width = max(self.width(), 1)
+        y = 0
+        self.title_positions = []
+        for title, metrics in self.sections:
+            if self.title_positions:
+                y += self.SECTION_SPACING
+            self.title_positions.append(QPointF(self.TILE_MARGIN, y + self.TILE_MARGIN))
+            y += self.title_height
+            for key, _, _ in metrics:
+                height = self.tile_height
+                if key in self.trends:
+                    height += self.trend_height
+                rect = QRect(self.TILE_MARGIN, y, width - 2 * self.TILE_MARGIN, height)
+                self.tile_rects[key] = rect
+                if key in self.trends:
+                    trend_rect = QRect(
+                        rect.left() + self.TILE_PADDING,
+                        rect.top() + self.tile_height - self.TILE_PADDING // 2,
+                        rect.width() - 2 * self.TILE_PADDING,
+                        self.trend_height - self.TILE_PADDING // 2
+                    )
+                    self.trend_rects[key] = trend_rect
+                    # Decimate each series to one bucket per pixel column
+                    for buffer in self.trends[key]:
+                        if buffer.column_count != max(trend_rect.width(), 1):
+                            buffer.set_columns(trend_rect.width())
+                y += height + self.TILE_SPACING
+        self.content_height = y
+
+    def set_metric(self, key, text, severity=None):
+        """
+        Update a metric tile, repainting only that tile
+        Args:
+            key (str): Metric key
+            text (str): Text shown in the tile
+            severity (str): None, "NORMAL", "WARNING" or "CRITICAL"
+        """
+        text_changed = self.texts.get(key) != text
+        if not text_changed and self.severities.get(key) == severity:
+            return
+        if text_changed:
+            self.texts[key] = text
+            self.static_texts[key] = self._prepare(text, self.value_font)
+        self.severities[key] = severity
+
+        rect = self.tile_rects.get(key)
+        if rect is not None:
+            self.update(rect)
+
+    def append_trend(self, key, values):
+        """
+        Append one sample per series to a metric's sparkline, repainting only the sparkline
+        Args:
+            key (str): Metric key with a trend
+            values (list): One value per series
+        """
+        for buffer, value in zip(self.trends[key], values):
+            buffer.append(value)
+        rect = self.trend_rects.get(key)
+        if rect is not None:
+            self.update(rect)
+
+    def text(self, key):
+        """Return the text currently shown for a metric"""
+        return self.texts.get(key)
+
+    def resizeEvent(self, event):
+        """Re-layout tiles for the new width"""
+        super().resizeEvent(event)
+        self._layout_tiles()
+
+    def paintEvent(self, event):
+        """Draw section titles and the tiles intersecting the dirty region"""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        dirty = event.rect()
+
+        painter.setFont(self.title_font)
+        painter.setPen(PAINT_COLORS["title"])
+        for position, static_text in zip(self.title_positions, self.title_texts):
+            if position.y() <= dirty.bottom() and position.y() + self.title_height >= dirty.top():
+                painter.drawStaticText(position, static_text)
+
+        painter.setFont(self.value_font)
+        painter.setPen(Qt.PenStyle.NoPen)
+        severity_colors = PAINT_COLORS["severity"]
+        for key, rect in self.tile_rects.items():
+            if not rect.intersects(dirty):
+                continue
+            text_color, background = severity_colors[self.severities.get(key)]
+            painter.setBrush(background)
+            painter.drawRoundedRect(QRectF(rect), self.TILE_RADIUS, self.TILE_RADIUS)
+            painter.setPen(text_color)
+            painter.drawStaticText(
+                QPointF(rect.left() + self.TILE_PADDING, rect.top() + self.TILE_PADDING),
+                self.static_texts[key]
+            )
+            painter.setPen(Qt.PenStyle.NoPen)
+
+        for key, rect in self.trend_rects.items():
+            if rect.intersects(dirty):
+                self._paint_trend(painter, key, rect)
+        painter.end()
+
+    def _paint_trend(self, painter, key, rect):
+        """
+        Draw a metric's series as min/max envelopes, one bucket per pixel column; painted in
+        the panel's own paint pass since a QChartView per tile would add a widget and a
+        scene relayout to every tile on every sample
+        """
+        series = [buffer.columns() for buffer in self.trends[key]]
+        lows = [low for columns in series for low, _ in columns]
+        if not lows:
+            return
+        low = min(lows)
+        high = max(high for columns in series for _, high in columns)
+        span = (high - low) or 1.0
+        scale = (rect.height() - 1) / span
+        bottom = rect.bottom()
+
+        for index, columns in enumerate(series):
+            if len(series) == 1:
+                color = QColor(PAINT_COLORS["severity"][self.severities.get(key)][0])
+            else:
+                series_colors = PAINT_COLORS["series"]
+                color = QColor(series_colors[index % len(series_colors)])
+            color.setAlpha(200)
+            painter.setPen(QPen(color, 1))
+
+            # Right-align the newest sample with the right edge
+            x = rect.right() - len(columns) + 1
+            points = QPolygonF()
+            for column_low, column_high in columns:
+                points.append(QPointF(x, bottom - (column_low - low) * scale))
+                if column_high != column_low:
+                    points.append(QPointF(x, bottom - (column_high - low) * scale))
+                x += 1
+            painter.drawPolyline(points)
+        painter.setPen(Qt.PenStyle.NoPen)
+
+    def sizeHint(self):
+        """Preferred size fits every tile"""
+        return QSize(240, self.content_height)
+
+    def minimumSizeHint(self):
+        """Minimum size fits every tile"""
+        return QSize(160, self.content_height)
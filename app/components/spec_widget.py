@@ -0,0 +1,95 @@
+"""
+Card of metric tiles rendered from a WIDGET_SPECS entry, for dashboards defined without code
+"""
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
+from PyQt6.QtCore import Qt
+from .metrics_panel import MetricsPanel
+from ..utils.widget_spec import widget_plan
+
+
+class SpecWidget(QWidget):
+    def __init__(self, widget_type, parent=None):
+        """
+        Args:
+            widget_type (str): WIDGET_SPECS key
+            parent (QWidget): Parent widget
+        """
+        super().__init__(parent)
+        self.widget_type = widget_type
+        self.drag_start_position = None
+        # Field bindings and text templates, compiled once per widget type; MainDash feeds
+        # the widget payloads of plan.topic
+        self.plan = widget_plan(widget_type)
+        # Quantized value last shown per metric; equal keys render equal text
+        self.shown_keys = {}
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Initialize the card: header and metrics panel"""
+        self.setObjectName("spec_widget")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
+        layout = QVBoxLayout(self)
+        layout.setSpacing(10)
+
+        header = QLabel(self.plan.title or self.widget_type)
+        header.setObjectName("card_header")
+        header.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(header)
+
+        self.metrics_panel = MetricsPanel(self.plan.panel_sections(), self.plan.trends)
+        layout.addWidget(self.metrics_panel)
+
+        self.setMinimumSize(300, 200)
+
+    def update_data(self, data):
+        """Update the tiles from a payload of the spec's topic"""
+        if data:
+            self.update_metrics(data)
+
+    def update_metrics(self, data, vector_severities=None):
+        """
+        Update the metric tiles, formatting only values that moved by a display step
+        Args:
+            data (Payload): Payload of the spec's topic
+            vector_severities (dict): Vector metric key -> severity name replacing the
+                thresholds, e.g. the per-corner tire severity
+        """
+        panel = self.metrics_panel
+        shown_keys = self.shown_keys
+        for binding in self.plan.scalars:
+            value = binding.get(data)
+            if value is None:
+                continue
+            if binding.trend:
+                panel.append_trend(binding.key, (value,))
+            formatter = binding.formatter
+            key = formatter.quantize(value)
+            if shown_keys.get(binding.key) == key:
+                continue
+            shown_keys[binding.key] = key
+            severity = (
+                binding.severity(formatter.value(key)) if binding.severity is not None else None
+            )
+            panel.set_metric(binding.key, formatter.text(key), severity)
+
+        for binding in self.plan.vectors:
+            values = binding.get(data)
+            if not values:
+                continue
+            if binding.trend:
+                panel.append_trend(binding.key, values)
+            severity = vector_severities.get(binding.key) if vector_severities else None
+            if severity is None and binding.severity is not None:
+                severity = binding.severity(binding.worst(values))
+            key = binding.formatter.quantize(values)
+            if shown_keys.get(binding.key) != key:
+                shown_keys[binding.key] = key
+                text = binding.formatter.text(key)
+            else:
+                # Same text; set_metric still repaints if only the severity changed
+                text = panel.text(binding.key)
+            panel.set_metric(binding.key, text, severity)
+
+    def text(self):
+        """Return widget type for drag and drop compatibility"""
+        return self.widget_type
@@ -3,16 +3,19 @@ Widget for displaying vehicle state information including primary state, substat
 """
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QGridLayout
 from PyQt6.QtCore import Qt
-from ..utils.constants import COLORS, STYLES
+from ..utils.theme import set_style_property
 
 class StateWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Last shown state and flags; repeated updates leave the labels untouched
+        self.shown_state = None
+        self.shown_flags = None
         self.setup_ui()
         
     def setup_ui(self):
         """Initialize the state widget UI"""
-        self.setStyleSheet(STYLES["state_widget"])
+        self.setObjectName("state_widget")
         layout = QVBoxLayout(self)
         layout.setSpacing(10)
         
@@ -20,28 +23,12 @@ class StateWidget(QWidget):
         self.state_label = QLabel("PARK")
         self.state_label.setObjectName("state_label")
         self.state_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.state_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: 24px;
-                font-weight: bold;
-                color: {COLORS['PARK']};
-                padding: 5px;
-                border-radius: 5px;
-                background-color: rgba(0, 0, 0, 0.05);
-            }}
-        """)
+        self.state_label.setProperty("state", "PARK")
         
         # Substate label (READY, ACTIVE, etc.)
         self.substate_label = QLabel("READY")
         self.substate_label.setObjectName("substate_label")
         self.substate_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.substate_label.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                color: #666;
-                padding: 3px;
-            }
-        """)
         
         # Status flags grid
         self.flags_widget = QWidget()
@@ -58,31 +45,37 @@ class StateWidget(QWidget):
         self.setMinimumSize(200, 150)
         
     def update_state(self, state_data):
-        """Update the state display with new data"""
+        """Update the state display from a VehicleState payload"""
         if not state_data:
             return
             
         # Update primary state with color coding
-        primary_state = state_data.get("primary_state", "UNKNOWN")
-        self.state_label.setText(primary_state)
-        self.state_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: 24px;
-                font-weight: bold;
-                color: {COLORS.get(primary_state, COLORS['TEXT'])};
-                padding: 5px;
-                border-radius: 5px;
-                background-color: rgba(0, 0, 0, 0.05);
-            }}
-        """)
-        
+        primary_state = state_data.primary_state
+        if primary_state != self.shown_state:
+            self.shown_state = primary_state
+            self.apply_state_style(primary_state)
+
         # Update substate
-        substate = state_data.get("sub_state", "UNKNOWN")
-        self.substate_label.setText(substate)
-        
-        # Update status flags
-        flags = state_data.get("status_flags", [])
-        
+        self.set_text(self.substate_label, state_data.sub_state)
+
+        # Update status flags, rebuilding the grid only when the set of flags changed
+        flags = tuple(state_data.status_flags)
+        if flags != self.shown_flags:
+            self.shown_flags = flags
+            self.show_flags(flags)
+
+    def set_text(self, label, text):
+        """Set label text only when it differs, avoiding a relayout and repaint"""
+        if label.text() != text:
+            label.setText(text)
+
+    def apply_state_style(self, primary_state):
+        """Show the primary state; the theme colors it by the state property"""
+        self.state_label.setText(primary_state)
+        set_style_property(self.state_label, "state", primary_state)
+
+    def show_flags(self, flags):
+        """Rebuild the status flag grid"""
         # Clear existing flags
         for label in self.status_labels.values():
             label.setParent(None)
@@ -91,47 +84,9 @@ class StateWidget(QWidget):
         # Add new flags in a grid layout
         for i, flag in enumerate(flags):
             label = QLabel(flag.replace("_", " "))
-            label.setStyleSheet("""
-                QLabel {
-                    background-color: rgba(0, 0, 0, 0.1);
-                    color: #333;
-                    border-radius: 4px;
-                    padding: 4px 8px;
-                    font-size: 11px;
-                }
-            """)
-            
-            # Special styling for certain flags
-            if flag == "MOTOR_READY":
-                label.setStyleSheet("""
-                    QLabel {
-                        background-color: rgba(76, 175, 80, 0.2);
-                        color: #2E7D32;
-                        border-radius: 4px;
-                        padding: 4px 8px;
-                        font-size: 11px;
-                    }
-                """)
-            elif flag == "BATTERY_OK":
-                label.setStyleSheet("""
-                    QLabel {
-                        background-color: rgba(33, 150, 243, 0.2);
-                        color: #1565C0;
-                        border-radius: 4px;
-                        padding: 4px 8px;
-                        font-size: 11px;
-                    }
-                """)
-            elif flag == "CHARGING_CONNECTED":
-                label.setStyleSheet("""
-                    QLabel {
-                        background-color: rgba(156, 39, 176, 0.2);
-                        color: #7B1FA2;
-                        border-radius: 4px;
-                        padding: 4px 8px;
-                        font-size: 11px;
-                    }
-                """)
+            # Styled by the theme, with its own colors for some flags
+            label.setObjectName("status_flag")
+            label.setProperty("flag", flag)
             
             # Add to grid layout (2 columns)
             row = i // 2
@@ -0,0 +1,122 @@
+"""
+Four-corner car diagram showing per-tire temperature and pressure
+"""
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtGui import QPainter, QStaticText, QFont, QFontMetrics, QTransform, QPen
+from PyQt6.QtCore import Qt, QRect, QRectF, QPointF, QSize
+import numpy as np
+from ..services.tire_state import SEVERITY_NAMES, TEMP, PRESSURE
+from ..utils.constants import METRIC_UNITS
+from .metrics_panel import PAINT_COLORS
+
+TREND_ARROWS = {-1: " ▼", 0: "", 1: " ▲"}
+
+
+class TireDiagram(QWidget):
+    # Geometry in pixels
+    CORNER_WIDTH = 86
+    CORNER_SPACING = 8
+    BODY_WIDTH = 60
+    RADIUS = 6
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        self.value_font = QFont(self.font())
+        self.value_font.setPixelSize(13)
+        self.value_font.setBold(True)
+        self.line_height = QFontMetrics(self.value_font).height()
+        self.corner_height = 2 * self.line_height + 2 * self.RADIUS
+
+        # Per-corner state: two prepared lines and a severity name
+        self.lines = [(None, None)] * 4
+        self.severities = [None] * 4
+        self.corner_rects = [QRect()] * 4
+        self._layout_corners()
+
+    def _layout_corners(self):
+        """Place FL, FR, RL, RR around the car body"""
+        width, height = self.width(), self.height()
+        left = max((width - self.BODY_WIDTH) // 2 - self.CORNER_WIDTH - self.CORNER_SPACING, 0)
+        right = min((width + self.BODY_WIDTH) // 2 + self.CORNER_SPACING,
+                    width - self.CORNER_WIDTH)
+        top = self.CORNER_SPACING
+        bottom = max(height - self.corner_height - self.CORNER_SPACING, top)
+        self.corner_rects = [
+            QRect(x, y, self.CORNER_WIDTH, self.corner_height)
+            for y in (top, bottom) for x in (left, right)
+        ]
+        self.body_rect = QRectF(
+            (width - self.BODY_WIDTH) / 2, top, self.BODY_WIDTH, bottom + self.corner_height - top
+        )
+
+    def _prepare(self, text):
+        """Build a QStaticText with its glyph layout cached for the value font"""
+        static_text = QStaticText(text)
+        static_text.setTextFormat(Qt.TextFormat.PlainText)
+        static_text.prepare(QTransform(), self.value_font)
+        return static_text
+
+    def set_tire_state(self, state, changed):
+        """
+        Refresh the corners of a TireState that changed, repainting only those corners
+        Args:
+            state (TireState): Current tire state
+            changed (numpy.ndarray): Boolean mask of changed corners
+        """
+        corner_severity = state.corner_severity
+        for corner in np.flatnonzero(changed):
+            temp = state.values[TEMP, corner]
+            pressure = state.values[PRESSURE, corner]
+            temp_text = "--" if np.isnan(temp) else f"{temp:g}"
+            pressure_text = "--" if np.isnan(pressure) else f"{pressure:g}"
+            self.lines[corner] = (
+                self._prepare(f"{temp_text}{METRIC_UNITS['tire_temp']}"
+                              f"{TREND_ARROWS[state.trend[TEMP, corner]]}"),
+                self._prepare(f"{pressure_text} {METRIC_UNITS['tire_pressure']}"
+                              f"{TREND_ARROWS[state.trend[PRESSURE, corner]]}")
+            )
+            self.severities[corner] = SEVERITY_NAMES[corner_severity[corner]]
+            self.update(self.corner_rects[corner])
+
+    def resizeEvent(self, event):
+        """Re-layout corners for the new size"""
+        super().resizeEvent(event)
+        self._layout_corners()
+
+    def paintEvent(self, event):
+        """Draw the car body and the corners intersecting the dirty region"""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        dirty = event.rect()
+
+        if self.body_rect.intersects(QRectF(dirty)):
+            painter.setPen(QPen(PAINT_COLORS["outline"], 1))
+            painter.setBrush(PAINT_COLORS["body"])
+            painter.drawRoundedRect(self.body_rect, self.RADIUS * 2, self.RADIUS * 2)
+
+        painter.setFont(self.value_font)
+        for rect, (temp_line, pressure_line), severity in zip(
+                self.corner_rects, self.lines, self.severities):
+            if not rect.intersects(dirty):
+                continue
+            text_color, background = PAINT_COLORS["severity"][severity]
+            painter.setPen(QPen(text_color, 1))
+            painter.setBrush(background)
+            painter.drawRoundedRect(QRectF(rect), self.RADIUS, self.RADIUS)
+            if temp_line is None:
+                continue
+            x = rect.left() + self.RADIUS
+            y = rect.top() + self.RADIUS
+            painter.drawStaticText(QPointF(x, y), temp_line)
+            painter.drawStaticText(QPointF(x, y + self.line_height), pressure_line)
+        painter.end()
+
+    def sizeHint(self):
+        """Preferred size fits the four corners around the body"""
+        return QSize(2 * self.CORNER_WIDTH + self.BODY_WIDTH + 4 * self.CORNER_SPACING,
+                     2 * self.corner_height + 6 * self.CORNER_SPACING)
+
+    def minimumSizeHint(self):
+        """Minimum size is the preferred size"""
+        return self.sizeHint()
@@ -0,0 +1,183 @@
+"""
+Backend polling in a separate process, delivered to the UI through a shared-memory snapshot
+"""
+import logging
+import multiprocessing
+from functools import partial
+from PyQt6.QtCore import QObject, QCoreApplication, pyqtSignal, QTimer
+from ..utils.constants import ACQUISITION, SESSION_RECORDING
+from .data_service import DataService
+from .latency_tracer import tracer
+from .shared_snapshot import SnapshotReader, SnapshotWriter
+
+
+def run_acquisition(name, slot_size, record_path, bus_path, session_dir, session_format,
+                    stop_event):
+    """
+    Acquisition process entry point: poll with a DataService and publish every payload
+    Args:
+        name (str): Shared memory block to write the snapshot to
+        slot_size (int): Slot size the block was created with
+        record_path (str): Telemetry recording to append to, or None
+        bus_path (str): Telemetry bus socket to republish payloads on, or None
+        session_dir (str): Directory to export a drive session to, or None
+        session_format (str): Session file format, "csv", "parquet" or "auto"
+        stop_event (multiprocessing.Event): Set by the UI process to stop acquisition
+    """
+    app = QCoreApplication([])
+    writer = SnapshotWriter(name, slot_size)
+    data_service = DataService()
+    if record_path:
+        data_service.start_recording(record_path)
+    if bus_path:
+        try:
+            data_service.start_bus(bus_path)
+        except OSError as e:
+            # Restarting the process would not help; poll without the bus
+            logging.getLogger(__name__).error(f"Cannot start the telemetry bus: {e}")
+    if session_dir:
+        data_service.start_session(session_dir, session_format)
+    data_service.data_updated.connect(partial(writer.write, "vehicle_data"))
+    data_service.state_updated.connect(partial(writer.write, "vehicle_state"))
+    data_service.fault_updated.connect(partial(writer.write, "fault_status"))
+    data_service.connection_status_changed.connect(writer.set_connected)
+
+    stop_timer = QTimer()
+    stop_timer.timeout.connect(lambda: stop_event.is_set() and app.quit())
+    stop_timer.start(ACQUISITION["stop_check"])
+    app.exec()
+
+    data_service.stop_monitoring()
+    data_service.stop_recording()
+    data_service.stop_bus()
+    data_service.stop_session()
+    writer.close()
+
+
+class ProcessDataService(QObject):
+    # Same signals as DataService so consumers can use either source
+    data_updated = pyqtSignal(object)
+    state_updated = pyqtSignal(object)
+    fault_updated = pyqtSignal(object)
+    connection_status_changed = pyqtSignal(bool)
+
+    def __init__(self, record_path=None, bus_path=None, session_dir=None,
+                 session_format=SESSION_RECORDING["format"],
+                 poll_interval=ACQUISITION["poll_interval"], slot_size=ACQUISITION["slot_size"]):
+        """
+        Args:
+            record_path (str): Telemetry recording the acquisition process appends to
+            bus_path (str): Telemetry bus socket the acquisition process republishes on
+            session_dir (str): Directory the acquisition process exports drive sessions to
+            session_format (str): Session file format, "csv", "parquet" or "auto"
+            poll_interval (int): Snapshot read interval in ms, about one frame
+            slot_size (int): Largest encoded payload a snapshot slot holds
+        """
+        super().__init__()
+        self.logger = logging.getLogger(__name__)
+        self.record_path = record_path
+        self.bus_path = bus_path
+        self.session_dir = session_dir
+        self.session_format = session_format
+        self.slot_size = slot_size
+        self.connected = False
+        self.monitoring = False
+        self.restarts = 0
+        self.reader = None
+        self.process = None
+        self.stop_event = None
+        # Qt and fork do not mix; the child starts from a fresh interpreter
+        self.context = multiprocessing.get_context("spawn")
+
+        self.signals = (
+            ("vehicle_data", self.data_updated),
+            ("vehicle_state", self.state_updated),
+            ("fault_status", self.fault_updated)
+        )
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.read_snapshot)
+        self.timer.setInterval(poll_interval)
+
+    def start_monitoring(self):
+        """Start the acquisition process and read its snapshot every frame"""
+        self.monitoring = True
+        if self.process is None:
+            self.start_process()
+        self.timer.start()
+
+    def stop_monitoring(self):
+        """Stop reading and shut the acquisition process down"""
+        self.monitoring = False
+        self.timer.stop()
+        self.stop_process()
+
+    def start_process(self):
+        """Create the snapshot block and launch the acquisition process"""
+        self.reader = SnapshotReader(self.slot_size, retries=ACQUISITION["read_retries"])
+        self.stop_event = self.context.Event()
+        self.process = self.context.Process(
+            target=run_acquisition,
+            args=(self.reader.name, self.slot_size, self.record_path, self.bus_path,
+                  self.session_dir, self.session_format, self.stop_event),
+            name="acquisition",
+            daemon=True
+        )
+        self.process.start()
+        self.logger.info(f"Acquisition process {self.process.pid} started")
+
+    def stop_process(self):
+        """Ask the acquisition process to exit, then remove the snapshot block"""
+        if self.process is None:
+            return
+        self.stop_event.set()
+        self.process.join(ACQUISITION["stop_timeout"] / 1000)
+        if self.process.is_alive():
+            self.logger.warning("Acquisition process did not stop, terminating it")
+            self.process.terminate()
+            self.process.join()
+        self.process = None
+        self.reader.close()
+        self.reader = None
+
+    def read_snapshot(self):
+        """Emit each topic whose snapshot changed since the last frame"""
+        reader = self.reader
+        for topic, signal in self.signals:
+            payload = reader.read(topic)
+            if payload is not None:
+                if tracer.enabled:
+                    tracer.mark(topic, "receive")
+                signal.emit(payload)
+
+        connected = reader.connected
+        if connected != self.connected:
+            self.connected = connected
+            self.connection_status_changed.emit(connected)
+
+        if self.process.exitcode is not None:
+            self.restarts += 1
+            self.logger.error(
+                f"Acquisition process exited with code {self.process.exitcode}, "
+                f"restarting in {ACQUISITION['restart_delay']}ms"
+            )
+            self.timer.stop()
+            self.stop_process()
+            if self.connected:
+                self.connected = False
+                self.connection_status_changed.emit(False)
+            QTimer.singleShot(ACQUISITION["restart_delay"], self.restart)
+
+    def restart(self):
+        """Relaunch acquisition after the process exited, unless monitoring was stopped"""
+        if self.monitoring and self.process is None:
+            self.start_monitoring()
+
+    def stats(self):
+        """Return snapshot read counters"""
+        reader = self.reader
+        return {
+            "restarts": self.restarts,
+            "torn_reads": reader.torn if reader is not None else 0,
+            "invalid": reader.invalid if reader is not None else 0
+        }
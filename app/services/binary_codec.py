@@ -0,0 +1,309 @@
+"""
+Fixed-layout binary telemetry format, an optional compact alternative to JSON
+
+Every message starts with a 4 byte header (version, topic id, presence mask) followed by
+little-endian fields. Numeric metrics are sent as signed 32-bit integers in hundredths,
+enumerated strings as single-byte indexes into the constants tables and status flags as
+a bitmask. Values outside the tables decode as "UNKNOWN".
+"""
+import struct
+
+from ..utils.constants import (
+    VEHICLE_STATES, VEHICLE_SUBSTATES, STATUS_FLAGS, FAULT_SOURCES, FAULT_TYPES
+)
+from .decoding import PayloadDecodeError
+from .payloads import VehicleState, FaultStatus, FaultEntry, VehicleMetrics
+
+FORMAT_VERSION = 1
+
+# Topic ids
+TOPIC_STATE = 1
+TOPIC_FAULT = 2
+TOPIC_METRICS = 3
+
+# Numeric values are sent in hundredths
+SCALE = 100
+UNKNOWN_INDEX = 0xFF
+
+# Raised by encode_payload for payloads the fixed layout cannot carry, e.g. a tire list that
+# is not 4 values long or a value beyond the 32-bit range
+ENCODE_ERRORS = (ValueError, TypeError, struct.error)
+
+HEADER = struct.Struct("<BBH")                  # version, topic, presence mask
+STATE_BODY = struct.Struct("<HBBB")             # counter, state, substate, flags
+FAULT_BODY = struct.Struct("<BBBBI")            # active, source, type, severity, timestamp
+FAULT_COUNT = struct.Struct("<B")               # number of concurrent faults
+FAULT_ENTRY = struct.Struct("<BBBI")            # source, type, severity, timestamp
+SCALAR = struct.Struct("<i")
+TIRES = struct.Struct("<4i")
+
+# Enumeration tables, in constants order
+PRIMARY_STATES = tuple(VEHICLE_STATES)
+SUB_STATES = tuple(VEHICLE_SUBSTATES)
+FLAG_NAMES = tuple(STATUS_FLAGS)
+SOURCES = tuple(FAULT_SOURCES)
+TYPES = tuple(FAULT_TYPES)
+
+# Metrics fields in presence mask bit order
+SCALAR_FIELDS = (
+    "charge_percent", "charging_rate", "power_output",
+    "motor_temp", "battery_temp", "inverter_temp", "brake_temp"
+)
+TIRE_FIELDS = ("tire_temp", "tire_pressure")
+STATE_BIT = 1 << (len(SCALAR_FIELDS) + len(TIRE_FIELDS))
+FAULT_BIT = STATE_BIT << 1
+FAULT_LIST_BIT = FAULT_BIT << 1
+
+# Fault message mask bit: the concurrent fault list follows the fault body
+FAULT_LIST_FLAG = 1
+
+# Decoded status flags for every bitmask value
+FLAG_TABLE = tuple(
+    tuple(name for bit, name in enumerate(FLAG_NAMES) if mask & (1 << bit))
+    for mask in range(256)
+)
+
+# Numeric layouts by presence mask, built on first use
+_metrics_layouts = {}
+
+
+def _index(table, value):
+    """Return the table index of an enumerated string"""
+    try:
+        return table.index(value)
+    except ValueError:
+        return UNKNOWN_INDEX
+
+
+def _name(table, index):
+    """Return the enumerated string for a table index"""
+    if index < len(table):
+        return table[index]
+    return "UNKNOWN"
+
+
+def _scale(value):
+    """Convert a metric value to hundredths"""
+    return int(round(value * SCALE))
+
+
+def _unscale(raw):
+    """Convert hundredths back to a metric value, keeping integral values as int"""
+    if raw % SCALE == 0:
+        return raw // SCALE
+    return raw / SCALE
+
+
+def _encode_state_body(state):
+    """Pack a VehicleState body"""
+    flags = 0
+    for flag in state.status_flags:
+        if flag in FLAG_NAMES:
+            flags |= 1 << FLAG_NAMES.index(flag)
+    return STATE_BODY.pack(
+        state.message_counter & 0xFFFF,
+        _index(PRIMARY_STATES, state.primary_state),
+        _index(SUB_STATES, state.sub_state),
+        flags
+    )
+
+
+def _decode_state_body(raw, offset):
+    """Unpack a VehicleState body, returning it and the next offset"""
+    counter, primary, sub, flags = STATE_BODY.unpack_from(raw, offset)
+    state = VehicleState.__new__(VehicleState)
+    state.message_counter = counter
+    state.primary_state = _name(PRIMARY_STATES, primary)
+    state.sub_state = _name(SUB_STATES, sub)
+    state.status_flags = FLAG_TABLE[flags]
+    return state, offset + STATE_BODY.size
+
+
+def _encode_fault_body(fault):
+    """Pack a FaultStatus body"""
+    return FAULT_BODY.pack(
+        1 if fault.active else 0,
+        _index(SOURCES, fault.source),
+        _index(TYPES, fault.type),
+        int(fault.severity) & 0xFF,
+        int(fault.timestamp) & 0xFFFFFFFF
+    )
+
+
+def _decode_fault_body(raw, offset):
+    """Unpack a FaultStatus body, returning it and the next offset"""
+    active, source, fault_type, severity, timestamp = FAULT_BODY.unpack_from(raw, offset)
+    fault = FaultStatus.__new__(FaultStatus)
+    fault.active = bool(active)
+    fault.source = _name(SOURCES, source)
+    fault.type = _name(TYPES, fault_type)
+    fault.severity = severity
+    fault.timestamp = timestamp
+    fault.faults = None
+    return fault, offset + FAULT_BODY.size
+
+
+def _encode_fault_list(fault):
+    """Pack the concurrent fault list of a FaultStatus"""
+    entries = fault.faults[:0xFF]
+    return FAULT_COUNT.pack(len(entries)) + b"".join(
+        FAULT_ENTRY.pack(
+            _index(SOURCES, entry.source),
+            _index(TYPES, entry.type),
+            int(entry.severity) & 0xFF,
+            int(entry.timestamp) & 0xFFFFFFFF
+        )
+        for entry in entries
+    )
+
+
+def _decode_fault_list(raw, offset):
+    """Unpack a concurrent fault list, returning it and the next offset"""
+    count, = FAULT_COUNT.unpack_from(raw, offset)
+    offset += FAULT_COUNT.size
+    entries = []
+    for _ in range(count):
+        source, fault_type, severity, timestamp = FAULT_ENTRY.unpack_from(raw, offset)
+        entry = FaultEntry.__new__(FaultEntry)
+        entry.source = _name(SOURCES, source)
+        entry.type = _name(TYPES, fault_type)
+        entry.severity = severity
+        entry.timestamp = timestamp
+        entries.append(entry)
+        offset += FAULT_ENTRY.size
+    return entries, offset
+
+
+def _encode_metrics_body(metrics):
+    """Pack the present VehicleMetrics fields, returning the presence mask and body"""
+    mask = 0
+    parts = []
+    for bit, name in enumerate(SCALAR_FIELDS):
+        value = getattr(metrics, name)
+        if value is not None:
+            mask |= 1 << bit
+            parts.append(SCALAR.pack(_scale(value)))
+    for bit, name in enumerate(TIRE_FIELDS, start=len(SCALAR_FIELDS)):
+        values = getattr(metrics, name)
+        if values is not None:
+            if len(values) != 4:
+                raise ValueError(f"{name} must have 4 values, got {len(values)}")
+            mask |= 1 << bit
+            parts.append(TIRES.pack(*(_scale(v) for v in values)))
+    if metrics.vehicle_state is not None:
+        mask |= STATE_BIT
+        parts.append(_encode_state_body(metrics.vehicle_state))
+    if metrics.fault_status is not None:
+        mask |= FAULT_BIT
+        parts.append(_encode_fault_body(metrics.fault_status))
+        if metrics.fault_status.faults is not None:
+            mask |= FAULT_LIST_BIT
+            parts.append(_encode_fault_list(metrics.fault_status))
+    return mask, b"".join(parts)
+
+
+def _metrics_layout(mask):
+    """Return the numeric Struct and (field, count) plan for a presence mask"""
+    layout = _metrics_layouts.get(mask)
+    if layout is None:
+        plan = []
+        for bit, name in enumerate(SCALAR_FIELDS + TIRE_FIELDS):
+            if mask & (1 << bit):
+                plan.append((name, 1 if name in SCALAR_FIELDS else 4))
+        numeric = struct.Struct("<" + "i" * sum(count for _, count in plan))
+        absent = tuple(
+            name for name in SCALAR_FIELDS + TIRE_FIELDS
+            if name not in dict(plan)
+        )
+        layout = _metrics_layouts[mask] = (numeric, tuple(plan), absent)
+    return layout
+
+
+def _decode_metrics_body(raw, offset, mask):
+    """Unpack the VehicleMetrics fields flagged in mask, returning it and the next offset"""
+    numeric, plan, absent = _metrics_layout(mask)
+    values = [_unscale(v) for v in numeric.unpack_from(raw, offset)]
+    offset += numeric.size
+
+    metrics = VehicleMetrics.__new__(VehicleMetrics)
+    index = 0
+    for name, count in plan:
+        if count == 1:
+            setattr(metrics, name, values[index])
+        else:
+            setattr(metrics, name, values[index:index + count])
+        index += count
+    for name in absent:
+        setattr(metrics, name, None)
+
+    metrics.vehicle_state = None
+    metrics.fault_status = None
+    if mask & STATE_BIT:
+        metrics.vehicle_state, offset = _decode_state_body(raw, offset)
+    if mask & FAULT_BIT:
+        metrics.fault_status, offset = _decode_fault_body(raw, offset)
+        if mask & FAULT_LIST_BIT:
+            metrics.fault_status.faults, offset = _decode_fault_list(raw, offset)
+    return metrics, offset
+
+
+def encode_payload(payload):
+    """
+    Encode a payload in the binary telemetry format (reference encoder for test servers)
+    Args:
+        payload (Payload): VehicleState, FaultStatus or VehicleMetrics instance
+    Returns:
+        bytes: Encoded message
+    Raises:
+        ValueError, TypeError, struct.error: See ENCODE_ERRORS
+    """
+    if isinstance(payload, VehicleState):
+        return HEADER.pack(FORMAT_VERSION, TOPIC_STATE, 0) + _encode_state_body(payload)
+    if isinstance(payload, FaultStatus):
+        if payload.faults is None:
+            return HEADER.pack(FORMAT_VERSION, TOPIC_FAULT, 0) + _encode_fault_body(payload)
+        return (HEADER.pack(FORMAT_VERSION, TOPIC_FAULT, FAULT_LIST_FLAG)
+                + _encode_fault_body(payload) + _encode_fault_list(payload))
+    if isinstance(payload, VehicleMetrics):
+        mask, body = _encode_metrics_body(payload)
+        return HEADER.pack(FORMAT_VERSION, TOPIC_METRICS, mask) + body
+    raise TypeError(f"Cannot encode {type(payload).__name__}")
+
+
+PAYLOAD_TOPICS = {
+    VehicleState: TOPIC_STATE,
+    FaultStatus: TOPIC_FAULT,
+    VehicleMetrics: TOPIC_METRICS
+}
+
+
+def decode_binary(raw, payload_type):
+    """
+    Decode a binary telemetry message into a typed payload
+    Args:
+        raw (bytes): Message body
+        payload_type (type): Payload class expected for the endpoint
+    Returns:
+        Payload: Decoded payload
+    Raises:
+        PayloadDecodeError: If the message is truncated or does not match payload_type
+    """
+    try:
+        version, topic, mask = HEADER.unpack_from(raw, 0)
+        if version != FORMAT_VERSION:
+            raise PayloadDecodeError(f"Unsupported binary format version {version}")
+        if PAYLOAD_TOPICS.get(payload_type) != topic:
+            raise PayloadDecodeError(
+                f"Binary topic {topic} does not match {payload_type.__name__}"
+            )
+        if topic == TOPIC_STATE:
+            payload, _ = _decode_state_body(raw, HEADER.size)
+        elif topic == TOPIC_FAULT:
+            payload, offset = _decode_fault_body(raw, HEADER.size)
+            if mask & FAULT_LIST_FLAG:
+                payload.faults, _ = _decode_fault_list(raw, offset)
+        else:
+            payload, _ = _decode_metrics_body(raw, HEADER.size, mask)
+        return payload
+    except struct.error as e:
+        raise PayloadDecodeError(f"Truncated binary payload: {e}") from e
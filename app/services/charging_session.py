@@ -0,0 +1,152 @@
+"""
+Charging session tracking with rolling-regression ETA and delivered energy estimates
+"""
+import logging
+import time
+from collections import deque
+from ..utils.constants import CHARGING
+
+
+class ChargingSession:
+    def __init__(self, capacity=CHARGING["battery_capacity"], efficiency=CHARGING["efficiency"],
+                 window=CHARGING["regression_window"], target=CHARGING["target_percent"],
+                 min_samples=CHARGING["min_samples"], clock=time.monotonic):
+        """
+        Args:
+            capacity (float): Usable battery capacity in kWh
+            efficiency (float): Driving efficiency in miles per kWh
+            window (float): Seconds of charge history in the regression
+            target (float): Charge percent the ETA counts down to
+            min_samples (int): Samples needed before the regression is trusted
+            clock (callable): Monotonic clock in seconds
+        """
+        self.logger = logging.getLogger(__name__)
+        self.capacity = capacity
+        self.efficiency = efficiency
+        self.window = window
+        self.target = target
+        self.min_samples = min_samples
+        self.clock = clock
+        self.active = False
+        self.reset()
+
+    def reset(self):
+        """Forget every sample"""
+        self.started = None
+        # (t, percent) within the regression window
+        self.samples = deque()
+        self.last = None
+        self.energy = 0.0
+        self.battery_temp = None
+        self.peak_temp = None
+
+    def start(self, now=None):
+        """Begin a new session"""
+        self.reset()
+        self.started = self.clock() if now is None else now
+        self.active = True
+
+    def stop(self, now=None):
+        """
+        End the session
+        Returns:
+            dict: Final estimate of the session
+        """
+        summary = self.estimate(now)
+        self.active = False
+        self.logger.info(
+            f"Charging session ended: {summary['kwh_delivered']:.2f} kWh in "
+            f"{summary['elapsed'] / 60:.1f} min"
+        )
+        return summary
+
+    def add_sample(self, charge_percent, charging_rate=None, battery_temp=None, now=None):
+        """
+        Fold one VehicleMetrics reading into the session
+        Args:
+            charge_percent (float): State of charge
+            charging_rate (float): Charging power in kW
+            battery_temp (float): Battery temperature in °C
+            now (float): Sample time, defaults to the clock
+        """
+        if not self.active or charge_percent is None:
+            return
+        now = self.clock() if now is None else now
+        t = now - self.started
+
+        # Trapezoidal integration of charging power into kWh
+        if self.last is not None and charging_rate is not None and self.last[2] is not None:
+            hours = (t - self.last[0]) / 3600
+            self.energy += max(charging_rate + self.last[2], 0.0) / 2 * hours
+        self.last = (t, charge_percent, charging_rate)
+
+        if battery_temp is not None:
+            self.battery_temp = battery_temp
+            if self.peak_temp is None or battery_temp > self.peak_temp:
+                self.peak_temp = battery_temp
+
+        self.samples.append((t, charge_percent))
+        while t - self.samples[0][0] > self.window:
+            self.samples.popleft()
+
+    def regression(self):
+        """
+        Least-squares fit of charge percent over time within the window
+        Returns:
+            tuple: (percent per second, fitted percent at the latest sample), or None
+        """
+        n = len(self.samples)
+        if n < self.min_samples:
+            return None
+        # Centered sums; only run at the reduced popup rate, so O(window) is cheap
+        mean_t = sum(t for t, _ in self.samples) / n
+        mean_p = sum(p for _, p in self.samples) / n
+        var_t = sum((t - mean_t) ** 2 for t, _ in self.samples)
+        if var_t <= 0:
+            return None
+        slope = sum((t - mean_t) * (p - mean_p) for t, p in self.samples) / var_t
+        return slope, mean_p + slope * (self.samples[-1][0] - mean_t)
+
+    def estimate(self, now=None):
+        """
+        Smoothed charging figures
+        Returns:
+            dict: charge_percent, charging_rate, battery_temp, peak_temp, kwh_delivered,
+                percent_per_hour, minutes_remaining, range and elapsed (seconds); values
+                are None until known
+        """
+        now = self.clock() if now is None else now
+        elapsed = now - self.started if self.started is not None else 0.0
+        result = {
+            "charge_percent": None,
+            "charging_rate": None,
+            "battery_temp": self.battery_temp,
+            "peak_temp": self.peak_temp,
+            "kwh_delivered": self.energy,
+            "percent_per_hour": None,
+            "minutes_remaining": None,
+            "range": None,
+            "elapsed": elapsed
+        }
+        if self.last is None:
+            return result
+
+        _, percent, rate = self.last
+        result["charging_rate"] = rate
+        fit = self.regression()
+        if fit is not None:
+            slope, percent = fit
+            result["percent_per_hour"] = slope * 3600
+        percent = min(max(percent, 0.0), 100.0)
+        result["charge_percent"] = percent
+        result["range"] = self.capacity * percent / 100 * self.efficiency
+
+        remaining = max(self.target - percent, 0.0)
+        if remaining == 0:
+            result["minutes_remaining"] = 0.0
+        elif fit is not None and fit[0] > 0:
+            result["minutes_remaining"] = remaining / fit[0] / 60
+        elif rate:
+            # Too little history for a trend; assume the present power holds
+            result["minutes_remaining"] = self.capacity * remaining / 100 / rate * 60
+        return result
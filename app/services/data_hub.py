@@ -0,0 +1,197 @@
+"""
+Fan-out of one data source to several dashboard windows with per-window topic subscriptions
+"""
+import logging
+from functools import partial
+from PyQt6.QtCore import QObject, pyqtSignal
+from ..utils.constants import FAULT_DEBOUNCE
+from .fault_debouncer import FaultDebouncer
+
+# Topics a subscription can select, named as in the telemetry recordings
+TOPICS = ("vehicle_data", "vehicle_state", "fault_status")
+
+
+class DataSubscription(QObject):
+    # Same signals as DataService so MainDash can use a subscription as its data source
+    data_updated = pyqtSignal(object)
+    state_updated = pyqtSignal(object)
+    fault_updated = pyqtSignal(object)
+    connection_status_changed = pyqtSignal(bool)
+
+    def __init__(self, hub, topics):
+        """
+        Args:
+            hub (DataHub): Hub delivering the payloads
+            topics (iterable): Subset of TOPICS this subscriber receives
+        """
+        super().__init__()
+        self.hub = hub
+        self.topics = frozenset(topics)
+        self.monitoring = False
+        # Faults arrive debounced and already recorded in the shared history
+        self.faults_observed = hub.fault_history is not None
+        self.signals = {
+            "vehicle_data": self.data_updated,
+            "vehicle_state": self.state_updated,
+            "fault_status": self.fault_updated
+        }
+
+    @property
+    def connected(self):
+        return self.hub.connected
+
+    def start_monitoring(self):
+        """Start receiving the subscribed topics, beginning with their latest payloads"""
+        if not self.monitoring:
+            self.monitoring = True
+            self.hub.attach(self)
+
+    def stop_monitoring(self):
+        """Stop receiving; the data source keeps running while other subscribers remain"""
+        if self.monitoring:
+            self.monitoring = False
+            self.hub.detach(self)
+
+
+class DataHub(QObject):
+    def __init__(self, data_service, fault_history=None):
+        """
+        Args:
+            data_service (DataService): Single source polled on behalf of every subscriber,
+                or a ReplayService with the same signals
+            fault_history (FaultHistory): History shared by the windows; faults are then
+                debounced and recorded once here, so every window shows the same fault set
+        """
+        super().__init__()
+        self.logger = logging.getLogger(__name__)
+        self.data_service = data_service
+        self.fault_history = fault_history
+        self.fault_debouncer = (
+            FaultDebouncer() if fault_history is not None and FAULT_DEBOUNCE["enabled"] else None
+        )
+        self.connected = getattr(data_service, "connected", False)
+        self.running = False
+        self.subscriptions = []
+        # Bound emit methods per topic, rebuilt only when subscribers attach or detach
+        self.emitters = {topic: () for topic in TOPICS}
+        # Latest payload per topic, delivered to windows opened after it arrived
+        self.latest = {}
+        self.published = dict.fromkeys(TOPICS, 0)
+        self.delivered = dict.fromkeys(TOPICS, 0)
+
+        data_service.data_updated.connect(self.receive_vehicle_data)
+        data_service.state_updated.connect(partial(self.publish, "vehicle_state"))
+        data_service.fault_updated.connect(self.receive_fault_status)
+        data_service.connection_status_changed.connect(self.update_connection_status)
+
+    def subscribe(self, topics=TOPICS):
+        """
+        Create a subscription to some topics
+        Args:
+            topics (iterable): Subset of TOPICS
+        Returns:
+            DataSubscription: Data source for one window, idle until start_monitoring
+        """
+        unknown = set(topics) - set(TOPICS)
+        if unknown:
+            raise ValueError(f"Unknown data topics: {', '.join(sorted(unknown))}")
+        return DataSubscription(self, topics)
+
+    def receive_vehicle_data(self, data):
+        """Debounce the fault status embedded in vehicle data, then publish it"""
+        if self.fault_debouncer is not None and data.fault_status is not None:
+            # Copied rather than modified, the source may keep the payload
+            fault_status, changed = self.fault_debouncer.apply(data.fault_status)
+            data = data.replace(fault_status=fault_status)
+            if changed:
+                self.fault_history.observe(fault_status)
+        self.publish("vehicle_data", data)
+
+    def receive_fault_status(self, fault_data):
+        """Debounce and record a fault snapshot once for every window, then publish it"""
+        if self.fault_history is None:
+            self.publish("fault_status", fault_data)
+            return
+        if self.fault_debouncer is None:
+            self.fault_history.observe(fault_data)
+            self.publish("fault_status", fault_data)
+            return
+        fault_data, changed = self.fault_debouncer.apply(fault_data)
+        if changed:
+            self.fault_history.observe(fault_data)
+        # While faults are active, their elapsed time still has to refresh
+        if changed or fault_data.active:
+            self.publish("fault_status", fault_data)
+        else:
+            self.latest["fault_status"] = fault_data
+
+    def publish(self, topic, payload):
+        """Deliver a payload to every subscriber of its topic"""
+        # Subscribers share the payload object, so they must not modify it
+        self.latest[topic] = payload
+        self.published[topic] += 1
+        emitters = self.emitters[topic]
+        self.delivered[topic] += len(emitters)
+        for emit in emitters:
+            emit(payload)
+
+    def update_connection_status(self, connected):
+        """Forward connection changes to every active subscriber"""
+        self.connected = connected
+        for subscription in self.subscriptions:
+            subscription.connection_status_changed.emit(connected)
+
+    def attach(self, subscription):
+        """Start delivering to a subscription, starting the data source for the first one"""
+        self.subscriptions.append(subscription)
+        self._rebuild_emitters()
+        if not self.running:
+            self.running = True
+            self.data_service.start_monitoring()
+            return
+        for topic in TOPICS:
+            if topic in subscription.topics and topic in self.latest:
+                subscription.signals[topic].emit(self.latest[topic])
+
+    def detach(self, subscription):
+        """Stop delivering to a subscription, stopping the data source after the last one"""
+        self.subscriptions.remove(subscription)
+        self._rebuild_emitters()
+        if not self.subscriptions and self.running:
+            self.running = False
+            self.data_service.stop_monitoring()
+
+    def _rebuild_emitters(self):
+        """Precompute the subscribers of each topic"""
+        self.emitters = {
+            topic: tuple(
+                subscription.signals[topic].emit for subscription in self.subscriptions
+                if topic in subscription.topics
+            )
+            for topic in TOPICS
+        }
+
+    def close(self):
+        """Stop the data source and its recording once every window is gone"""
+        if self.running:
+            self.running = False
+            self.data_service.stop_monitoring()
+        if hasattr(self.data_service, 'stop_recording'):
+            self.data_service.stop_recording()
+        if hasattr(self.data_service, 'stop_bus'):
+            self.data_service.stop_bus()
+        if hasattr(self.data_service, 'stop_session'):
+            self.data_service.stop_session()
+        self.logger.info(
+            "Data hub delivered "
+            + ", ".join(f"{topic} {self.published[topic]}->{self.delivered[topic]}"
+                        for topic in TOPICS)
+        )
+
+    def stats(self):
+        """Return payloads received from the source and delivered to subscribers, per topic"""
+        return {
+            "subscribers": len(self.subscriptions),
+            "published": dict(self.published),
+            "delivered": dict(self.delivered)
+        }
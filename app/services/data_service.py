@@ -3,27 +3,53 @@ Service for fetching and managing vehicle data from the backend API
 """
 import requests
 import logging
+import time
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
-from ..utils.constants import API_BASE_URL, API_ENDPOINTS, UPDATE_INTERVALS
+from ..utils.constants import (
+    API_BASE_URL, API_ENDPOINTS, UPDATE_INTERVALS, SEQUENCE_TRACKING, WIRE_FORMAT,
+    SESSION_RECORDING
+)
+from .sequence_tracker import SequenceTracker
+from .decoding import decode_payload, PayloadDecodeError
+from .payloads import VehicleMetrics, VehicleState, FaultStatus
+from .binary_codec import decode_binary
+from .latency_tracer import tracer
+from .telemetry_recorder import TelemetryRecorder, ENCODING_JSON, ENCODING_BINARY
+from .telemetry_bus import TelemetryBus
+from .session_recorder import SessionRecorder
 
 class DataService(QObject):
     # Signals for different data updates
-    data_updated = pyqtSignal(dict)
-    state_updated = pyqtSignal(dict)
-    fault_updated = pyqtSignal(dict)
+    data_updated = pyqtSignal(object)     # VehicleMetrics
+    state_updated = pyqtSignal(object)    # VehicleState
+    fault_updated = pyqtSignal(object)    # FaultStatus
     connection_status_changed = pyqtSignal(bool)
     
-    def __init__(self, base_url=API_BASE_URL):
+    def __init__(self, base_url=API_BASE_URL, prefer_binary=WIRE_FORMAT["prefer_binary"]):
         super().__init__()
         self.base_url = base_url
         self.connected = False
         self.session = requests.Session()
-        self.last_state_counter = 0
+        self.set_wire_format(prefer_binary)
+        self.recorder = None
+        self.bus = None
+        self.session_recorder = None
+        
+        # Message counter tracking for the state topic
+        self.sequence_tracker = SequenceTracker(
+            modulus=SEQUENCE_TRACKING["counter_modulus"],
+            window_size=SEQUENCE_TRACKING["window_size"],
+            max_gap=SEQUENCE_TRACKING["max_gap"]
+        )
+        self.state_interval = UPDATE_INTERVALS["vehicle_state"]
+        self.loss_boost_active = False
+        self.resync_enabled = SEQUENCE_TRACKING["resync_on_gap"]
+        self._last_resync = 0.0
         
         # Setup update timers
         self.state_timer = QTimer()
         self.state_timer.timeout.connect(self.fetch_state)
-        self.state_timer.start(UPDATE_INTERVALS["vehicle_state"])
+        self.state_timer.start(self.state_interval)
         
         self.fault_timer = QTimer()
         self.fault_timer.timeout.connect(self.fetch_fault_status)
@@ -45,13 +71,17 @@ class DataService(QObject):
                 timeout=1.0
             )
             if response.status_code == 200:
-                data = response.json()
+                if tracer.enabled:
+                    tracer.mark("vehicle_data", "receive")
+                data = self.decode_response(response, VehicleMetrics)
+                self.record_response("vehicle_data", response)
+                self.forward_payload("vehicle_data", data)
                 self.data_updated.emit(data)
                 if not self.connected:
                     self.connected = True
                     self.connection_status_changed.emit(True)
                 return data
-        except requests.RequestException as e:
+        except (requests.RequestException, PayloadDecodeError) as e:
             self.handle_connection_error(f"Failed to fetch vehicle data: {e}")
         return None
 
@@ -63,24 +93,148 @@ class DataService(QObject):
                 timeout=0.5
             )
             if response.status_code == 200:
-                state_data = response.json()
+                if tracer.enabled:
+                    tracer.mark("vehicle_state", "receive")
+                state_data = self.decode_response(response, VehicleState)
+                self.record_response("vehicle_state", response)
+                self.forward_payload("vehicle_state", state_data)
                 
                 # Check for missed messages
-                new_counter = state_data.get('message_counter', 0)
-                if self.last_state_counter > 0:
-                    expected = (self.last_state_counter + 1) % 65536
-                    if new_counter != expected:
-                        self.logger.warning(
-                            f"Missed state message(s). Expected {expected}, got {new_counter}"
-                        )
-                self.last_state_counter = new_counter
+                self.track_sequence(state_data.message_counter)
                 
                 self.state_updated.emit(state_data)
                 return state_data
-        except requests.RequestException as e:
+        except (requests.RequestException, PayloadDecodeError) as e:
             self.handle_connection_error(f"Failed to fetch state: {e}")
         return None
 
+    def set_wire_format(self, prefer_binary):
+        """Choose the format requested from the backend via the Accept header"""
+        self.prefer_binary = prefer_binary
+        if prefer_binary:
+            accept = (
+                f"{WIRE_FORMAT['binary_content_type']}, "
+                f"{WIRE_FORMAT['json_content_type']};q=0.5"
+            )
+        else:
+            accept = WIRE_FORMAT["json_content_type"]
+        self.session.headers["Accept"] = accept
+
+    def is_binary_response(self, response):
+        """Check whether the backend answered in the binary telemetry format"""
+        content_type = response.headers.get("Content-Type", "")
+        return content_type.startswith(WIRE_FORMAT["binary_content_type"])
+
+    def decode_response(self, response, payload_type):
+        """Decode a response body according to the content type the backend chose"""
+        if self.is_binary_response(response):
+            return decode_binary(response.content, payload_type)
+        return decode_payload(response.content, payload_type)
+
+    def start_recording(self, path):
+        """Append every received payload to a telemetry recording"""
+        self.stop_recording()
+        self.recorder = TelemetryRecorder(path)
+        self.logger.info(f"Recording telemetry to {path}")
+
+    def stop_recording(self):
+        """Close the active telemetry recording, if any"""
+        if self.recorder is not None:
+            self.recorder.close()
+            self.logger.info(
+                f"Recorded {self.recorder.records} payloads to {self.recorder.path}"
+            )
+            self.recorder = None
+
+    def start_bus(self, path):
+        """Republish every decoded payload on a local telemetry bus"""
+        self.stop_bus()
+        self.bus = TelemetryBus(path)
+
+    def stop_bus(self):
+        """Close the telemetry bus, if any"""
+        if self.bus is not None:
+            self.bus.close()
+            self.bus = None
+
+    def start_session(self, directory, file_format=SESSION_RECORDING["format"]):
+        """Export every decoded payload to a new drive session under directory"""
+        self.stop_session()
+        self.session_recorder = SessionRecorder(directory, file_format)
+
+    def stop_session(self):
+        """Finish the drive session export, if any"""
+        if self.session_recorder is not None:
+            self.session_recorder.close()
+            self.session_recorder = None
+
+    def forward_payload(self, topic, payload):
+        """Hand a decoded payload to the telemetry bus and the session export, if active"""
+        if self.bus is not None:
+            self.bus.publish(topic, payload)
+        if self.session_recorder is not None:
+            self.session_recorder.record(topic, payload)
+
+    def record_response(self, topic, response):
+        """Write a received response body to the active recording"""
+        if self.recorder is None:
+            return
+        encoding = ENCODING_BINARY if self.is_binary_response(response) else ENCODING_JSON
+        self.recorder.write(topic, response.content, encoding)
+
+    def track_sequence(self, counter):
+        """Record a state message counter and react to gaps or persistent loss"""
+        expected = self.sequence_tracker.expected_next()
+        result = self.sequence_tracker.observe(counter)
+        
+        if result == "gap":
+            self.logger.warning(
+                f"Missed state message(s). Expected {expected}, got {counter}"
+            )
+            if self.resync_enabled:
+                self.request_resync()
+        elif result == "resync":
+            self.logger.info(f"State message counter restarted at {counter}")
+        
+        self.update_loss_boost()
+        return result
+
+    def request_resync(self):
+        """Fetch a full vehicle_data snapshot after missed state messages"""
+        now = time.monotonic()
+        if (now - self._last_resync) * 1000 < SEQUENCE_TRACKING["resync_cooldown"]:
+            return
+        self._last_resync = now
+        QTimer.singleShot(0, self.fetch_vehicle_data)
+
+    def update_loss_boost(self):
+        """Raise the state poll rate while loss persists, restore it once recovered"""
+        tracker = self.sequence_tracker
+        if tracker.window_samples < SEQUENCE_TRACKING["min_samples"]:
+            return
+        
+        loss_rate = tracker.loss_rate
+        if not self.loss_boost_active and loss_rate > SEQUENCE_TRACKING["loss_threshold"]:
+            boost = min(SEQUENCE_TRACKING["boost_interval"], self.state_interval)
+            self.loss_boost_active = True
+            self.state_timer.setInterval(boost)
+            self.logger.warning(
+                f"State loss rate {loss_rate:.1%}, polling every {boost}ms"
+            )
+        elif self.loss_boost_active and loss_rate <= SEQUENCE_TRACKING["recover_threshold"]:
+            self.loss_boost_active = False
+            self.state_timer.setInterval(self.state_interval)
+            self.logger.info(
+                f"State loss rate recovered, polling every {self.state_interval}ms"
+            )
+
+    def get_sequence_stats(self):
+        """Return gap, duplicate, reorder and loss-rate statistics for the state topic"""
+        stats = self.sequence_tracker.stats()
+        stats["poll_interval"] = self.state_timer.interval()
+        stats["loss_boost_active"] = self.loss_boost_active
+        return stats
+
     def fetch_fault_status(self):
         """Fetch fault status information"""
         try:
@@ -89,10 +243,14 @@ class DataService(QObject):
                 timeout=0.5
             )
             if response.status_code == 200:
-                fault_data = response.json()
+                if tracer.enabled:
+                    tracer.mark("fault_status", "receive")
+                fault_data = self.decode_response(response, FaultStatus)
+                self.record_response("fault_status", response)
+                self.forward_payload("fault_status", fault_data)
                 self.fault_updated.emit(fault_data)
                 return fault_data
-        except requests.RequestException as e:
+        except (requests.RequestException, PayloadDecodeError) as e:
             self.handle_connection_error(f"Failed to fetch fault status: {e}")
         return None
 
@@ -104,8 +262,8 @@ class DataService(QObject):
                 timeout=0.5
             )
             if response.status_code == 200:
-                return response.json()
-        except requests.RequestException as e:
+                return self.decode_response(response, VehicleMetrics)
+        except (requests.RequestException, PayloadDecodeError) as e:
             self.logger.error(f"Failed to fetch powertrain metrics: {e}")
         return None
 
@@ -117,8 +275,8 @@ class DataService(QObject):
                 timeout=0.5
             )
             if response.status_code == 200:
-                return response.json()
-        except requests.RequestException as e:
+                return self.decode_response(response, VehicleMetrics)
+        except (requests.RequestException, PayloadDecodeError) as e:
             self.logger.error(f"Failed to fetch tire metrics: {e}")
         return None
 
@@ -144,7 +302,9 @@ class DataService(QObject):
     def set_update_interval(self, data_type, interval):
         """Update the refresh interval for a specific data type"""
         if data_type == "vehicle_state":
-            self.state_timer.setInterval(interval)
+            self.state_interval = interval
+            if not self.loss_boost_active:
+                self.state_timer.setInterval(interval)
         elif data_type == "fault_status":
             self.fault_timer.setInterval(interval)
         elif data_type == "metrics":
@@ -0,0 +1,55 @@
+"""
+JSON decoding of backend responses into typed payloads, using the fastest available parser
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+if orjson is not None:
+    JSON_BACKEND = "orjson"
+    loads = orjson.loads
+elif msgspec is not None:
+    JSON_BACKEND = "msgspec"
+    loads = msgspec.json.Decoder().decode
+else:
+    JSON_BACKEND = "json"
+    loads = json.loads
+
+
+class PayloadDecodeError(ValueError):
+    """Raised when a response body cannot be decoded into a payload"""
+
+
+def decode_payload(raw, payload_type):
+    """
+    Decode a raw JSON response body into a typed payload
+    Args:
+        raw (bytes): Response body
+        payload_type (type): Payload class to build, e.g. VehicleState
+    Returns:
+        Payload: Decoded payload
+    Raises:
+        PayloadDecodeError: If the body is not valid JSON or not a JSON object, or a nested
+            object or list is not one
+    """
+    try:
+        data = loads(raw)
+    except Exception as e:
+        # Parsers raise different error types (msgspec.DecodeError is not a ValueError)
+        raise PayloadDecodeError(f"Invalid JSON payload: {e}") from e
+    if not isinstance(data, dict):
+        raise PayloadDecodeError(f"Expected a JSON object, got {type(data).__name__}")
+    try:
+        return payload_type.from_dict(data)
+    except (AttributeError, TypeError) as e:
+        # A nested field of the wrong JSON type, e.g. "vehicle_state": 5 or "faults": [1]
+        raise PayloadDecodeError(f"Malformed {payload_type.__name__} payload: {e}") from e
@@ -0,0 +1,143 @@
+"""
+Debouncing of raw fault snapshots into stable alerts, with per-fault flap counters
+"""
+import logging
+import time
+from collections import deque
+from .payloads import FaultStatus
+from ..utils.constants import FAULT_DEBOUNCE
+
+
+class DebounceState:
+    __slots__ = ("raw_active", "raw_since", "active", "entry", "toggles", "flaps")
+
+    def __init__(self, now):
+        self.raw_active = False
+        self.raw_since = now
+        self.active = False
+        self.entry = None
+        # Raw transition times within the flap window
+        self.toggles = deque()
+        self.flaps = 0
+
+
+class FaultDebouncer:
+    def __init__(self, times=None, default_times=None, flap_window=None,
+                 flap_threshold=None, clock=time.monotonic):
+        """
+        Args:
+            times (dict): FAULT_SOURCES key -> (assert ms, clear ms)
+            default_times (tuple): (assert ms, clear ms) for sources not in times
+            flap_window (int): Window in ms over which raw transitions are counted
+            flap_threshold (int): Transitions within the window reported as flapping
+            clock (callable): Monotonic clock in seconds
+        """
+        self.logger = logging.getLogger(__name__)
+        self.times = {
+            source: (assert_ms / 1000, clear_ms / 1000)
+            for source, (assert_ms, clear_ms) in (times or FAULT_DEBOUNCE["times"]).items()
+        }
+        assert_ms, clear_ms = default_times or FAULT_DEBOUNCE["default_times"]
+        self.default_times = (assert_ms / 1000, clear_ms / 1000)
+        self.flap_window = (flap_window or FAULT_DEBOUNCE["flap_window"]) / 1000
+        self.flap_threshold = flap_threshold or FAULT_DEBOUNCE["flap_threshold"]
+        self.clock = clock
+        self.states = {}
+        self.changes = 0
+
+    def apply(self, fault_status, now=None):
+        """
+        Debounce a raw fault snapshot
+        Args:
+            fault_status (FaultStatus): Raw payload from the backend
+            now (float): Snapshot time, defaults to the clock
+        Returns:
+            tuple: (FaultStatus with only debounced faults, whether the debounced set changed)
+        """
+        now = self.clock() if now is None else now
+        raw = {entry.key: entry for entry in fault_status.entries()}
+        changed = False
+
+        for key in raw.keys() - self.states.keys():
+            self.states[key] = DebounceState(now)
+
+        for key, state in list(self.states.items()):
+            entry = raw.get(key)
+            raw_active = entry is not None
+            if raw_active != state.raw_active:
+                state.raw_active = raw_active
+                state.raw_since = now
+                self._count_toggle(key, state, now)
+            if entry is not None:
+                if state.active and entry.severity != state.entry.severity:
+                    # Severity changes of a stable fault pass straight through
+                    changed = True
+                state.entry = entry
+
+            assert_time, clear_time = self.times.get(key[0], self.default_times)
+            held = now - state.raw_since
+            if raw_active and not state.active and held >= assert_time:
+                state.active = True
+                changed = True
+            elif not raw_active and state.active and held >= clear_time:
+                state.active = False
+                changed = True
+
+            if not raw_active and not state.active:
+                toggles = state.toggles
+                while toggles and now - toggles[0] > self.flap_window:
+                    toggles.popleft()
+                if not toggles:
+                    # Cleared and quiet for a whole flap window; forget it
+                    del self.states[key]
+
+        if changed:
+            self.changes += 1
+        return self._debounced_status(), changed
+
+    def _count_toggle(self, key, state, now):
+        """Record a raw transition and report faults flapping beyond the threshold"""
+        toggles = state.toggles
+        toggles.append(now)
+        while toggles and now - toggles[0] > self.flap_window:
+            toggles.popleft()
+        if len(toggles) == self.flap_threshold:
+            state.flaps += 1
+            self.logger.warning(
+                f"Fault {key[0]}/{key[1]} flapping: {len(toggles)} transitions in "
+                f"{self.flap_window:.0f}s"
+            )
+
+    def _debounced_status(self):
+        """FaultStatus listing the debounced faults, most severe first"""
+        entries = sorted(
+            (state.entry for state in self.states.values() if state.active),
+            key=lambda entry: -(entry.severity or 0)
+        )
+        if not entries:
+            return FaultStatus(faults=[])
+        primary = entries[0]
+        return FaultStatus(active=True, source=primary.source, type=primary.type,
+                           severity=primary.severity, timestamp=primary.timestamp,
+                           faults=entries)
+
+    def flap_rates(self, now=None):
+        """Raw transitions per minute within the flap window, per (source, type)"""
+        now = self.clock() if now is None else now
+        rates = {}
+        for key, state in self.states.items():
+            recent = sum(1 for toggle in state.toggles if now - toggle <= self.flap_window)
+            if recent:
+                rates[key] = recent * 60 / self.flap_window
+        return rates
+
+    def stats(self):
+        """Return debounce and flap counters"""
+        return {
+            "changes": self.changes,
+            "tracked": len(self.states),
+            "active": sum(1 for state in self.states.values() if state.active),
+            "flapping": {
+                key: state.flaps for key, state in self.states.items() if state.flaps
+            }
+        }
@@ -0,0 +1,310 @@
+"""
+Bounded, indexed store of fault begin/end events with optional SQLite persistence
+"""
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+from ..utils.constants import FAULT_HISTORY
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS fault_events (
+        id INTEGER PRIMARY KEY,
+        source TEXT,
+        type TEXT,
+        severity INTEGER,
+        start REAL NOT NULL,
+        end REAL
+    )
+"""
+SCHEMA_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS fault_events_start ON fault_events (start)",
+    "CREATE INDEX IF NOT EXISTS fault_events_source ON fault_events (source, start)",
+    "CREATE INDEX IF NOT EXISTS fault_events_type ON fault_events (type, start)"
+)
+
+
+class FaultEvent:
+    __slots__ = ("id", "source", "type", "severity", "start", "end")
+
+    def __init__(self, id, source, type, severity, start, end=None):
+        self.id = id
+        self.source = source
+        self.type = type
+        self.severity = severity
+        self.start = start
+        self.end = end
+
+    @property
+    def active(self):
+        return self.end is None
+
+    def duration(self, now=None):
+        """Seconds the fault lasted, or has lasted so far while still active"""
+        end = self.end if self.end is not None else (time.time() if now is None else now)
+        return end - self.start
+
+    def row(self):
+        """Tuple in fault_events column order"""
+        return (self.id, self.source, self.type, self.severity, self.start, self.end)
+
+    def copy(self):
+        """Snapshot of the event, safe to read while the original is updated"""
+        return FaultEvent(*self.row())
+
+    def __repr__(self):
+        return (f"FaultEvent(id={self.id}, source={self.source!r}, type={self.type!r}, "
+                f"severity={self.severity}, start={self.start}, end={self.end})")
+
+
+class FaultHistory:
+    def __init__(self, capacity=FAULT_HISTORY["capacity"], db_path=None,
+                 batch_size=FAULT_HISTORY["batch_size"], clock=time.time):
+        """
+        Args:
+            capacity (int): Events kept in memory, the oldest are evicted first
+            db_path (str): SQLite file events are persisted to, None keeps them in memory only
+            batch_size (int): Changed events written per SQLite transaction
+            clock (callable): Wall clock in seconds
+        """
+        self.logger = logging.getLogger(__name__)
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.clock = clock
+        # Queries may run on worker threads while the UI thread records transitions
+        self.lock = threading.Lock()
+
+        # Events in start order, plus per-source and per-type indexes in the same order
+        self.events = deque()
+        self.by_source = {}
+        self.by_type = {}
+        self.open_events = {}
+        self.next_id = 1
+        # Bumped on every change so views can skip redundant refreshes
+        self.version = 0
+
+        # Persistence
+        self.db_path = db_path
+        self.pending = {}
+        self.writer = None
+        if db_path:
+            self._load(db_path)
+            self.write_queue = queue.Queue()
+            self.writer = threading.Thread(target=self._write_loop, name="fault-history-writer",
+                                           daemon=True)
+            self.writer.start()
+
+    # Recording
+
+    def observe(self, fault_status, now=None):
+        """
+        Record begin/end transitions from a FaultStatus payload
+        Args:
+            fault_status (FaultStatus): Latest fault status
+            now (float): Observation time, defaults to the clock
+        Returns:
+            list: Events that began or ended
+        """
+        if fault_status is None:
+            return []
+        now = self.clock() if now is None else now
+        active = {entry.key: entry for entry in fault_status.entries()}
+
+        changed = []
+        with self.lock:
+            for open_key in [key for key in self.open_events if key not in active]:
+                changed.append(self._end(open_key, now))
+            for key, entry in active.items():
+                event = self.open_events.get(key)
+                if event is None:
+                    changed.append(self._begin(key, entry.severity, now))
+                elif entry.severity is not None and entry.severity > (event.severity or 0):
+                    # Escalation keeps the event but records its worst severity
+                    event.severity = entry.severity
+                    changed.append(event)
+            if changed:
+                self.version += 1
+
+        for event in changed:
+            self._mark_dirty(event)
+        return changed
+
+    def _begin(self, key, severity, now):
+        """Open a new event and add it to every index"""
+        event = FaultEvent(self.next_id, key[0], key[1], severity, now)
+        self.next_id += 1
+        self.open_events[key] = event
+        self._append(event)
+        return event
+
+    def _end(self, key, now):
+        """Close an open event"""
+        event = self.open_events.pop(key)
+        event.end = now
+        return event
+
+    def _append(self, event):
+        """Append an event to the indexes, evicting the oldest beyond capacity"""
+        self.events.append(event)
+        self.by_source.setdefault(event.source, deque()).append(event)
+        self.by_type.setdefault(event.type, deque()).append(event)
+        if len(self.events) > self.capacity:
+            # The oldest event overall is also the oldest in its own indexes
+            oldest = self.events.popleft()
+            self.by_source[oldest.source].popleft()
+            self.by_type[oldest.type].popleft()
+
+    # Queries
+
+    def query(self, source=None, fault_type=None, since=None, until=None, limit=None):
+        """
+        Events matching every given filter, newest first
+        Args:
+            source (str): Fault source
+            fault_type (str): Fault type
+            since (float): Earliest start time
+            until (float): Latest start time
+            limit (int): Maximum number of events
+        Returns:
+            list: Copies of the matching FaultEvent objects
+        """
+        with self.lock:
+            # Scan the smallest applicable index
+            candidates = self.events
+            if source is not None:
+                candidates = self.by_source.get(source, ())
+            if fault_type is not None:
+                by_type = self.by_type.get(fault_type, ())
+                if len(by_type) < len(candidates):
+                    candidates = by_type
+
+            results = []
+            for event in reversed(candidates):
+                if since is not None and event.start < since:
+                    break
+                if until is not None and event.start > until:
+                    continue
+                if source is not None and event.source != source:
+                    continue
+                if fault_type is not None and event.type != fault_type:
+                    continue
+                results.append(event.copy())
+                if limit is not None and len(results) >= limit:
+                    break
+            return results
+
+    def active_events(self):
+        """Copies of the currently open events"""
+        with self.lock:
+            return [event.copy() for event in self.open_events.values()]
+
+    def query_persisted(self, source=None, fault_type=None, since=None, until=None, limit=None):
+        """
+        Same filters as query(), extended with the events evicted to the SQLite file
+        The in-memory events are current while their rows may still wait for the writer, so
+        only older events are read from the file. Blocks on disk I/O, so call it from a worker
+        thread
+        """
+        results = self.query(source, fault_type, since, until, limit)
+        if not self.db_path or (limit is not None and len(results) >= limit):
+            return results
+        with self.lock:
+            # Ids are assigned in start order, so memory holds every id from its oldest on
+            first_id = self.events[0].id if self.events else self.next_id
+
+        clauses, params = ["id < ?"], [first_id]
+        for clause, value in (("source = ?", source), ("type = ?", fault_type),
+                              ("start >= ?", since), ("start <= ?", until)):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        sql = ("SELECT id, source, type, severity, start, end FROM fault_events WHERE "
+               + " AND ".join(clauses) + " ORDER BY start DESC")
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit - len(results))
+
+        connection = sqlite3.connect(self.db_path)
+        try:
+            rows = connection.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            self.logger.error(f"Fault history query failed: {e}")
+            return results
+        finally:
+            connection.close()
+        # An event evicted while memory was queried is in both; list it once
+        shown = {event.id for event in results}
+        return results + [FaultEvent(*row) for row in rows if row[0] not in shown]
+
+    # Persistence
+
+    def _load(self, db_path):
+        """Create the schema and reload the most recent events into memory"""
+        connection = sqlite3.connect(db_path)
+        try:
+            connection.execute(SCHEMA)
+            for statement in SCHEMA_INDEXES:
+                connection.execute(statement)
+            # Events still open when the previous session stopped have an unknown end;
+            # close them at their start in the file, where the writer never will
+            connection.execute("UPDATE fault_events SET end = start WHERE end IS NULL")
+            connection.commit()
+            rows = connection.execute(
+                "SELECT id, source, type, severity, start, end FROM fault_events "
+                "ORDER BY start DESC LIMIT ?", (self.capacity,)
+            ).fetchall()
+        finally:
+            connection.close()
+
+        for row in reversed(rows):
+            event = FaultEvent(*row)
+            self._append(event)
+            self.next_id = max(self.next_id, event.id + 1)
+        if rows:
+            self.logger.info(f"Loaded {len(rows)} fault events from {db_path}")
+
+    def _mark_dirty(self, event):
+        """Queue an event for the next batched write"""
+        if self.writer is None:
+            return
+        self.pending[event.id] = event.row()
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Hand pending changes to the writer thread as one batch"""
+        if self.writer is None or not self.pending:
+            return
+        batch = list(self.pending.values())
+        self.pending = {}
+        self.write_queue.put(batch)
+
+    def _write_loop(self):
+        """Writer thread owning the SQLite connection; a None batch stops it"""
+        connection = sqlite3.connect(self.db_path)
+        try:
+            while True:
+                batch = self.write_queue.get()
+                if batch is None:
+                    break
+                try:
+                    with connection:
+                        connection.executemany(
+                            "INSERT OR REPLACE INTO fault_events VALUES (?, ?, ?, ?, ?, ?)",
+                            batch
+                        )
+                except sqlite3.Error as e:
+                    self.logger.error(f"Fault history write failed: {e}")
+        finally:
+            connection.close()
+
+    def close(self):
+        """Flush pending changes and stop the writer thread"""
+        if self.writer is None:
+            return
+        self.flush()
+        self.write_queue.put(None)
+        self.writer.join()
+        self.writer = None
@@ -0,0 +1,131 @@
+"""
+Severity-ordered set of concurrent faults keyed by (source, type)
+"""
+import heapq
+import itertools
+import time
+
+
+class FaultQueue:
+    def __init__(self, clear_hold=0.0, clock=time.monotonic):
+        """
+        Args:
+            clear_hold (float): Seconds a cleared fault stays listed, so a fault that
+                flaps back within the hold neither disappears nor reappears. Faults
+                debounced upstream by FaultDebouncer need no hold
+            clock (callable): Monotonic clock in seconds
+        """
+        self.clear_hold = clear_hold
+        self.clock = clock
+        # Heap of [-severity, order, sequence, key, entry, valid]; replaced entries are
+        # invalidated in place and discarded lazily when they reach the top. A re-ranked
+        # fault keeps its order, so the unique sequence stops comparisons reaching the entry
+        self.heap = []
+        self.live = {}
+        self.cleared_at = {}
+        self.order = itertools.count()
+        self.sequence = itertools.count()
+        self.flaps = 0
+
+    def __len__(self):
+        return len(self.live)
+
+    def __contains__(self, key):
+        return key in self.live
+
+    def push(self, entry):
+        """
+        Add or update a fault in O(log n)
+        Args:
+            entry (FaultEntry): Active fault
+        Returns:
+            bool: Whether the listed faults changed
+        """
+        key = entry.key
+        if self.cleared_at.pop(key, None) is not None:
+            # Raised again within the clear hold
+            self.flaps += 1
+        current = self.live.get(key)
+        if current is not None:
+            if current[0] == -entry.severity:
+                # Same rank; keep the position and the latest timestamp
+                current[4] = entry
+                return False
+            current[5] = False
+            order = current[1]
+        else:
+            order = next(self.order)
+        item = [-entry.severity, order, next(self.sequence), key, entry, True]
+        self.live[key] = item
+        heapq.heappush(self.heap, item)
+        self._compact_if_stale()
+        return True
+
+    def get(self, key):
+        """Latest entry of a listed fault, or None"""
+        item = self.live.get(key)
+        return item[4] if item is not None else None
+
+    def remove(self, key):
+        """Drop a fault in O(1), its heap slot is reclaimed lazily"""
+        item = self.live.pop(key, None)
+        self.cleared_at.pop(key, None)
+        if item is None:
+            return False
+        item[5] = False
+        self._compact_if_stale()
+        return True
+
+    def _compact_if_stale(self):
+        """Rebuild the heap from live entries once stale slots dominate"""
+        if len(self.heap) > 2 * len(self.live) + 16:
+            self.heap = [item for item in self.heap if item[5]]
+            heapq.heapify(self.heap)
+
+    def sync(self, entries, now=None):
+        """
+        Apply a snapshot of every active fault
+        Args:
+            entries (list): FaultEntry per active fault
+            now (float): Snapshot time, defaults to the clock
+        Returns:
+            bool: Whether the listed faults changed
+        """
+        now = self.clock() if now is None else now
+        changed = False
+        seen = set()
+        for entry in entries:
+            seen.add(entry.key)
+            changed |= self.push(entry)
+
+        for key in list(self.live):
+            if key in seen:
+                continue
+            cleared = self.cleared_at.setdefault(key, now)
+            if now - cleared >= self.clear_hold:
+                changed |= self.remove(key)
+        return changed
+
+    def top(self, count):
+        """
+        The most severe faults, oldest first within a severity
+        Args:
+            count (int): Maximum number of faults
+        Returns:
+            list: FaultEntry objects
+        """
+        heap = self.heap
+        best = []
+        while heap and len(best) < count:
+            item = heapq.heappop(heap)
+            if item[5]:
+                best.append(item)
+        for item in best:
+            heapq.heappush(heap, item)
+        return [item[4] for item in best]
+
+    def clear(self):
+        """Drop every fault"""
+        self.heap = []
+        self.live.clear()
+        self.cleared_at.clear()
@@ -0,0 +1,117 @@
+"""
+End-to-end latency tracing from payload receive to the next paint
+
+Hooks call mark() at each stage. While tracing is disabled every hook is a single
+attribute check at the call site, so the instrumentation stays in place at no cost.
+"""
+import time
+from collections import deque
+
+from ..utils.constants import LATENCY_TRACING
+
+# Stages in pipeline order; latencies are measured from "receive"
+STAGES = ("receive", "dispatch", "update", "paint")
+MEASURED_STAGES = STAGES[1:]
+
+
+class LatencyTracer:
+    def __init__(self, enabled=False, window_size=500, clock=time.perf_counter):
+        self.enabled = enabled
+        self.window_size = window_size
+        self.clock = clock
+
+        # Stage timestamps of the latest unpainted payload per topic
+        self.pending = {}
+        # Rolling latency samples (ms) per topic and stage
+        self.samples = {}
+        self.superseded = {}
+
+    def mark(self, topic, stage):
+        """Timestamp a pipeline stage for the latest payload of a topic"""
+        now = self.clock()
+        if stage == "receive":
+            if topic in self.pending:
+                # The previous payload was replaced before it reached the screen
+                self.superseded[topic] = self.superseded.get(topic, 0) + 1
+            self.pending[topic] = {"receive": now}
+            return
+        stamps = self.pending.get(topic)
+        if stamps is not None:
+            stamps[stage] = now
+
+    def mark_paint(self):
+        """Complete every updated payload at the first paint after its widget update"""
+        if not self.pending:
+            return
+        now = self.clock()
+        for topic in [t for t, stamps in self.pending.items() if "update" in stamps]:
+            stamps = self.pending.pop(topic)
+            stamps["paint"] = now
+            received = stamps["receive"]
+            for stage in MEASURED_STAGES:
+                if stage in stamps:
+                    self._record(topic, stage, (stamps[stage] - received) * 1000)
+
+    def _record(self, topic, stage, latency):
+        """Add a latency sample to the rolling window"""
+        key = (topic, stage)
+        window = self.samples.get(key)
+        if window is None:
+            window = self.samples[key] = deque(maxlen=self.window_size)
+        window.append(latency)
+
+    def percentiles(self, topic, stage="paint"):
+        """Return p50/p95/p99 latency in ms for a topic and stage, or None without samples"""
+        window = self.samples.get((topic, stage))
+        if not window:
+            return None
+        ordered = sorted(window)
+        last = len(ordered) - 1
+        return {
+            "p50": ordered[int(last * 0.50)],
+            "p95": ordered[int(last * 0.95)],
+            "p99": ordered[int(last * 0.99)],
+            "count": len(ordered)
+        }
+
+    def topics(self):
+        """Topics with at least one completed sample"""
+        return sorted({topic for topic, _ in self.samples})
+
+    def summary(self):
+        """Per-topic, per-stage percentiles"""
+        return {
+            topic: {
+                stage: self.percentiles(topic, stage)
+                for stage in MEASURED_STAGES
+                if (topic, stage) in self.samples
+            }
+            for topic in self.topics()
+        }
+
+    def format_summary(self):
+        """One line per topic with receive-to-paint percentiles"""
+        lines = []
+        for topic in self.topics():
+            stats = self.percentiles(topic, "paint")
+            if stats is None:
+                continue
+            lines.append(
+                f"{topic}: p50 {stats['p50']:.1f}ms p95 {stats['p95']:.1f}ms "
+                f"p99 {stats['p99']:.1f}ms (n={stats['count']}, "
+                f"superseded {self.superseded.get(topic, 0)})"
+            )
+        return "\n".join(lines)
+
+    def reset(self):
+        """Drop all pending stamps and samples"""
+        self.pending.clear()
+        self.samples.clear()
+        self.superseded.clear()
+
+
+# Shared tracer used by the data service and the UI hooks
+tracer = LatencyTracer(
+    enabled=LATENCY_TRACING["enabled"],
+    window_size=LATENCY_TRACING["window_size"]
+)
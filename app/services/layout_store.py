@@ -0,0 +1,65 @@
+"""
+Persistence of the drop area layout to a small local JSON file
+"""
+import json
+import logging
+import os
+
+LAYOUT_VERSION = 1
+
+
+class LayoutStore:
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Layout file, created with its directory on first save
+        """
+        self.logger = logging.getLogger(__name__)
+        self.path = os.path.expanduser(path)
+
+    def load(self):
+        """
+        Read the saved layout
+        Returns:
+            list: {"type", "position", "config"} per widget, or None when nothing usable is saved
+        """
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable layout file {self.path}: {e}")
+            return None
+
+        if not isinstance(state, dict) or state.get("version") != LAYOUT_VERSION:
+            self.logger.warning(f"Ignoring layout file {self.path} with unknown version")
+            return None
+        widgets = state.get("widgets")
+        if not isinstance(widgets, list):
+            return None
+        return [
+            widget for widget in widgets
+            if isinstance(widget, dict) and isinstance(widget.get("type"), str)
+            and isinstance(widget.get("position"), int)
+        ]
+
+    def save(self, widgets):
+        """
+        Atomically replace the saved layout
+        Args:
+            widgets (list): {"type", "position", "config"} per widget
+        """
+        state = {"version": LAYOUT_VERSION, "widgets": widgets}
+        directory = os.path.dirname(self.path) or "."
+        temp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            # A reader sees either the old or the new layout, never a partial file
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            self.logger.error(f"Failed to save layout to {self.path}: {e}")
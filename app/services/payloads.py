@@ -0,0 +1,153 @@
+"""
+Typed payload structures for decoded backend messages
+"""
+
+
+class Payload:
+    """Base for slotted payload structs built from decoded JSON objects"""
+    __slots__ = ()
+    _fields = ()
+
+    def __init__(self, **values):
+        for name, default in self._fields:
+            setattr(self, name, values.get(name, default))
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a payload from a decoded JSON object, filling missing fields with defaults"""
+        payload = cls.__new__(cls)
+        get = data.get
+        for name, default in cls._fields:
+            setattr(payload, name, get(name, default))
+        return payload
+
+    def replace(self, **changes):
+        """Return a shallow copy with some fields replaced, leaving this payload untouched"""
+        payload = type(self).__new__(type(self))
+        for name, _ in self._fields:
+            setattr(payload, name, changes.get(name, getattr(self, name)))
+        return payload
+
+    def to_dict(self):
+        """Return the payload as a plain dict, omitting unset optional fields"""
+        result = {}
+        for name, _ in self._fields:
+            value = getattr(self, name)
+            if value is None:
+                continue
+            if isinstance(value, Payload):
+                value = value.to_dict()
+            elif isinstance(value, (list, tuple)) and value and isinstance(value[0], Payload):
+                value = [item.to_dict() for item in value]
+            result[name] = value
+        return result
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name, _ in self._fields)
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name, _ in self._fields)
+        return f"{type(self).__name__}({values})"
+
+
+class VehicleState(Payload):
+    """Payload of /vehicle_state"""
+    __slots__ = ("primary_state", "sub_state", "status_flags", "message_counter")
+    _fields = (
+        ("primary_state", "UNKNOWN"),
+        ("sub_state", "UNKNOWN"),
+        ("status_flags", ()),
+        ("message_counter", 0)
+    )
+
+
+class FaultEntry(Payload):
+    """One of several concurrent faults in a FaultStatus"""
+    __slots__ = ("source", "type", "severity", "timestamp")
+    _fields = (
+        ("source", "UNKNOWN"),
+        ("type", "UNKNOWN"),
+        ("severity", 0),
+        ("timestamp", 0)
+    )
+
+    @property
+    def key(self):
+        return (self.source, self.type)
+
+
+class FaultStatus(Payload):
+    """
+    Payload of /fault_status
+
+    The single-fault fields describe the most severe fault. Backends reporting concurrent
+    faults also send every active one in faults.
+    """
+    __slots__ = ("active", "source", "type", "severity", "timestamp", "faults")
+    _fields = (
+        ("active", False),
+        ("source", "UNKNOWN"),
+        ("type", "UNKNOWN"),
+        ("severity", 0),
+        ("timestamp", 0),
+        ("faults", None)
+    )
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a fault status, decoding the concurrent fault list"""
+        payload = super().from_dict(data)
+        if payload.faults is not None:
+            payload.faults = [FaultEntry.from_dict(entry) for entry in payload.faults]
+        return payload
+
+    def entries(self):
+        """Every active fault, falling back to the single-fault fields"""
+        if self.faults is not None:
+            return self.faults
+        if not self.active:
+            return []
+        return [FaultEntry(source=self.source, type=self.type,
+                           severity=self.severity, timestamp=self.timestamp)]
+
+
+class VehicleMetrics(Payload):
+    """Payload of /vehicle_data and the /metrics/* endpoints"""
+    __slots__ = (
+        "charge_percent", "charging_rate", "power_output",
+        "motor_temp", "battery_temp", "inverter_temp", "brake_temp",
+        "tire_temp", "tire_pressure", "vehicle_state", "fault_status"
+    )
+    _fields = (
+        ("charge_percent", None),
+        ("charging_rate", None),
+        ("power_output", None),
+        ("motor_temp", None),
+        ("battery_temp", None),
+        ("inverter_temp", None),
+        ("brake_temp", None),
+        ("tire_temp", None),
+        ("tire_pressure", None),
+        ("vehicle_state", None),
+        ("fault_status", None)
+    )
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build metrics, decoding the nested state and fault objects"""
+        payload = super().from_dict(data)
+        if payload.vehicle_state is not None:
+            payload.vehicle_state = VehicleState.from_dict(payload.vehicle_state)
+        if payload.fault_status is not None:
+            payload.fault_status = FaultStatus.from_dict(payload.fault_status)
+        return payload
+
+
+# Payload class of each data topic, named as in the telemetry recordings
+TOPIC_PAYLOADS = {
+    "vehicle_data": VehicleMetrics,
+    "vehicle_state": VehicleState,
+    "fault_status": FaultStatus
+}
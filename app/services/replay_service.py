@@ -0,0 +1,148 @@
+"""
+Replay of telemetry recordings through the same signals as DataService
+"""
+import logging
+import time
+from PyQt6.QtCore import QObject, pyqtSignal, QTimer
+from ..utils.constants import REPLAY
+from .binary_codec import decode_binary
+from .decoding import decode_payload, PayloadDecodeError
+from .latency_tracer import tracer
+from .payloads import TOPIC_PAYLOADS
+from .telemetry_recorder import read_recording, ENCODING_BINARY
+
+
+class ReplayService(QObject):
+    # Same signals as DataService so consumers can use either source
+    data_updated = pyqtSignal(object)
+    state_updated = pyqtSignal(object)
+    fault_updated = pyqtSignal(object)
+    connection_status_changed = pyqtSignal(bool)
+    replay_finished = pyqtSignal()
+
+    def __init__(self, path, speed=1.0, loop=False, max_gap=REPLAY["max_gap"]):
+        """
+        Args:
+            path (str): Recording to replay
+            speed (float): Playback speed multiplier, 0 replays as fast as possible
+            loop (bool): Restart from the beginning when the recording ends
+            max_gap (float): Longest recorded pause (s) replayed, longer ones are shortened
+        """
+        super().__init__()
+        self.path = path
+        self.speed = speed
+        self.loop = loop
+        self.max_gap = max_gap
+        self.connected = False
+        self.replayed = 0
+
+        self.signals = {
+            "vehicle_data": self.data_updated,
+            "vehicle_state": self.state_updated,
+            "fault_status": self.fault_updated
+        }
+
+        self._records = None
+        self._next_record = None
+        self._start_time = 0.0
+        self._start_timestamp = 0.0
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._emit_due)
+
+        self.logger = logging.getLogger(__name__)
+
+    def start_monitoring(self):
+        """Start playback, resuming from the current position after stop_monitoring"""
+        if self._next_record is not None:
+            self._start_timestamp = self._next_record[0]
+            self._start_time = time.monotonic()
+            self._schedule()
+            return
+        self.restart()
+
+    def restart(self):
+        """Start playback from the beginning of the recording"""
+        self._records = read_recording(self.path)
+        self._next_record = next(self._records, None)
+        if self._next_record is None:
+            self.logger.warning(f"Recording {self.path} is empty")
+            self.replay_finished.emit()
+            return
+        self._start_time = time.monotonic()
+        self._start_timestamp = self._next_record[0]
+        if not self.connected:
+            self.connected = True
+            self.connection_status_changed.emit(True)
+        self._schedule()
+
+    def stop_monitoring(self):
+        """Pause playback"""
+        self.timer.stop()
+
+    def replay_all(self):
+        """Emit every record immediately without the event loop, for headless benchmarks"""
+        for _, topic, encoding, body in read_recording(self.path):
+            self._emit_record(topic, encoding, body)
+        return self.replayed
+
+    def set_speed(self, speed):
+        """Change the playback speed, keeping the current position"""
+        if self._next_record is not None:
+            self._start_timestamp = self._next_record[0]
+            self._start_time = time.monotonic()
+        self.speed = speed
+
+    def _due_in(self, timestamp):
+        """Milliseconds until a recorded timestamp is due at the current speed"""
+        if self.speed <= 0:
+            return 0
+        target = (timestamp - self._start_timestamp) / self.speed
+        return (target - (time.monotonic() - self._start_time)) * 1000
+
+    def _schedule(self):
+        """Arm the timer for the next record"""
+        delay = self._due_in(self._next_record[0])
+        self.timer.start(max(0, int(delay)))
+
+    def _emit_due(self):
+        """Emit every record that is due, then schedule the next one"""
+        while self._next_record is not None:
+            timestamp, topic, encoding, body = self._next_record
+            if self._due_in(timestamp) > 0:
+                break
+            self._emit_record(topic, encoding, body)
+            self._next_record = next(self._records, None)
+            if self._next_record is not None:
+                # Appended sessions and clock jumps replay as at most max_gap of silence
+                gap = self._next_record[0] - timestamp
+                if not 0 <= gap <= self.max_gap:
+                    self._start_timestamp += gap - min(max(gap, 0), self.max_gap)
+            # Yield to the event loop between records at max speed
+            if self.speed <= 0:
+                break
+
+        if self._next_record is not None:
+            self._schedule()
+        elif self.loop:
+            self.restart()
+        else:
+            self.logger.info(f"Replayed {self.replayed} payloads from {self.path}")
+            self.replay_finished.emit()
+
+    def _emit_record(self, topic, encoding, body):
+        """Decode a recorded body and emit it on the topic's signal"""
+        payload_type = TOPIC_PAYLOADS[topic]
+        if tracer.enabled:
+            tracer.mark(topic, "receive")
+        try:
+            if encoding == ENCODING_BINARY:
+                payload = decode_binary(body, payload_type)
+            else:
+                payload = decode_payload(body, payload_type)
+        except PayloadDecodeError as e:
+            self.logger.error(f"Skipping undecodable {topic} record: {e}")
+            return
+        self.replayed += 1
+        self.signals[topic].emit(payload)
@@ -0,0 +1,141 @@
+"""
+Tracking of 16-bit message counters for gap, duplicate and reorder detection
+"""
+from collections import deque
+
+
+class SequenceTracker:
+    def __init__(self, modulus=65536, window_size=200, max_gap=1000):
+        self.modulus = modulus
+        self.half_range = modulus // 2
+        self.max_gap = max_gap
+
+        # Rolling window of (received, lost, duplicate) entries per observation
+        self.window = deque(maxlen=window_size)
+        self.reset()
+
+    def reset(self):
+        """Clear all counters and forget the last seen counter"""
+        self.last_counter = None
+        self.received = 0
+        self.gaps = 0
+        self.lost = 0
+        self.duplicates = 0
+        self.reordered = 0
+        self.resyncs = 0
+        self.window.clear()
+        self._window_received = 0
+        self._window_lost = 0
+        self._window_duplicates = 0
+
+    def distance(self, new_counter, old_counter):
+        """Signed distance between two counters, accounting for wraparound"""
+        delta = (new_counter - old_counter) % self.modulus
+        if delta >= self.half_range:
+            delta -= self.modulus
+        return delta
+
+    def observe(self, counter):
+        """
+        Record a received counter value
+        Args:
+            counter (int): message_counter from the latest payload
+        Returns:
+            str: One of "first", "ok", "gap", "duplicate", "reordered" or "resync"
+        """
+        counter = int(counter) % self.modulus
+
+        if self.last_counter is None:
+            self.last_counter = counter
+            self.received += 1
+            self._push(1, 0, 0)
+            return "first"
+
+        delta = self.distance(counter, self.last_counter)
+
+        if delta == 0:
+            self.duplicates += 1
+            self._push(0, 0, 1)
+            return "duplicate"
+
+        # Jumps too large to be loss mean the backend restarted its counter
+        if abs(delta) > self.max_gap:
+            self.resyncs += 1
+            self.received += 1
+            self.last_counter = counter
+            self._push(1, 0, 0)
+            return "resync"
+
+        if delta < 0:
+            # Late arrival of a message we already counted as lost
+            self.reordered += 1
+            self.received += 1
+            if self.lost > 0:
+                self.lost -= 1
+            self._push(1, -1, 0)
+            return "reordered"
+
+        self.received += 1
+        self.last_counter = counter
+        if delta > 1:
+            self.gaps += 1
+            self.lost += delta - 1
+            self._push(1, delta - 1, 0)
+            return "gap"
+
+        self._push(1, 0, 0)
+        return "ok"
+
+    def expected_next(self):
+        """Return the next counter value expected, or None before the first message"""
+        if self.last_counter is None:
+            return None
+        return (self.last_counter + 1) % self.modulus
+
+    def _push(self, received, lost, duplicate):
+        """Append an observation to the rolling window"""
+        if len(self.window) == self.window.maxlen:
+            old_received, old_lost, old_duplicate = self.window[0]
+            self._window_received -= old_received
+            self._window_lost -= old_lost
+            self._window_duplicates -= old_duplicate
+        self.window.append((received, lost, duplicate))
+        self._window_received += received
+        self._window_lost += lost
+        self._window_duplicates += duplicate
+
+    @property
+    def window_samples(self):
+        """Number of observations currently in the rolling window"""
+        return len(self.window)
+
+    @property
+    def loss_rate(self):
+        """Fraction of expected messages lost over the rolling window"""
+        lost = max(self._window_lost, 0)
+        expected = self._window_received + lost
+        if expected == 0:
+            return 0.0
+        return lost / expected
+
+    @property
+    def duplicate_rate(self):
+        """Fraction of polls that returned an already seen message"""
+        polls = self._window_received + self._window_duplicates
+        if polls == 0:
+            return 0.0
+        return self._window_duplicates / polls
+
+    def stats(self):
+        """Return a snapshot of all counters and rolling rates"""
+        return {
+            "received": self.received,
+            "gaps": self.gaps,
+            "lost": self.lost,
+            "duplicates": self.duplicates,
+            "reordered": self.reordered,
+            "resyncs": self.resyncs,
+            "loss_rate": self.loss_rate,
+            "duplicate_rate": self.duplicate_rate,
+            "window_samples": self.window_samples
+        }
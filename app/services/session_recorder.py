@@ -0,0 +1,399 @@
+"""
+Drive session export of every decoded sample to chunked columnar files for offline analysis
+
+Each session is a directory with one series of chunk files per topic, e.g.
+vehicle_data-0001.parquet, with a flat column per payload field (tires split per corner) and
+the receive time. Parquet is written when pyarrow is installed, CSV otherwise or on request.
+
+Recording never blocks the caller: samples are collected into batches that are handed to a
+writer thread through a bounded queue, and a batch that finds the queue full is dropped and
+counted instead. The writer flattens the payloads and writes each batch to the open chunks.
+A Parquet file has no footer until it is closed, so Parquet chunks are also rotated by age to
+bound what a crash loses.
+"""
+import abc
+import csv
+import logging
+import os
+import queue
+import threading
+import time
+
+try:
+    import pyarrow
+    import pyarrow.parquet as parquet
+except ImportError:
+    pyarrow = None
+
+from ..utils.constants import SESSION_RECORDING
+
+FORMATS = ("csv", "parquet")
+TIRES = ("fl", "fr", "rl", "rr")
+NO_TIRES = (None,) * len(TIRES)
+
+# Columns per topic as (name, type); types are float, int, str or bool
+COLUMNS = {
+    "vehicle_data": (
+        ("time", "float"),
+        ("charge_percent", "float"),
+        ("charging_rate", "float"),
+        ("power_output", "float"),
+        ("motor_temp", "float"),
+        ("battery_temp", "float"),
+        ("inverter_temp", "float"),
+        ("brake_temp", "float"),
+        *((f"tire_temp_{tire}", "float") for tire in TIRES),
+        *((f"tire_pressure_{tire}", "float") for tire in TIRES),
+        ("primary_state", "str"),
+        ("fault_active", "bool")
+    ),
+    "vehicle_state": (
+        ("time", "float"),
+        ("primary_state", "str"),
+        ("sub_state", "str"),
+        ("status_flags", "str"),
+        ("message_counter", "int")
+    ),
+    "fault_status": (
+        ("time", "float"),
+        ("active", "bool"),
+        ("source", "str"),
+        ("type", "str"),
+        ("severity", "int"),
+        ("fault_timestamp", "float"),
+        ("fault_count", "int")
+    )
+}
+
+
+def tire_values(values):
+    """Four per-corner values of a tire field, None where missing"""
+    if not values:
+        return NO_TIRES
+    values = tuple(values[:len(TIRES)])
+    return values + NO_TIRES[len(values):]
+
+
+def vehicle_data_row(timestamp, payload):
+    """Row of a VehicleMetrics payload"""
+    state = payload.vehicle_state
+    fault = payload.fault_status
+    return (
+        timestamp,
+        payload.charge_percent,
+        payload.charging_rate,
+        payload.power_output,
+        payload.motor_temp,
+        payload.battery_temp,
+        payload.inverter_temp,
+        payload.brake_temp,
+        *tire_values(payload.tire_temp),
+        *tire_values(payload.tire_pressure),
+        state.primary_state if state is not None else None,
+        fault.active if fault is not None else None
+    )
+
+
+def vehicle_state_row(timestamp, payload):
+    """Row of a VehicleState payload"""
+    return (
+        timestamp,
+        payload.primary_state,
+        payload.sub_state,
+        "|".join(payload.status_flags or ()),
+        payload.message_counter
+    )
+
+
+def fault_status_row(timestamp, payload):
+    """Row of a FaultStatus payload"""
+    return (
+        timestamp,
+        payload.active,
+        payload.source,
+        payload.type,
+        payload.severity,
+        payload.timestamp,
+        len(payload.entries())
+    )
+
+
+ROWS = {
+    "vehicle_data": vehicle_data_row,
+    "vehicle_state": vehicle_state_row,
+    "fault_status": fault_status_row
+}
+
+
+def resolve_format(name):
+    """
+    File format to write
+    Args:
+        name (str): "csv", "parquet" or "auto" for parquet when pyarrow is installed
+    Returns:
+        str: One of FORMATS
+    Raises:
+        ValueError: If the format is unknown, or parquet is requested without pyarrow
+    """
+    if name == "auto":
+        return "parquet" if pyarrow is not None else "csv"
+    if name not in FORMATS:
+        raise ValueError(
+            f"Unknown session format {name!r}; choose from auto, {', '.join(FORMATS)}")
+    if name == "parquet" and pyarrow is None:
+        raise ValueError("Writing Parquet sessions requires pyarrow")
+    return name
+
+
+class ChunkWriter(abc.ABC):
+    """
+    Writes the rows of one topic to numbered chunk files of at most chunk_rows rows, each
+    open for at most max_age seconds when given
+    """
+    extension = ""
+
+    def __init__(self, directory, topic, chunk_rows, max_age=None, clock=time.monotonic):
+        self.directory = directory
+        self.topic = topic
+        self.columns = COLUMNS[topic]
+        self.chunk_rows = chunk_rows
+        self.max_age = max_age
+        self.clock = clock
+        self.chunks = 0
+        self.chunk_size = 0
+        self.opened = 0.0
+        self.rows = 0
+        self.file = None
+
+    def write(self, rows):
+        """Append rows, starting new chunks as they fill or age"""
+        if (self.file is not None and self.max_age is not None
+                and self.clock() - self.opened >= self.max_age):
+            self.close()
+        while rows:
+            if self.file is None or self.chunk_size >= self.chunk_rows:
+                self._rotate()
+            part = rows[:self.chunk_rows - self.chunk_size]
+            rows = rows[len(part):]
+            self._write_rows(part)
+            self.chunk_size += len(part)
+            self.rows += len(part)
+
+    def _rotate(self):
+        """Close the current chunk and open the next one"""
+        self.close()
+        self.chunks += 1
+        self.chunk_size = 0
+        path = os.path.join(self.directory, f"{self.topic}-{self.chunks:04d}{self.extension}")
+        self.file = self._open(path)
+        self.opened = self.clock()
+
+    def close(self):
+        """Close the current chunk, if any"""
+        if self.file is not None:
+            self._close_file()
+            self.file = None
+
+    @abc.abstractmethod
+    def _open(self, path):
+        """Create a chunk file, returning its handle"""
+
+    @abc.abstractmethod
+    def _write_rows(self, rows):
+        """Append row tuples to the open chunk"""
+
+    @abc.abstractmethod
+    def _close_file(self):
+        """Finish the open chunk"""
+
+
+class CsvChunkWriter(ChunkWriter):
+    extension = ".csv"
+
+    def _open(self, path):
+        handle = open(path, "w", newline="")
+        self.csv = csv.writer(handle)
+        self.csv.writerow([name for name, _ in self.columns])
+        return handle
+
+    def _write_rows(self, rows):
+        self.csv.writerows(rows)
+        self.file.flush()
+
+    def _close_file(self):
+        self.file.close()
+
+
+class ParquetChunkWriter(ChunkWriter):
+    extension = ".parquet"
+
+    def __init__(self, directory, topic, chunk_rows,
+                 max_age=SESSION_RECORDING["parquet_chunk_age"], clock=time.monotonic):
+        super().__init__(directory, topic, chunk_rows, max_age, clock)
+        types = {
+            "float": pyarrow.float64(),
+            "int": pyarrow.int64(),
+            "str": pyarrow.string(),
+            "bool": pyarrow.bool_()
+        }
+        self.schema = pyarrow.schema([(name, types[kind]) for name, kind in self.columns])
+
+    def _open(self, path):
+        return parquet.ParquetWriter(path, self.schema)
+
+    def _write_rows(self, rows):
+        # Each batch becomes one row group, built column-wise from the row tuples
+        arrays = [
+            pyarrow.array(values, type=field.type)
+            for values, field in zip(zip(*rows), self.schema)
+        ]
+        self.file.write_table(pyarrow.Table.from_arrays(arrays, schema=self.schema))
+
+    def _close_file(self):
+        self.file.close()
+
+
+WRITERS = {
+    "csv": CsvChunkWriter,
+    "parquet": ParquetChunkWriter
+}
+
+
+class SessionRecorder:
+    def __init__(self, directory=SESSION_RECORDING["directory"],
+                 file_format=SESSION_RECORDING["format"],
+                 batch_size=SESSION_RECORDING["batch_size"],
+                 flush_interval=SESSION_RECORDING["flush_interval"],
+                 queue_batches=SESSION_RECORDING["queue_batches"],
+                 chunk_rows=SESSION_RECORDING["chunk_rows"],
+                 close_timeout=SESSION_RECORDING["close_timeout"], clock=time.time):
+        """
+        Start recording a session into a new subdirectory
+        Args:
+            directory (str): Parent directory of the session directories
+            file_format (str): "csv", "parquet" or "auto"
+            batch_size (int): Samples handed to the writer thread at once
+            flush_interval (int): Maximum time (ms) samples wait before being handed over
+            queue_batches (int): Batches waiting for the writer before new ones are dropped
+            chunk_rows (int): Rows per chunk file
+            close_timeout (float): Seconds close() waits for the writer thread
+            clock (callable): Wall clock in seconds, stamped on every sample
+        Raises:
+            ValueError: If the format cannot be written
+        """
+        self.logger = logging.getLogger(__name__)
+        self.format = resolve_format(file_format)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval / 1000
+        self.chunk_rows = chunk_rows
+        self.close_timeout = close_timeout
+        self.clock = clock
+
+        # Sessions started within the same second get a numbered suffix
+        base = os.path.join(os.path.expanduser(directory),
+                            time.strftime("session-%Y%m%d-%H%M%S", time.localtime(clock())))
+        self.path = base
+        suffix = 1
+        while os.path.exists(self.path):
+            suffix += 1
+            self.path = f"{base}-{suffix}"
+        os.makedirs(self.path)
+
+        # Caller side: the batch being filled
+        self.pending = []
+        self.last_handoff = clock()
+        self.recorded = 0
+        self.dropped = 0
+
+        # Writer side
+        self.written = 0
+        self.batches = 0
+        self.failed = 0
+        self.write_queue = queue.Queue(maxsize=queue_batches)
+        self.writer = threading.Thread(target=self._write_loop, name="session-writer", daemon=True)
+        self.writer.start()
+        self.logger.info(f"Recording {self.format} session to {self.path}")
+
+    def record(self, topic, payload):
+        """
+        Add a decoded sample; never blocks
+        Args:
+            topic (str): One of COLUMNS
+            payload (Payload): Decoded payload, flattened on the writer thread
+        """
+        now = self.clock()
+        self.pending.append((topic, now, payload))
+        self.recorded += 1
+        if len(self.pending) >= self.batch_size or now - self.last_handoff >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Hand the pending samples to the writer as one batch, dropped if its queue is full"""
+        self.last_handoff = self.clock()
+        if not self.pending:
+            return
+        batch = self.pending
+        self.pending = []
+        try:
+            self.write_queue.put_nowait(batch)
+        except queue.Full:
+            self.dropped += len(batch)
+
+    def _write_loop(self):
+        """Writer thread owning the chunk files; a None batch stops it"""
+        writers = {topic: WRITERS[self.format](self.path, topic, self.chunk_rows)
+                   for topic in COLUMNS}
+        try:
+            while True:
+                batch = self.write_queue.get()
+                if batch is None:
+                    break
+                # Any failure loses this batch only; the thread must outlive bad payloads
+                try:
+                    rows = {topic: [] for topic in COLUMNS}
+                    for topic, timestamp, payload in batch:
+                        rows[topic].append(ROWS[topic](timestamp, payload))
+                    for topic, topic_rows in rows.items():
+                        if topic_rows:
+                            writers[topic].write(topic_rows)
+                    self.written += len(batch)
+                except Exception as e:
+                    self.failed += len(batch)
+                    self.logger.error(f"Session write failed: {e}")
+                self.batches += 1
+        finally:
+            for writer in writers.values():
+                writer.close()
+
+    def close(self):
+        """Hand over the pending samples, let the writer finish and close the files"""
+        if self.writer is None:
+            return
+        self.flush()
+        if self.writer.is_alive():
+            # Waits a bounded time for the writer to make room; only called at shutdown
+            try:
+                self.write_queue.put(None, timeout=self.close_timeout)
+            except queue.Full:
+                self.logger.error(f"Session writer did not drain its queue, {self.path} "
+                                  "may be incomplete")
+            else:
+                self.writer.join(self.close_timeout)
+        self.writer = None
+        self.logger.info(
+            f"Session {self.path}: recorded {self.recorded}, written {self.written}, "
+            f"dropped {self.dropped}, failed {self.failed} samples"
+        )
+
+    def stats(self):
+        """Return sample counters and the writer queue depth"""
+        return {
+            "path": self.path,
+            "format": self.format,
+            "recorded": self.recorded,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+            "queued": self.write_queue.qsize()
+        }
@@ -0,0 +1,178 @@
+"""
+Latest-payload snapshot in shared memory, written by the acquisition process and read by the UI
+
+The block starts with a header (magic, slot size, connection flag) followed by one slot per
+topic. A slot is a sequence counter and two buffers, each a length, a CRC32 and a message in
+the binary telemetry format. The writer fills the buffer readers are not using and then bumps
+the counter, whose parity selects the current buffer. A reader reads the counter, decodes the
+current buffer in place and accepts it only if the counter is unchanged and the CRC matches,
+so it never waits on the writer and a torn read is retried instead of shown.
+"""
+import logging
+import struct
+import zlib
+from multiprocessing.shared_memory import SharedMemory
+
+from .binary_codec import encode_payload, decode_binary, ENCODE_ERRORS
+from .decoding import PayloadDecodeError
+from .payloads import TOPIC_PAYLOADS
+from .telemetry_recorder import TOPICS
+
+MAGIC = b"VSNAP01\0"
+HEADER = struct.Struct("<8sIIQ")        # magic, slot size, topic count, connected
+CONNECTED = struct.Struct("<Q")         # connection flag, the last header field
+CONNECTED_OFFSET = HEADER.size - CONNECTED.size
+SEQUENCE = struct.Struct("<Q")          # publishes so far, parity selects the buffer
+BUFFER_HEADER = struct.Struct("<II")    # message length, CRC32 of the message
+
+
+class SnapshotLayout:
+    def __init__(self, slot_size):
+        """
+        Args:
+            slot_size (int): Largest encoded message a buffer holds
+        """
+        self.slot_size = slot_size
+        # 8 byte aligned so the counters are written with single aligned stores
+        self.buffer_stride = (BUFFER_HEADER.size + slot_size + 7) & ~7
+        slot_stride = SEQUENCE.size + 2 * self.buffer_stride
+        self.slots = {}
+        for index, topic in enumerate(TOPICS):
+            start = HEADER.size + index * slot_stride
+            first = start + SEQUENCE.size
+            self.slots[topic] = (start, (first, first + self.buffer_stride))
+        self.size = HEADER.size + len(TOPICS) * slot_stride
+
+
+class SnapshotWriter:
+    def __init__(self, name, slot_size):
+        """
+        Args:
+            name (str): Shared memory block created by the reading process
+            slot_size (int): Slot size the block was created with
+        """
+        self.logger = logging.getLogger(__name__)
+        # Child processes share the creator's resource tracker, so attaching does not
+        # make this process an owner; the reader unlinks the block
+        self.memory = SharedMemory(name=name)
+        self.buf = self.memory.buf
+        self.layout = SnapshotLayout(slot_size)
+        magic, size, _, _ = HEADER.unpack_from(self.buf, 0)
+        if magic != MAGIC or size != slot_size:
+            raise ValueError(f"Shared memory block {name} is not a matching snapshot")
+        self.sequences = dict.fromkeys(TOPICS, 0)
+        self.dropped = 0
+        # Topics whose encode failure was logged, so a bad stream logs once per topic
+        self.encode_failed = set()
+
+    def write(self, topic, payload):
+        """
+        Publish the latest payload of a topic
+        Args:
+            topic (str): One of TOPICS
+            payload (Payload): Payload decoded by the DataService
+        Returns:
+            bool: False if the payload could not be encoded or did not fit the slot
+        """
+        try:
+            body = encode_payload(payload)
+        except ENCODE_ERRORS as e:
+            # The in-process JSON path shows such payloads; skip them rather than abort
+            self.dropped += 1
+            if topic not in self.encode_failed:
+                self.encode_failed.add(topic)
+                self.logger.error(f"Cannot encode {topic} payload for the snapshot: {e}")
+            return False
+        if len(body) > self.layout.slot_size:
+            self.dropped += 1
+            self.logger.warning(f"{topic} payload of {len(body)} bytes exceeds the snapshot slot")
+            return False
+        start, buffers = self.layout.slots[topic]
+        sequence = self.sequences[topic] + 1
+        # Fill the buffer readers are not using, then publish it with the counter
+        offset = buffers[sequence & 1]
+        BUFFER_HEADER.pack_into(self.buf, offset, len(body), zlib.crc32(body))
+        data = offset + BUFFER_HEADER.size
+        self.buf[data:data + len(body)] = body
+        SEQUENCE.pack_into(self.buf, start, sequence)
+        self.sequences[topic] = sequence
+        return True
+
+    def set_connected(self, connected):
+        """Publish the backend connection state"""
+        CONNECTED.pack_into(self.buf, CONNECTED_OFFSET, 1 if connected else 0)
+
+    def close(self):
+        """Detach from the block"""
+        self.buf = None
+        self.memory.close()
+
+
+class SnapshotReader:
+    def __init__(self, slot_size, retries=3):
+        """
+        Create the shared memory block and read from it
+        Args:
+            slot_size (int): Largest encoded message a buffer holds
+            retries (int): Reads of a topic per call before a torn read is given up on
+        """
+        self.logger = logging.getLogger(__name__)
+        self.layout = SnapshotLayout(slot_size)
+        self.memory = SharedMemory(create=True, size=self.layout.size)
+        self.name = self.memory.name
+        self.buf = self.memory.buf
+        self.buf[:self.layout.size] = bytes(self.layout.size)
+        HEADER.pack_into(self.buf, 0, MAGIC, slot_size, len(TOPICS), 0)
+        self.retries = retries
+        # Last accepted counter per topic, payloads are decoded only when it moves
+        self.seen = dict.fromkeys(TOPICS, 0)
+        self.torn = 0
+        self.invalid = 0
+
+    @property
+    def connected(self):
+        return CONNECTED.unpack_from(self.buf, CONNECTED_OFFSET)[0] == 1
+
+    def read(self, topic):
+        """
+        Latest payload of a topic if it changed since the last read
+        Args:
+            topic (str): One of TOPICS
+        Returns:
+            Payload: Newly published payload, or None if unchanged or not readable yet
+        """
+        start, buffers = self.layout.slots[topic]
+        buf = self.buf
+        for _ in range(self.retries):
+            sequence, = SEQUENCE.unpack_from(buf, start)
+            if sequence == self.seen[topic]:
+                return None
+            offset = buffers[sequence & 1]
+            length, crc = BUFFER_HEADER.unpack_from(buf, offset)
+            length = min(length, self.layout.slot_size)
+            data = offset + BUFFER_HEADER.size
+            # Decoded from a view of the block, without copying the message out
+            with buf[data:data + length] as message:
+                if zlib.crc32(message) != crc:
+                    continue
+                try:
+                    payload = decode_binary(message, TOPIC_PAYLOADS[topic])
+                except PayloadDecodeError as e:
+                    payload = e
+            if SEQUENCE.unpack_from(buf, start)[0] != sequence:
+                # Overwritten during the read; retry with the newer buffer
+                continue
+            self.seen[topic] = sequence
+            if isinstance(payload, PayloadDecodeError):
+                self.invalid += 1
+                self.logger.error(f"Undecodable {topic} snapshot: {payload}")
+                return None
+            return payload
+        self.torn += 1
+        return None
+
+    def close(self):
+        """Release and remove the block"""
+        self.buf = None
+        self.memory.close()
+        self.memory.unlink()
@@ -0,0 +1,387 @@
+"""
+Local publish/subscribe bus republishing decoded telemetry to other in-car apps
+
+The bus is a Unix-domain stream socket. Every frame is a 3 byte header (topic id, body length)
+followed by the body. Data frames carry one payload in the binary telemetry format, topic ids
+are those of the telemetry recordings. A client selects topics by sending a SUBSCRIBE frame
+whose one byte body is a bitmask of topic ids; it receives nothing until it does.
+
+The server runs on its own thread. Publishing only queues the payload, and subscribers whose
+socket backlog grows beyond a limit lose frames instead of stalling the dashboard.
+"""
+import fnmatch
+import logging
+import os
+import selectors
+import socket
+import stat
+import struct
+import threading
+from collections import deque
+
+from ..utils.constants import TELEMETRY_BUS
+from .binary_codec import encode_payload, decode_binary, ENCODE_ERRORS
+from .payloads import TOPIC_PAYLOADS
+from .telemetry_recorder import TOPICS, TOPIC_IDS
+
+FRAME_HEADER = struct.Struct("<BH")     # topic id or control type, body length
+SUBSCRIBE = 0xFF                        # Control frame, body is the topic bitmask
+RECV_SIZE = 65536
+
+
+def topic_mask(patterns):
+    """
+    Bitmask of the topics matching any of the patterns
+    Args:
+        patterns (iterable): Topic names or fnmatch patterns such as "*" or "vehicle_*"
+    Returns:
+        int: Bit per TOPIC_IDS entry
+    """
+    mask = 0
+    for pattern in patterns:
+        matches = fnmatch.filter(TOPICS, pattern)
+        if not matches:
+            raise ValueError(f"No telemetry topic matches {pattern!r}")
+        for topic in matches:
+            mask |= 1 << TOPIC_IDS[topic]
+    return mask
+
+
+def encode_frame(kind, body):
+    """Frame a body for the bus"""
+    return FRAME_HEADER.pack(kind, len(body)) + body
+
+
+def split_frames(buffer):
+    """
+    Take the complete frames off the start of a buffer
+    Args:
+        buffer (bytearray): Received bytes, consumed frames are removed
+    Returns:
+        list: (topic id or control type, body bytes) per frame
+    """
+    frames = []
+    offset = 0
+    while len(buffer) - offset >= FRAME_HEADER.size:
+        kind, length = FRAME_HEADER.unpack_from(buffer, offset)
+        end = offset + FRAME_HEADER.size + length
+        if end > len(buffer):
+            break
+        frames.append((kind, bytes(buffer[offset + FRAME_HEADER.size:end])))
+        offset = end
+    del buffer[:offset]
+    return frames
+
+
+def remove_stale_socket(path):
+    """
+    Remove a socket left at path by a bus that is gone
+    Raises:
+        OSError: If the path is not a socket, or a bus still accepts connections on it
+    """
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise OSError(f"{path} exists and is not a socket")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        os.unlink(path)
+        return
+    finally:
+        probe.close()
+    raise OSError(f"Another telemetry bus is serving on {path}")
+
+
+class BusConnection:
+    __slots__ = ("sock", "mask", "inbox", "outbox", "dropped")
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.mask = 0
+        self.inbox = bytearray()
+        self.outbox = bytearray()
+        self.dropped = 0
+
+
+class TelemetryBus:
+    def __init__(self, path=TELEMETRY_BUS["path"], max_backlog=TELEMETRY_BUS["max_backlog"],
+                 max_pending=TELEMETRY_BUS["max_pending"],
+                 close_timeout=TELEMETRY_BUS["close_timeout"]):
+        """
+        Args:
+            path (str): Socket path, a stale socket left at it is replaced
+            max_backlog (int): Unsent bytes per subscriber before its frames are dropped
+            max_pending (int): Payloads queued for the bus thread before the oldest are dropped
+            close_timeout (float): Seconds close() waits for the bus thread
+        Raises:
+            OSError: If the path is not a socket, or another bus is serving on it
+        """
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.max_backlog = max_backlog
+        self.close_timeout = close_timeout
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        # Union of the subscriber masks, so unwanted topics are not even queued
+        self.subscribed = 0
+        # Topic ids whose encode failure was logged, so a bad stream logs once per topic
+        self.encode_failed = set()
+
+        remove_stale_socket(path)
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.listener.bind(path)
+        self.listener.listen()
+        self.listener.setblocking(False)
+        # Publishing from another thread wakes the selector through this pair
+        self.wake_reader, self.wake_writer = socket.socketpair()
+        self.wake_reader.setblocking(False)
+        self.wake_writer.setblocking(False)
+
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.listener, selectors.EVENT_READ)
+        self.selector.register(self.wake_reader, selectors.EVENT_READ)
+        self.connections = {}
+        self.pending = deque(maxlen=max_pending)
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name="telemetry-bus", daemon=True)
+        self.thread.start()
+        self.logger.info(f"Telemetry bus listening on {path}")
+
+    def publish(self, topic, payload):
+        """
+        Queue a decoded payload for the subscribers of its topic; never blocks
+        Args:
+            topic (str): One of TOPICS
+            payload (Payload): Decoded payload, encoded on the bus thread
+        """
+        topic_id = TOPIC_IDS[topic]
+        if not self.subscribed & (1 << topic_id) or not self.thread.is_alive():
+            return
+        self.pending.append((topic_id, payload))
+        try:
+            self.wake_writer.send(b"\0")
+        except BlockingIOError:
+            # Already woken and not yet drained
+            pass
+
+    def close(self):
+        """Stop the bus thread and remove the socket"""
+        if not self.running:
+            return
+        self.running = False
+        try:
+            self.wake_writer.send(b"\0")
+        except BlockingIOError:
+            pass
+        self.thread.join(self.close_timeout)
+        if self.thread.is_alive():
+            self.logger.error("Telemetry bus thread did not stop, closing its sockets anyway")
+        for connection in list(self.connections.values()):
+            self._disconnect(connection)
+        self.selector.close()
+        self.listener.close()
+        self.wake_reader.close()
+        self.wake_writer.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self.logger.info(
+            f"Telemetry bus published {self.published}, delivered {self.delivered}, "
+            f"dropped {self.dropped} frames"
+        )
+
+    def stats(self):
+        """Return subscriber and frame counters"""
+        return {
+            "subscribers": len(self.connections),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped
+        }
+
+    # Bus thread
+
+    def _run(self):
+        """Serve connections and deliver queued payloads until closed"""
+        while self.running:
+            for key, events in self.selector.select(timeout=1.0):
+                sock = key.fileobj
+                if sock is self.listener:
+                    self._accept()
+                elif sock is self.wake_reader:
+                    try:
+                        while sock.recv(4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                else:
+                    connection = self.connections.get(sock)
+                    if connection is None:
+                        continue
+                    if events & selectors.EVENT_READ:
+                        self._receive(connection)
+                    if events & selectors.EVENT_WRITE and sock in self.connections:
+                        self._send(connection)
+            self._dispatch()
+
+    def _accept(self):
+        """Accept a new subscriber"""
+        try:
+            sock, _ = self.listener.accept()
+        except BlockingIOError:
+            return
+        sock.setblocking(False)
+        self.connections[sock] = BusConnection(sock)
+        self.selector.register(sock, selectors.EVENT_READ)
+
+    def _receive(self, connection):
+        """Apply SUBSCRIBE frames from a subscriber, dropping it on EOF or error"""
+        try:
+            data = connection.sock.recv(RECV_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._disconnect(connection)
+            return
+        connection.inbox += data
+        for kind, body in split_frames(connection.inbox):
+            if kind == SUBSCRIBE and len(body) == 1:
+                connection.mask = body[0]
+        self._update_subscribed()
+
+    def _dispatch(self):
+        """Encode queued payloads once and append them to every matching subscriber"""
+        pending = self.pending
+        if not pending:
+            return
+        touched = set()
+        while pending:
+            topic_id, payload = pending.popleft()
+            bit = 1 << topic_id
+            try:
+                body = encode_payload(payload)
+            except ENCODE_ERRORS as e:
+                # The JSON path accepts payloads the binary layout cannot carry; skip them
+                self.dropped += 1
+                if topic_id not in self.encode_failed:
+                    self.encode_failed.add(topic_id)
+                    self.logger.error(f"Cannot publish {TOPICS[topic_id]} on the bus: {e}")
+                continue
+            frame = encode_frame(topic_id, body)
+            self.published += 1
+            for connection in list(self.connections.values()):
+                if not connection.mask & bit:
+                    continue
+                if len(connection.outbox) + len(frame) > self.max_backlog:
+                    # Hand the socket what it takes now before giving up on the frame
+                    self._send(connection)
+                    if connection.sock not in self.connections:
+                        continue
+                    if len(connection.outbox) + len(frame) > self.max_backlog:
+                        connection.dropped += 1
+                        self.dropped += 1
+                        continue
+                connection.outbox += frame
+                self.delivered += 1
+                touched.add(connection)
+        for connection in touched:
+            # An earlier send may have dropped it since it was touched
+            if connection.sock in self.connections:
+                self._send(connection)
+
+    def _send(self, connection):
+        """Write as much of a subscriber's backlog as the socket takes"""
+        sock = connection.sock
+        try:
+            sent = sock.send(connection.outbox)
+        except BlockingIOError:
+            sent = 0
+        except OSError:
+            self._disconnect(connection)
+            return
+        del connection.outbox[:sent]
+        events = selectors.EVENT_READ
+        if connection.outbox:
+            events |= selectors.EVENT_WRITE
+        if self.selector.get_key(sock).events != events:
+            self.selector.modify(sock, events)
+
+    def _disconnect(self, connection):
+        """Forget a subscriber; a subscriber already forgotten is ignored"""
+        if self.connections.pop(connection.sock, None) is None:
+            return
+        self.selector.unregister(connection.sock)
+        connection.sock.close()
+        self._update_subscribed()
+
+    def _update_subscribed(self):
+        """Recompute the union of the subscriber topic masks"""
+        mask = 0
+        for connection in self.connections.values():
+            mask |= connection.mask
+        self.subscribed = mask
+
+
+class BusClient:
+    def __init__(self, topics=("*",), path=TELEMETRY_BUS["path"]):
+        """
+        Connect to the dashboard's telemetry bus
+        Args:
+            topics (iterable): Topic names or fnmatch patterns to receive
+            path (str): Socket path of the bus
+        """
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(path)
+        self.buffer = bytearray()
+        self.frames = deque()
+        self.subscribe(topics)
+
+    def subscribe(self, topics):
+        """Replace the topic filter"""
+        self.mask = topic_mask(topics)
+        self.sock.sendall(encode_frame(SUBSCRIBE, bytes((self.mask,))))
+
+    def receive(self, timeout=None):
+        """
+        Next payload from the bus
+        Args:
+            timeout (float): Seconds to wait, None waits indefinitely
+        Returns:
+            tuple: (topic, payload), or None on timeout or when the bus closed
+        """
+        while not self.frames:
+            self.sock.settimeout(timeout)
+            try:
+                data = self.sock.recv(RECV_SIZE)
+            except socket.timeout:
+                return None
+            if not data:
+                return None
+            self.buffer += data
+            self.frames.extend(split_frames(self.buffer))
+        topic_id, body = self.frames.popleft()
+        topic = TOPICS[topic_id]
+        return topic, decode_binary(body, TOPIC_PAYLOADS[topic])
+
+    def __iter__(self):
+        while True:
+            message = self.receive()
+            if message is None:
+                return
+            yield message
+
+    def close(self):
+        """Disconnect from the bus"""
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
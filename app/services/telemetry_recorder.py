@@ -0,0 +1,94 @@
+"""
+Append-only recording of received backend payloads for deterministic replay
+
+A recording starts with a magic line followed by records of a fixed header
+(receive time, topic id, encoding, body length) and the raw response body.
+"""
+import os
+import struct
+import time
+
+MAGIC = b"VTLOG1\n"
+RECORD_HEADER = struct.Struct("<dBBI")      # timestamp, topic, encoding, length
+
+# Recorded topics, indexed by id
+TOPICS = ("vehicle_data", "vehicle_state", "fault_status")
+TOPIC_IDS = {topic: index for index, topic in enumerate(TOPICS)}
+
+# Body encodings
+ENCODING_JSON = 0
+ENCODING_BINARY = 1
+
+
+class RecordingFormatError(ValueError):
+    """Raised when a file is not a valid telemetry recording"""
+
+
+class TelemetryRecorder:
+    def __init__(self, path, flush_every=50):
+        self.path = path
+        self.flush_every = flush_every
+        self.records = 0
+        self._pending = 0
+
+        # Append to an existing recording, writing the magic only for new files
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        if not is_new:
+            with open(path, "rb") as f:
+                if f.read(len(MAGIC)) != MAGIC:
+                    raise RecordingFormatError(f"{path} is not a telemetry recording")
+        self.file = open(path, "ab")
+        if is_new:
+            self.file.write(MAGIC)
+
+    def write(self, topic, body, encoding=ENCODING_JSON, timestamp=None):
+        """
+        Append one received payload
+        Args:
+            topic (str): One of TOPICS
+            body (bytes): Raw response body
+            encoding (int): ENCODING_JSON or ENCODING_BINARY
+            timestamp (float): Receive time in seconds, defaults to now
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        self.file.write(RECORD_HEADER.pack(timestamp, TOPIC_IDS[topic], encoding, len(body)))
+        self.file.write(body)
+        self.records += 1
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Flush buffered records to disk"""
+        self.file.flush()
+        self._pending = 0
+
+    def close(self):
+        """Flush and close the recording"""
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+
+def read_recording(path):
+    """
+    Iterate over the records of a recording
+    Args:
+        path (str): Recording file
+    Yields:
+        tuple: (timestamp, topic, encoding, body)
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise RecordingFormatError(f"{path} is not a telemetry recording")
+        while True:
+            header = f.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                # End of file, or a record cut short by a crash while recording
+                return
+            timestamp, topic_id, encoding, length = RECORD_HEADER.unpack(header)
+            body = f.read(length)
+            if len(body) < length:
+                return
+            yield timestamp, TOPICS[topic_id], encoding, body
@@ -0,0 +1,127 @@
+"""
+Four-corner tire state with vectorized severity, deltas and rolling averages
+"""
+import logging
+import numpy as np
+from ..utils.constants import TIRE_STATE, WARNING_THRESHOLDS
+
+# Severity codes, indexable into SEVERITY_NAMES
+NORMAL, WARNING, CRITICAL = 0, 1, 2
+SEVERITY_NAMES = ("NORMAL", "WARNING", "CRITICAL")
+
+# Rows of the stacked value arrays
+TEMP, PRESSURE = 0, 1
+
+
+class TireState:
+    def __init__(self, window=TIRE_STATE["average_window"],
+                 deadband=TIRE_STATE["trend_deadband"]):
+        """
+        Args:
+            window (int): Samples in the rolling average per corner
+            deadband (float): Distance from the average before a corner reports a trend
+        """
+        self.logger = logging.getLogger(__name__)
+        self.window = window
+        self.deadband = deadband
+        self.corners = TIRE_STATE["corners"]
+        self.reset()
+
+    def reset(self):
+        """Forget all samples"""
+        shape = (2, len(self.corners))
+        # Row TEMP holds temperatures, row PRESSURE holds pressures
+        self.values = np.full(shape, np.nan)
+        self.deltas = np.zeros(shape)
+        self.history = np.zeros((self.window,) + shape)
+        self.sums = np.zeros(shape)
+        self.counts = np.zeros(shape)
+        self.head = np.zeros(2, dtype=np.intp)
+        self.severity = np.zeros(shape, dtype=np.int8)
+        self.trend = np.zeros(shape, dtype=np.int8)
+
+    @property
+    def temps(self):
+        return self.values[TEMP]
+
+    @property
+    def pressures(self):
+        return self.values[PRESSURE]
+
+    @property
+    def averages(self):
+        """Rolling average per row and corner, NaN before the first sample"""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.counts > 0, self.sums / self.counts, np.nan)
+
+    @property
+    def corner_severity(self):
+        """Worst of temperature and pressure severity per corner"""
+        return self.severity.max(axis=0)
+
+    def update(self, temps=None, pressures=None):
+        """
+        Apply new readings; a missing row keeps its previous values
+        Args:
+            temps (list): Temperature per corner
+            pressures (list): Pressure per corner
+        Returns:
+            numpy.ndarray: Boolean mask of corners whose value, severity or trend changed
+        """
+        changed = np.zeros(len(self.corners), dtype=bool)
+        for row, readings in ((TEMP, temps), (PRESSURE, pressures)):
+            if readings is None:
+                continue
+            readings = np.asarray(readings, dtype=float)
+            if readings.shape != self.values[row].shape:
+                self.logger.warning(f"Ignoring tire readings with shape {readings.shape}")
+                continue
+            changed |= self._update_row(row, readings)
+        return changed
+
+    def _update_row(self, row, readings):
+        """Fold one row of readings into the state and return its changed corners"""
+        previous = self.values[row]
+        # NaN never compares equal, so the first sample marks every corner changed
+        value_changed = readings != previous
+        self.deltas[row] = np.where(np.isnan(previous), 0.0, readings - previous)
+        self.values[row] = readings
+
+        # Running sums over a ring of the last window samples
+        head = self.head[row]
+        if self.counts[row, 0] >= self.window:
+            self.sums[row] -= self.history[head, row]
+        else:
+            self.counts[row] += 1
+        self.history[head, row] = readings
+        self.sums[row] += readings
+        self.head[row] = (head + 1) % self.window
+        if self.head[row] == 0:
+            # Re-sum once per lap so floating point error cannot accumulate
+            self.sums[row] = self.history[:, row].sum(axis=0)
+
+        severity = self._severity(row, readings)
+        offset = readings - self.sums[row] / self.counts[row]
+        trend = np.where(np.abs(offset) > self.deadband, np.sign(offset), 0).astype(np.int8)
+
+        changed = value_changed | (severity != self.severity[row]) | (trend != self.trend[row])
+        self.severity[row] = severity
+        self.trend[row] = trend
+        return changed
+
+    def _severity(self, row, readings):
+        """Vectorized severity codes of one row"""
+        if row == TEMP:
+            limits = WARNING_THRESHOLDS["tire_temp"]
+            return np.select(
+                [readings >= limits["critical"], readings >= limits["warning"]],
+                [CRITICAL, WARNING], NORMAL
+            ).astype(np.int8)
+
+        high = WARNING_THRESHOLDS["tire_pressure"]
+        low = WARNING_THRESHOLDS["tire_pressure_low"]
+        return np.select(
+            [(readings >= high["critical"]) | (readings <= low["critical"]),
+             (readings >= high["warning"]) | (readings <= low["warning"])],
+            [CRITICAL, WARNING], NORMAL
+        ).astype(np.int8)
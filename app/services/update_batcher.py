@@ -0,0 +1,71 @@
+"""
+Frame-paced batching of widget updates, coalescing payloads that arrive between frames
+"""
+from PyQt6.QtCore import QObject, QTimer, Qt
+
+
+class UpdateBatcher(QObject):
+    def __init__(self, handlers, interval, parent=None):
+        """
+        Args:
+            handlers (dict): Topic -> callable applying the latest payload of that topic
+            interval (int): Minimum time between applied batches in milliseconds
+            parent (QObject): Qt parent
+        """
+        super().__init__(parent)
+        self.handlers = handlers
+        self.latest = {}
+
+        # Statistics
+        self.frames = 0
+        self.submitted = dict.fromkeys(handlers, 0)
+        self.applied = dict.fromkeys(handlers, 0)
+        self.coalesced = dict.fromkeys(handlers, 0)
+
+        # Armed only while updates are pending so an idle dashboard does not wake up
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.flush)
+
+    def set_interval(self, interval):
+        """Change the batch interval in milliseconds"""
+        self.timer.setInterval(interval)
+
+    def submit(self, topic, payload):
+        """Store the latest payload of a topic for the next batch"""
+        self.submitted[topic] += 1
+        if topic in self.latest:
+            # The previous payload would never have been seen
+            self.coalesced[topic] += 1
+        self.latest[topic] = payload
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def flush(self):
+        """
+        Apply every pending payload in a single pass; the update() calls of the handlers are
+        merged by Qt into one paint of just the changed regions
+        """
+        if not self.latest:
+            return
+        pending = self.latest
+        self.latest = {}
+        self.frames += 1
+        for topic, payload in pending.items():
+            self.handlers[topic](payload)
+            self.applied[topic] += 1
+
+    def stats(self):
+        """Return batch and coalescing counters"""
+        submitted = sum(self.submitted.values())
+        coalesced = sum(self.coalesced.values())
+        return {
+            "frames": self.frames,
+            "submitted": dict(self.submitted),
+            "applied": dict(self.applied),
+            "coalesced": dict(self.coalesced),
+            "coalesced_ratio": coalesced / submitted if submitted else 0.0,
+            "updates_per_frame": sum(self.applied.values()) / self.frames if self.frames else 0.0
+        }
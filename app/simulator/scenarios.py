@@ -0,0 +1,172 @@
+"""
+Simulated vehicle producing drive, charge and fault scenarios for the mock backend
+"""
+import math
+import random
+import time
+
+SCENARIOS = ("drive", "charge", "fault")
+
+# FAULT_SOURCES/FAULT_TYPES combinations the fault scenario raises
+FAULT_CASES = (
+    ("BATTERY", "TEMP_HIGH"),
+    ("MOTOR", "TEMP_HIGH"),
+    ("CHARGING", "COMM_ERROR"),
+    ("TIRE", "PRESSURE_LOW"),
+    ("POWER", "VOLTAGE_LOW")
+)
+
+
+class VehicleSimulator:
+    def __init__(self, scenario="drive", publish_rate=20.0, counter_gap_rate=0.0,
+                 seed=None, clock=time.monotonic):
+        """
+        Args:
+            scenario (str): One of SCENARIOS
+            publish_rate (float): Rate (Hz) at which the simulated vehicle publishes state
+            counter_gap_rate (float): Probability of skipping extra message_counter values
+            seed (int): Random seed for reproducible runs
+            clock (callable): Time source in seconds
+        """
+        if scenario not in SCENARIOS:
+            raise ValueError(f"Unknown scenario {scenario!r}, expected one of {SCENARIOS}")
+        self.scenario = scenario
+        self.publish_rate = publish_rate
+        self.counter_gap_rate = counter_gap_rate
+        self.random = random.Random(seed)
+        self.clock = clock
+        self.start_time = clock()
+
+        self.skipped_counters = 0
+        self.fault_started = None
+        self.fault_case = None
+        self.secondary_case = None
+        self.fault_duration = 0.0
+
+    def elapsed(self):
+        """Seconds since the simulation started"""
+        return self.clock() - self.start_time
+
+    def message_counter(self):
+        """16-bit counter advancing at the publish rate, with optional injected gaps"""
+        if self.counter_gap_rate and self.random.random() < self.counter_gap_rate:
+            self.skipped_counters += self.random.randint(1, 5)
+        published = int(self.elapsed() * self.publish_rate)
+        return (published + self.skipped_counters) % 65536
+
+    def noise(self, scale):
+        """Small random variation around a value"""
+        return self.random.uniform(-scale, scale)
+
+    def charge_percent(self):
+        """State of charge, falling while driving and rising with taper while charging"""
+        t = self.elapsed()
+        if self.scenario == "charge":
+            # Approaches 100% exponentially, starting from 20%
+            return round(100 - 80 * math.exp(-t / 1800), 1)
+        return round(max(5.0, 80 - t / 60), 1)
+
+    def vehicle_state(self):
+        """Payload of /vehicle_state"""
+        if self.scenario == "charge":
+            charge = self.charge_percent()
+            primary_state = "CHARGE"
+            sub_state = "COMPLETE" if charge >= 99.5 else "ACTIVE"
+            flags = ["CHARGING_CONNECTED", "BATTERY_OK", "SYSTEMS_CHECK_PASS"]
+        else:
+            # Alternate between driving and short stops
+            cycle = self.elapsed() % 120
+            primary_state = "PARK" if cycle > 110 else "DRIVE"
+            sub_state = "READY" if primary_state == "PARK" else "ACTIVE"
+            flags = ["MOTOR_READY", "BATTERY_OK", "SYSTEMS_CHECK_PASS"]
+            if primary_state == "PARK" and cycle > 115:
+                flags.append("DOOR_OPEN")
+        return {
+            "primary_state": primary_state,
+            "sub_state": sub_state,
+            "status_flags": flags,
+            "message_counter": self.message_counter()
+        }
+
+    def fault_status(self):
+        """Payload of /fault_status"""
+        if self.scenario != "fault":
+            return {"active": False}
+
+        t = self.elapsed()
+        # A fault is raised every 30s and lasts 5-15s
+        if self.fault_started is None and t % 30 < 1:
+            self.fault_started = t
+            self.fault_case, self.secondary_case = self.random.sample(FAULT_CASES, 2)
+            self.fault_duration = self.random.uniform(5, 15)
+        if self.fault_started is not None and t - self.fault_started > self.fault_duration:
+            self.fault_started = None
+        if self.fault_started is None:
+            return {"active": False}
+
+        # A second fault overlaps the middle third of the primary one
+        elapsed = t - self.fault_started
+        cases = [self.fault_case]
+        if self.fault_duration / 3 < elapsed < 2 * self.fault_duration / 3:
+            cases.append(self.secondary_case)
+        faults = [
+            {
+                "source": source,
+                "type": fault_type,
+                "severity": 2 if fault_type.startswith("TEMP") else 1,
+                "timestamp": int(elapsed * 1000)
+            }
+            for source, fault_type in cases
+        ]
+        primary = max(faults, key=lambda fault: fault["severity"])
+        return dict(primary, active=True, faults=faults)
+
+    def powertrain(self):
+        """Payload of /metrics/powertrain"""
+        t = self.elapsed()
+        if self.scenario == "charge":
+            charge = self.charge_percent()
+            # Constant power until 80%, then tapering
+            rate = 150.0 if charge < 80 else 150.0 * (100 - charge) / 20
+            return {
+                "charge_percent": charge,
+                "charging_rate": round(max(rate, 0.0) + self.noise(1.0), 1),
+                "power_output": 0.0,
+                "motor_temp": round(30 + self.noise(0.5), 1),
+                "battery_temp": round(30 + 10 * (1 - math.exp(-t / 600)) + self.noise(0.3), 1),
+                "inverter_temp": round(32 + self.noise(0.5), 1)
+            }
+
+        power = 60 + 50 * math.sin(t / 8) + self.noise(5)
+        motor_temp = 45 + 35 * (1 - math.exp(-t / 300)) + self.noise(0.5)
+        if self.scenario == "fault" and self.fault_case == ("MOTOR", "TEMP_HIGH") \
+                and self.fault_started is not None:
+            motor_temp += 15
+        return {
+            "charge_percent": self.charge_percent(),
+            "charging_rate": 0.0,
+            "power_output": round(max(power, 0.0), 1),
+            "motor_temp": round(motor_temp, 1),
+            "battery_temp": round(28 + 12 * (1 - math.exp(-t / 600)) + self.noise(0.3), 1),
+            "inverter_temp": round(40 + 20 * (1 - math.exp(-t / 400)) + self.noise(0.5), 1),
+            "brake_temp": round(90 + 40 * abs(math.sin(t / 20)) + self.noise(2), 1)
+        }
+
+    def tires(self):
+        """Payload of /metrics/tires (front left, front right, rear left, rear right)"""
+        t = self.elapsed()
+        warm = 0.0 if self.scenario == "charge" else 35 * (1 - math.exp(-t / 400))
+        temps = [round(25 + warm + offset + self.noise(0.4), 1) for offset in (0, 1.5, -1, 0.5)]
+        pressures = [round(32 + warm / 10 + self.noise(0.1), 1) for _ in range(4)]
+        if self.scenario == "fault" and self.fault_case == ("TIRE", "PRESSURE_LOW") \
+                and self.fault_started is not None:
+            pressures[2] = round(pressures[2] - 6, 1)
+        return {"tire_temp": temps, "tire_pressure": pressures}
+
+    def vehicle_data(self):
+        """Payload of /vehicle_data combining all topics"""
+        data = self.powertrain()
+        data.update(self.tires())
+        data["vehicle_state"] = self.vehicle_state()
+        data["fault_status"] = self.fault_status()
+        return data
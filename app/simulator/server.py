@@ -0,0 +1,177 @@
+"""
+Local mock of the backend REST API, serving simulated vehicle data
+
+Run from the project root:
+    python -m app.simulator.server --scenario drive --latency 20 --jitter 5 --drop-rate 0.01
+"""
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse
+
+from ..utils.constants import API_BASE_URL, API_ENDPOINTS, WIRE_FORMAT
+from ..services.binary_codec import encode_payload
+from ..services.payloads import VehicleMetrics, VehicleState, FaultStatus
+from .scenarios import VehicleSimulator, SCENARIOS
+
+# Endpoint path -> (simulator method, payload type for binary encoding)
+ROUTES = {
+    API_ENDPOINTS["vehicle_data"]: ("vehicle_data", VehicleMetrics),
+    API_ENDPOINTS["vehicle_state"]: ("vehicle_state", VehicleState),
+    API_ENDPOINTS["fault_status"]: ("fault_status", FaultStatus),
+    API_ENDPOINTS["metrics"]["powertrain"]: ("powertrain", VehicleMetrics),
+    API_ENDPOINTS["metrics"]["tires"]: ("tires", VehicleMetrics)
+}
+
+
+class MockBackendServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, simulator, latency=0.0, jitter=0.0, drop_rate=0.0,
+                 payload_size=0, allow_binary=True, seed=None):
+        """
+        Args:
+            address (tuple): (host, port) to listen on
+            simulator (VehicleSimulator): Source of payloads
+            latency (float): Base response delay in milliseconds
+            jitter (float): Maximum random deviation from the base delay in milliseconds
+            drop_rate (float): Probability of answering 503 instead of data
+            payload_size (int): Minimum response body size in bytes, padded if smaller
+            allow_binary (bool): Answer in the binary format when the client prefers it
+            seed (int): Random seed for latency and drop decisions
+        """
+        super().__init__(address, MockBackendHandler)
+        self.simulator = simulator
+        self.latency = latency
+        self.jitter = jitter
+        self.drop_rate = drop_rate
+        self.payload_size = payload_size
+        self.allow_binary = allow_binary
+        self.random = random.Random(seed)
+
+        # Simulator state is shared between handler threads
+        self.lock = threading.Lock()
+        self.served = 0
+        self.dropped = 0
+
+    def next_delay(self):
+        """Response delay in seconds for the next request"""
+        with self.lock:
+            delay = self.latency + self.random.uniform(-self.jitter, self.jitter)
+        return max(delay, 0.0) / 1000
+
+    def should_drop(self):
+        """Decide whether the next request is dropped"""
+        with self.lock:
+            drop = self.drop_rate > 0 and self.random.random() < self.drop_rate
+            if drop:
+                self.dropped += 1
+            return drop
+
+    def build_body(self, method, payload_type, binary):
+        """Produce an encoded response body for an endpoint"""
+        with self.lock:
+            data = getattr(self.simulator, method)()
+            self.served += 1
+
+        if binary:
+            body = encode_payload(payload_type.from_dict(data))
+            if len(body) < self.payload_size:
+                # Decoders read the fixed layout and ignore trailing bytes
+                body += bytes(self.payload_size - len(body))
+            return body
+
+        body = json.dumps(data).encode()
+        if len(body) < self.payload_size:
+            data["padding"] = ""
+            overhead = len(json.dumps(data).encode())
+            data["padding"] = "x" * max(self.payload_size - overhead, 0)
+            body = json.dumps(data).encode()
+        return body
+
+
+class MockBackendHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        """Serve a simulated payload for a known endpoint"""
+        route = ROUTES.get(urlparse(self.path).path)
+        if route is None:
+            self.send_error(404, "Unknown endpoint")
+            return
+
+        time.sleep(self.server.next_delay())
+        if self.server.should_drop():
+            self.send_error(503, "Simulated drop")
+            return
+
+        accept = self.headers.get("Accept", "")
+        binary = self.server.allow_binary and WIRE_FORMAT["binary_content_type"] in accept
+        method, payload_type = route
+        body = self.server.build_body(method, payload_type, binary)
+
+        content_type = (
+            WIRE_FORMAT["binary_content_type"] if binary else WIRE_FORMAT["json_content_type"]
+        )
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Route request logging through the logging module"""
+        logging.getLogger(__name__).debug(format, *args)
+
+
+def main():
+    default_url = urlparse(API_BASE_URL)
+    parser = argparse.ArgumentParser(description="Mock vehicle backend")
+    parser.add_argument("--host", default=default_url.hostname)
+    parser.add_argument("--port", type=int, default=default_url.port)
+    parser.add_argument("--scenario", choices=SCENARIOS, default="drive")
+    parser.add_argument("--publish-rate", type=float, default=20.0,
+                        help="Rate (Hz) at which message_counter advances")
+    parser.add_argument("--counter-gap-rate", type=float, default=0.0,
+                        help="Probability of injecting extra message_counter gaps")
+    parser.add_argument("--latency", type=float, default=0.0, help="Response delay (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Delay jitter (ms)")
+    parser.add_argument("--drop-rate", type=float, default=0.0,
+                        help="Probability of answering 503")
+    parser.add_argument("--payload-size", type=int, default=0,
+                        help="Pad response bodies to at least this many bytes")
+    parser.add_argument("--json-only", action="store_true",
+                        help="Never answer in the binary format")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    simulator = VehicleSimulator(
+        scenario=args.scenario,
+        publish_rate=args.publish_rate,
+        counter_gap_rate=args.counter_gap_rate,
+        seed=args.seed
+    )
+    server = MockBackendServer(
+        (args.host, args.port), simulator,
+        latency=args.latency,
+        jitter=args.jitter,
+        drop_rate=args.drop_rate,
+        payload_size=args.payload_size,
+        allow_binary=not args.json_only,
+        seed=args.seed
+    )
+    logging.info(f"Serving {args.scenario} scenario on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        logging.info(f"Served {server.served} payloads, dropped {server.dropped}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 """
 Application-wide constants and configuration for the infotainment dashboard
 """
+import os
+import tempfile
 
 # API Configuration
 API_BASE_URL = "http://localhost:8000"
@@ -14,6 +16,13 @@ API_ENDPOINTS = {
     }
 }
 
+# Wire format negotiation
+WIRE_FORMAT = {
+    "prefer_binary": False,     # Ask the backend for the binary telemetry format
+    "binary_content_type": "application/x-vehicle-telemetry",
+    "json_content_type": "application/json"
+}
+
 # Update intervals (in milliseconds)
 UPDATE_INTERVALS = {
     "vehicle_state": 100,    # 100ms for state updates
@@ -21,6 +30,164 @@ UPDATE_INTERVALS = {
     "metrics": 200          # 200ms for general metrics
 }
 
+# Message counter sequence tracking
+SEQUENCE_TRACKING = {
+    "counter_modulus": 65536,   # message_counter is 16-bit
+    "window_size": 200,         # Observations in the rolling loss window
+    "max_gap": 1000,            # Larger jumps are treated as a backend restart
+    "min_samples": 20,          # Observations needed before acting on loss rate
+    "loss_threshold": 0.05,     # Loss rate considered persistent
+    "recover_threshold": 0.01,  # Loss rate at which the normal interval returns
+    "boost_interval": 50,       # State poll interval (ms) while loss persists
+    "resync_on_gap": False,     # Fetch a full vehicle_data snapshot after a gap
+    "resync_cooldown": 1000     # Minimum time (ms) between resync requests
+}
+
+# UI update batching
+UI_UPDATES = {
+    "batching": True,           # Coalesce data updates and apply them once per frame
+    "ui_rate": 0,               # Batches per second, 0 follows the display refresh rate
+    "max_ui_rate": 60,          # Upper bound when following the display refresh rate
+    "stats_interval": 30000     # Coalescing statistics log interval (ms), 0 disables
+}
+
+# Metric trend sparklines
+TREND_HISTORY = {
+    "capacity": 300,            # Samples kept per series (60s of 200ms metrics updates)
+    "height": 20                # Sparkline height in pixels
+}
+
+# Per-tire state
+TIRE_STATE = {
+    "corners": ("FL", "FR", "RL", "RR"),    # Order of the four-corner arrays
+    "average_window": 10,       # Samples in the rolling average per corner
+    "trend_deadband": 1.0       # Distance from the average before a corner shows a trend
+}
+
+# Charging sessions
+CHARGING = {
+    "battery_capacity": 75.0,   # Usable battery capacity (kWh)
+    "efficiency": 3.8,          # Driving efficiency (mi/kWh) used for the range estimate
+    "target_percent": 100,      # Charge level the time remaining counts down to
+    "regression_window": 120,   # Seconds of charge history in the rate regression
+    "min_samples": 5,           # Samples before the regression replaces the power estimate
+    "popup_interval": 2000      # ChargingPopup refresh interval (ms)
+}
+
+# Drop area tiling templates: widget count -> spec (see app/utils/layout_engine.py)
+LAYOUT_TEMPLATES = {
+    "standard": {
+        1: None,
+        2: ("columns", (1, 1)),
+        3: ("columns", (1, 1, 1))
+    },
+    "large": {                  # Larger displays
+        1: None,
+        2: ("columns", (1, 1)),
+        3: ("columns", (2, 1), (None, ("rows", (1, 1)))),
+        4: ("grid", (1, 1), (1, 1)),
+        6: ("grid", (1, 1), (1, 1, 1))
+    }
+}
+
+DROP_LAYOUT = {
+    "templates": "standard",    # LAYOUT_TEMPLATES entry in use
+    "removal_zone": 0.15        # Top fraction of the area where dropping a widget removes it
+}
+
+# Playback of telemetry recordings (--replay)
+REPLAY = {
+    "max_gap": 2.0              # Longest pause (s) replayed between records, e.g. between sessions
+}
+
+# Backend polling in a separate process (--acquisition-process)
+ACQUISITION = {
+    "poll_interval": 16,        # Shared-memory snapshot read interval (ms), about one frame
+    "slot_size": 1024,          # Largest binary-encoded payload a snapshot slot holds (bytes)
+    "read_retries": 3,          # Attempts per topic and frame when a read overlaps a write
+    "stop_check": 200,          # Interval (ms) at which the process checks for shutdown
+    "stop_timeout": 2000,       # Wait (ms) for a clean exit before terminating the process
+    "restart_delay": 1000       # Delay (ms) before restarting a process that exited
+}
+
+# Local pub/sub bus republishing decoded telemetry to other apps (--bus)
+TELEMETRY_BUS = {
+    # Unix-domain socket path, in the per-user runtime directory rather than shared /tmp
+    "path": os.path.join(os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir(),
+                         "infotainment_telemetry.sock"),
+    "max_backlog": 262144,      # Unsent bytes per subscriber before its frames are dropped
+    "max_pending": 4096,        # Payloads queued for the bus thread before the oldest are dropped
+    "close_timeout": 5          # Seconds close() waits for the bus thread to finish
+}
+
+# Drive session export of every decoded sample to columnar files (--session)
+SESSION_RECORDING = {
+    "directory": "~/.local/share/infotainment_dashboard/sessions",  # One subdirectory per session
+    "format": "auto",           # csv, parquet (needs pyarrow) or auto for parquet when available
+    "batch_size": 256,          # Samples handed to the writer thread at once
+    "flush_interval": 1000,     # Maximum time (ms) samples wait before being handed over
+    "queue_batches": 64,        # Batches waiting for the writer before new ones are dropped
+    "chunk_rows": 100000,       # Rows per file before the next chunk file is started
+    "parquet_chunk_age": 60,    # Seconds a Parquet chunk stays open; unreadable until closed
+    "close_timeout": 5          # Seconds close() waits for the writer thread to finish
+}
+
+# Windows opened with --displays, all fed by one shared DataService through a DataHub
+DISPLAYS = {
+    "center": {
+        "screen": 0,            # Index into QApplication.screens()
+        "topics": ("vehicle_data", "vehicle_state", "fault_status")
+    },
+    "cluster": {
+        "screen": 1,
+        "topics": ("vehicle_state", "fault_status")
+    }
+}
+
+# Drop area layout persistence
+LAYOUT_STATE = {
+    "path": "~/.config/infotainment_dashboard/layout.json",
+    "save_delay": 500           # Quiet time (ms) after a layout change before it is written
+}
+
+# Fault debouncing before UI dispatch
+FAULT_DEBOUNCE = {
+    "enabled": True,
+    "times": {                  # (assert ms, clear ms) per FAULT_SOURCES key
+        "BATTERY": (500, 2000),
+        "MOTOR": (300, 1500),
+        "CHARGING": (1000, 3000),
+        "TIRE": (1000, 5000),   # Pressure readings chatter around the limits
+        "POWER": (200, 1000)
+    },
+    "default_times": (300, 1500),   # Sources missing from times
+    "flap_window": 60000,       # Window (ms) raw transitions are counted over
+    "flap_threshold": 10        # Transitions within the window logged as flapping
+}
+
+# Concurrent fault display
+FAULT_QUEUE = {
+    "max_rows": 4               # Faults listed in FaultWidget, most severe first
+}
+
+# Fault history
+FAULT_HISTORY = {
+    "capacity": 1000,           # Events kept in memory
+    "batch_size": 50,           # Changed events written per SQLite transaction
+    "flush_interval": 2000,     # Maximum time (ms) changes wait before being written
+    "view_limit": 200,          # Events listed in the fault history view
+    "view_refresh": 1000        # Fault history view refresh interval (ms)
+}
+
+# Data-to-pixel latency tracing
+LATENCY_TRACING = {
+    "enabled": False,           # Instrumentation hooks are no-ops when disabled
+    "window_size": 500,         # Samples kept per topic and stage
+    "overlay": True,            # Show the on-screen debug overlay while tracing
+    "overlay_interval": 1000,   # Overlay refresh interval (ms)
+    "log_interval": 10000       # Summary log interval (ms), 0 disables logging
+}
+
 # Colors
 COLORS = {
     "BACKGROUND": "rgba(255, 255, 255, 0.85)",
@@ -37,51 +204,323 @@ COLORS = {
     "FAULT_CLEARED": "#4CAF50"    # Green
 }
 
-# Widget Styles
+# Theme engine
+THEME = {
+    "default": "day",
+    "mode": "manual",           # manual, clock (day_start/night_start) or ambient (light level)
+    "background": "assets/modern_sports_car_offcenter_right.jpg",
+    "blur_radius": 10,          # Blur of the background behind widgets
+    "brightness": {             # Background brightness factor per theme
+        "day": 1.0,
+        "night": 0.45
+    },
+    "day_start": "07:00",       # Local time the clock mode switches to day
+    "night_start": "19:00",     # Local time the clock mode switches to night
+    "clock_interval": 60000,    # Clock mode check interval (ms)
+    "ambient_night": 50,        # Ambient light (lux) below which the ambient mode turns night
+    "ambient_day": 200,         # Ambient light (lux) above which it returns to day
+    "pixmap_cache": 8,          # Scaled background pixmaps kept (theme, variant, size)
+    "frame_budget": 16,         # Switches slower than this (ms) are logged as warnings
+    "toggle_shortcut": "Ctrl+T" # Manual day/night toggle
+}
+
+# Theme palettes; the style sheet templates below reference their keys as $NAME, painted
+# widgets read the TILE_* and DIAGRAM_* colors
+
+THEMES = {
+    "day": dict(COLORS, **{
+        "WINDOW": "white",
+        "SURFACE": "rgba(255, 255, 255, 0.9)",      # Widget cards
+        "SURFACE_BORDER": "rgba(0, 0, 0, 0.1)",
+        "OVERLAY": "rgba(0, 0, 0, 0.05)",           # Backdrop of the state label
+        "DIVIDER": "rgba(0, 0, 0, 0.1)",
+        "TEXT_MUTED": "#666666",
+        "BAR": COLORS["BACKGROUND"],                # Bottom app bar
+        "BUTTON": "rgba(255, 255, 255, 0.1)",
+        "BUTTON_HOVER": "rgba(255, 255, 255, 0.2)",
+        "BUTTON_HOVER_BORDER": "rgba(255, 255, 255, 0.3)",
+        "BUTTON_PRESSED": "rgba(255, 255, 255, 0.15)",
+        "BUTTON_TEXT": "white",
+        "POPUP": "rgba(0, 0, 0, 0.9)",
+        "POPUP_BORDER": "rgba(255, 255, 255, 0.1)",
+        "POPUP_TEXT": "white",
+        "POPUP_CLOSE_HOVER": "#ff4444",
+        "PROGRESS": "#2196F3",
+        "PROGRESS_TRACK": "rgba(255, 255, 255, 0.1)",
+        "STATUS_TEXT": "white",
+        "STATUS": "rgba(0, 0, 0, 0.7)",
+        "STATUS_CONNECTED": "rgba(0, 150, 0, 0.7)",
+        "STATUS_LOST": "rgba(200, 0, 0, 0.7)",
+        "FLAG": "rgba(0, 0, 0, 0.1)",
+        "FLAG_TEXT": "#333333",
+        "FLAG_MOTOR_READY": "rgba(76, 175, 80, 0.2)",
+        "FLAG_MOTOR_READY_TEXT": "#2E7D32",
+        "FLAG_BATTERY_OK": "rgba(33, 150, 243, 0.2)",
+        "FLAG_BATTERY_OK_TEXT": "#1565C0",
+        "FLAG_CHARGING": "rgba(156, 39, 176, 0.2)",
+        "FLAG_CHARGING_TEXT": "#7B1FA2",
+        "FAULT_BACKGROUND": "rgba(255, 152, 0, 0.1)",
+        "CRITICAL_BACKGROUND": "rgba(244, 67, 54, 0.1)",
+        "TILE": "rgba(255, 255, 255, 0.7)",
+        "TILE_NORMAL": "rgba(76, 175, 80, 0.1)",
+        "TILE_WARNING": "rgba(255, 152, 0, 0.1)",
+        "TILE_CRITICAL": "rgba(244, 67, 54, 0.1)",
+        "DIAGRAM_BODY": "rgba(0, 0, 0, 0.08)",
+        "DIAGRAM_OUTLINE": "rgba(0, 0, 0, 0.24)"
+    })
+}
+
+THEMES["night"] = dict(THEMES["day"], **{
+    "BACKGROUND": "rgba(18, 18, 24, 0.85)",
+    "BORDER": "rgba(255, 255, 255, 0.12)",
+    "TEXT": "#E0E0E0",
+    "PARK": "#64B5F6",
+    "DRIVE": "#81C784",
+    "REVERSE": "#FFD54F",
+    "CHARGE": "#CE93D8",
+    "WINDOW": "#101014",
+    "SURFACE": "rgba(30, 30, 38, 0.9)",
+    "SURFACE_BORDER": "rgba(255, 255, 255, 0.12)",
+    "OVERLAY": "rgba(255, 255, 255, 0.06)",
+    "DIVIDER": "rgba(255, 255, 255, 0.12)",
+    "TEXT_MUTED": "#9E9E9E",
+    "BAR": "rgba(18, 18, 24, 0.85)",
+    "BUTTON_HOVER": "rgba(255, 255, 255, 0.15)",
+    "FLAG": "rgba(255, 255, 255, 0.08)",
+    "FLAG_TEXT": "#E0E0E0",
+    "FLAG_MOTOR_READY_TEXT": "#A5D6A7",
+    "FLAG_BATTERY_OK_TEXT": "#90CAF9",
+    "FLAG_CHARGING_TEXT": "#CE93D8",
+    "FAULT_BACKGROUND": "rgba(255, 152, 0, 0.15)",
+    "CRITICAL_BACKGROUND": "rgba(244, 67, 54, 0.18)",
+    "TILE": "rgba(40, 40, 50, 0.7)",
+    "TILE_NORMAL": "rgba(76, 175, 80, 0.18)",
+    "TILE_WARNING": "rgba(255, 152, 0, 0.18)",
+    "TILE_CRITICAL": "rgba(244, 67, 54, 0.2)",
+    "DIAGRAM_BODY": "rgba(255, 255, 255, 0.08)",
+    "DIAGRAM_OUTLINE": "rgba(255, 255, 255, 0.24)"
+})
+
+# Style sheet templates, joined and filled with a theme palette into one application style sheet.
+# Widgets are matched by object name and restyled through dynamic properties, never per instance
 STYLES = {
     "main_window": """
         QMainWindow {
-            background-color: white;
+            background-color: $WINDOW;
+        }
+
+        QLabel {
+            color: $TEXT;
+        }
+
+        QFrame#divider {
+            background-color: $DIVIDER;
+        }
+
+        QFrame#drop_area {
+            background-color: transparent;
+            border: none;
+        }
+
+        QFrame#bottom_bar {
+            background-color: $BAR;
+            border-top: 1px solid $BORDER;
+        }
+
+        QLabel#connection_status {
+            background-color: $STATUS;
+            color: $STATUS_TEXT;
+            padding: 5px;
+            border-radius: 3px;
+        }
+
+        QLabel#connection_status[connected="true"] {
+            background-color: $STATUS_CONNECTED;
+        }
+
+        QLabel#connection_status[connected="false"] {
+            background-color: $STATUS_LOST;
+        }
+
+        QLabel#latency_overlay {
+            background-color: rgba(0, 0, 0, 0.6);
+            color: #7CFC00;
+            font-family: monospace;
+            font-size: 11px;
+            padding: 4px;
+            border-radius: 3px;
         }
     """,
-    
+
+    "app_button": """
+        QPushButton#app_button {
+            background-color: $BUTTON;
+            border: 1px solid $BORDER;
+            border-radius: 10px;
+        }
+
+        QPushButton#app_button:hover {
+            background-color: $BUTTON_HOVER;
+            border: 1px solid $BUTTON_HOVER_BORDER;
+        }
+
+        QPushButton#app_button:pressed {
+            background-color: $BUTTON_PRESSED;
+        }
+
+        QPushButton#app_button QLabel {
+            color: $BUTTON_TEXT;
+            font-size: 11px;
+        }
+    """,
+
     "vehicle_widget": """
-        QWidget {
-            background-color: rgba(255, 255, 255, 0.9);
-            border: 1px solid rgba(0, 0, 0, 0.1);
+        QWidget#vehicle_widget, QWidget#spec_widget, QWidget#fault_history_view,
+        QWidget#draggable_widget {
+            background-color: $SURFACE;
+            border: 1px solid $SURFACE_BORDER;
             border-radius: 10px;
         }
+
+        QLabel#card_header {
+            font-size: 18px;
+            font-weight: bold;
+        }
+
+        QWidget#fault_history_view QComboBox, QWidget#fault_history_view QTableWidget {
+            background-color: $SURFACE;
+            color: $TEXT;
+            border: 1px solid $SURFACE_BORDER;
+        }
+
+        QWidget#drag_header {
+            background-color: $DIVIDER;
+            border-top-left-radius: 10px;
+            border-top-right-radius: 10px;
+        }
+
+        QLabel#drag_title {
+            font-weight: bold;
+        }
     """,
-    
+
     "state_widget": """
-        QWidget {
-            background-color: transparent;
-        }
-        
         QLabel#state_label {
             font-size: 24px;
             font-weight: bold;
+            color: $TEXT;
+            padding: 5px;
+            border-radius: 5px;
+            background-color: $OVERLAY;
         }
-        
+
+        QLabel#state_label[state="PARK"] { color: $PARK; }
+        QLabel#state_label[state="DRIVE"] { color: $DRIVE; }
+        QLabel#state_label[state="REVERSE"] { color: $REVERSE; }
+        QLabel#state_label[state="CHARGE"] { color: $CHARGE; }
+
         QLabel#substate_label {
             font-size: 16px;
-            color: #666;
+            color: $TEXT_MUTED;
+            padding: 3px;
+        }
+
+        QLabel#status_flag {
+            background-color: $FLAG;
+            color: $FLAG_TEXT;
+            border-radius: 4px;
+            padding: 4px 8px;
+            font-size: 11px;
+        }
+
+        QLabel#status_flag[flag="MOTOR_READY"] {
+            background-color: $FLAG_MOTOR_READY;
+            color: $FLAG_MOTOR_READY_TEXT;
+        }
+
+        QLabel#status_flag[flag="BATTERY_OK"] {
+            background-color: $FLAG_BATTERY_OK;
+            color: $FLAG_BATTERY_OK_TEXT;
+        }
+
+        QLabel#status_flag[flag="CHARGING_CONNECTED"] {
+            background-color: $FLAG_CHARGING;
+            color: $FLAG_CHARGING_TEXT;
         }
     """,
-    
+
     "fault_widget": """
-        QWidget {
+        QWidget#fault_widget {
             background-color: transparent;
         }
-        
+
+        QWidget#fault_widget[level="fault"] {
+            background-color: $FAULT_BACKGROUND;
+        }
+
+        QWidget#fault_widget[level="critical"] {
+            background-color: $CRITICAL_BACKGROUND;
+        }
+
         QLabel#fault_header {
             font-size: 16px;
             font-weight: bold;
         }
-        
+
         QLabel#fault_active {
             font-size: 14px;
+            font-weight: bold;
             margin: 5px;
+            color: $FAULT_CLEARED;
+        }
+
+        QLabel#fault_active[active="true"] {
+            color: $FAULT_ACTIVE;
+        }
+    """,
+
+    "charging_popup": """
+        QFrame#charging_popup {
+            background-color: $POPUP;
+            border: 1px solid $POPUP_BORDER;
+            border-radius: 10px;
+        }
+
+        QFrame#charging_popup QLabel {
+            color: $POPUP_TEXT;
+        }
+
+        QLabel#popup_title {
+            font-size: 18px;
+            font-weight: bold;
+        }
+
+        QLabel#charge_percentage {
+            font-size: 48px;
+            font-weight: bold;
+        }
+
+        QPushButton#popup_close {
+            color: $POPUP_TEXT;
+            background: transparent;
+            border: none;
+            font-size: 20px;
+            padding: 5px;
+        }
+
+        QPushButton#popup_close:hover {
+            color: $POPUP_CLOSE_HOVER;
+        }
+
+        QProgressBar#charge_progress {
+            border: 2px solid $PROGRESS;
+            border-radius: 5px;
+            text-align: center;
+            background-color: $PROGRESS_TRACK;
+        }
+
+        QProgressBar#charge_progress::chunk {
+            background-color: $PROGRESS;
         }
     """
 }
@@ -160,5 +599,35 @@ WARNING_THRESHOLDS = {
     "motor_temp": {"warning": 70, "critical": 85},
     "tire_temp": {"warning": 70, "critical": 80},
     "tire_pressure": {"warning": 35, "critical": 38},
+    "tire_pressure_low": {"warning": 30, "critical": 28},
     "charge_percent": {"warning": 20, "critical": 10}
-}
\ No newline at end of file
+}
+
+# Quantized value formatting (app/utils/value_format.py)
+FORMAT_CACHE = {
+    "size": 256                 # Rendered strings kept per field before the cache is reset
+}
+
+# Declarative metric widgets (see app/utils/widget_spec.py); units default to METRIC_UNITS
+# and thresholds to WARNING_THRESHOLDS
+WIDGET_SPECS = {
+    "Vehicle Info": {
+        "topic": "vehicle_data",
+        "title": "Vehicle Information",
+        "sections": (
+            ("Powertrain", (
+                {"key": "charge_percent", "name": "Battery", "step": 1},
+                {"key": "power_output", "name": "Power", "step": 0.1, "trend": True},
+                {"key": "motor_temp", "name": "Motor", "step": 0.1, "trend": True},
+                {"key": "battery_temp", "name": "Battery", "step": 0.1, "trend": True}
+            )),
+            ("Tires", (
+                # Tire severity comes from the per-corner TireState instead
+                {"key": "tire_temp", "name": "Temperature", "step": 0.1, "series": 4,
+                 "trend": True, "thresholds": None},
+                {"key": "tire_pressure", "name": "Pressure", "step": 0.1, "series": 4,
+                 "trend": True, "thresholds": None, "template": "{name}: {value} {unit}"}
+            ))
+        )
+    }
+}
@@ -1,23 +1,28 @@
-from PIL import Image, ImageFilter
-from PyQt6.QtGui import QImage, QPixmap
-import io
+from PIL import Image, ImageEnhance, ImageFilter
+from PyQt6.QtGui import QImage
 
 
-def create_blurred_background(image_path, blur_radius=10):
+def create_background_variants(image_path, blur_radius=10, brightness=1.0):
     """
-    Creates a blurred version of the input image
+    Creates the normal and blurred background of one theme; safe to run off the UI thread
     Args:
         image_path (str): Path to the source image
-        blur_radius (int): Radius of the Gaussian blur (default: 10)
+        blur_radius (int): Radius of the Gaussian blur of the blurred variant
+        brightness (float): Brightness factor applied to both variants, 1.0 keeps the image
     Returns:
-        QPixmap: Blurred image as a QPixmap
+        tuple: (normal, blurred) QImages
     """
     with Image.open(image_path) as img:
-        # Apply gaussian blur
+        img = img.convert("RGB")
+        if brightness != 1.0:
+            img = ImageEnhance.Brightness(img).enhance(brightness)
         blurred = img.filter(ImageFilter.GaussianBlur(radius=blur_radius))
-        
-        # Convert PIL image back to QPixmap
-        byte_array = io.BytesIO()
-        blurred.save(byte_array, format='PNG')
-        qimg = QImage.fromData(byte_array.getvalue())
-        return QPixmap.fromImage(qimg)
\ No newline at end of file
+        return to_qimage(img), to_qimage(blurred)
+
+
+def to_qimage(img):
+    """Copy an RGB PIL image into a QImage without an encode/decode round trip"""
+    data = img.tobytes("raw", "RGB")
+    qimg = QImage(data, img.width, img.height, 3 * img.width, QImage.Format.Format_RGB888)
+    # The QImage only wraps the bytes until copied
+    return qimg.copy()
@@ -0,0 +1,149 @@
+"""
+Tiling layout templates for the drop area with precomputed drop-point slot lookup
+
+A template spec is a nested tuple:
+    None                                    a single slot
+    ("columns", weights[, children])        side-by-side split, one child spec per weight
+    ("rows", weights[, children])           stacked split, one child spec per weight
+    ("grid", row_weights, column_weights)   rows sharing the same column weights
+Children default to single slots. Slots are numbered in spec order.
+"""
+from bisect import bisect_right
+from fractions import Fraction
+
+# Grid stretch factors are relative widths scaled to integers
+STRETCH_SCALE = 1000
+
+
+class LayoutTemplate:
+    def __init__(self, spec):
+        """
+        Args:
+            spec (tuple): Template spec, see the module docstring
+        """
+        self.spec = spec
+        # (left, top, right, bottom) per slot as exact fractions of the area
+        self.slots = []
+        self._compile(spec, Fraction(0), Fraction(0), Fraction(1), Fraction(1))
+        self._build_index()
+        self._build_grid()
+
+    def __len__(self):
+        return len(self.slots)
+
+    def _compile(self, spec, left, top, right, bottom):
+        """Recursively split the rectangle into slots"""
+        if spec is None:
+            self.slots.append((left, top, right, bottom))
+            return
+        kind = spec[0]
+        if kind == "grid":
+            row_weights, column_weights = spec[1], spec[2]
+            spec = ("rows", row_weights, [("columns", column_weights)] * len(row_weights))
+            kind = "rows"
+        if kind not in ("rows", "columns"):
+            raise ValueError(f"Unknown layout split {kind!r}")
+
+        weights = spec[1]
+        children = spec[2] if len(spec) > 2 else [None] * len(weights)
+        if len(children) != len(weights) or not weights or min(weights) <= 0:
+            raise ValueError(f"Invalid layout split {spec!r}")
+
+        total = sum(Fraction(weight) for weight in weights)
+        start = Fraction(0)
+        for weight, child in zip(weights, children):
+            end = start + Fraction(weight) / total
+            if kind == "columns":
+                width = right - left
+                self._compile(child, left + start * width, top, left + end * width, bottom)
+            else:
+                height = bottom - top
+                self._compile(child, left, top + start * height, right, top + end * height)
+            start = end
+
+    def _build_index(self):
+        """
+        Precompute vertical bands between slot edges, each with its slots sorted by top edge,
+        so a point resolves with two binary searches
+        """
+        edges = sorted({slot[0] for slot in self.slots} | {slot[2] for slot in self.slots})
+        edge_index = {edge: index for index, edge in enumerate(edges)}
+        covering = [[] for _ in edges[1:]]
+        # Each slot joins only the bands between its own left and right edges
+        for index, (left, top, right, _) in enumerate(self.slots):
+            for band in range(edge_index[left], edge_index[right]):
+                covering[band].append((top, index))
+
+        self.band_edges = [float(edge) for edge in edges[:-1]]
+        self.bands = []
+        for band in covering:
+            band.sort()
+            self.bands.append(([float(top) for top, _ in band], [index for _, index in band]))
+
+    def slot_at(self, x, y):
+        """
+        Slot containing a point in O(log n)
+        Args:
+            x (float): Horizontal position as a fraction of the area width
+            y (float): Vertical position as a fraction of the area height
+        Returns:
+            int: Slot index; points outside the area resolve to the nearest edge slot
+        """
+        band = max(bisect_right(self.band_edges, x) - 1, 0)
+        tops, indexes = self.bands[band]
+        return indexes[max(bisect_right(tops, y) - 1, 0)]
+
+    def _build_grid(self):
+        """Map slots onto QGridLayout cells with row and column stretch factors"""
+        columns = sorted({slot[0] for slot in self.slots} | {slot[2] for slot in self.slots})
+        rows = sorted({slot[1] for slot in self.slots} | {slot[3] for slot in self.slots})
+        column_index = {edge: index for index, edge in enumerate(columns)}
+        row_index = {edge: index for index, edge in enumerate(rows)}
+
+        # (row, column, row span, column span) per slot
+        self.cells = [
+            (row_index[top], column_index[left],
+             row_index[bottom] - row_index[top], column_index[right] - column_index[left])
+            for left, top, right, bottom in self.slots
+        ]
+        self.column_stretch = [
+            max(round((end - start) * STRETCH_SCALE), 1) for start, end in zip(columns, columns[1:])
+        ]
+        self.row_stretch = [
+            max(round((end - start) * STRETCH_SCALE), 1) for start, end in zip(rows, rows[1:])
+        ]
+
+
+class LayoutEngine:
+    def __init__(self, templates):
+        """
+        Args:
+            templates (dict): Widget count -> template spec
+        """
+        self.specs = dict(templates)
+        self.max_slots = max(self.specs)
+        self.templates = {}
+
+    def template(self, count):
+        """
+        Compiled template for a widget count, cached after first use
+        Args:
+            count (int): Number of widgets shown
+        Returns:
+            LayoutTemplate: Template with at least count slots
+        """
+        template = self.templates.get(count)
+        if template is None:
+            available = [n for n in self.specs if n >= count]
+            if not available:
+                raise ValueError(f"No layout template for {count} widgets")
+            template = LayoutTemplate(self.specs[min(available)])
+            if len(template) < count:
+                raise ValueError(f"Layout template for {min(available)} widgets has "
+                                 f"only {len(template)} slots")
+            self.templates[count] = template
+        return template
+
+    def drop_slot(self, count, x, y):
+        """Slot a widget dropped at (x, y) takes when count widgets will be shown"""
+        return self.template(count).slot_at(x, y)
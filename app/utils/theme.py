@@ -0,0 +1,111 @@
+"""
+Application-wide style sheet built once per theme from the STYLES templates
+
+Components no longer carry their own style sheets. They set an object name, and where their
+look depends on state (vehicle state, fault level, connection) a dynamic property that the
+application style sheet matches with selectors such as QLabel#state_label[state="DRIVE"].
+Changing a property repolishes one widget against the already parsed sheet, and switching
+between day and night replaces the application sheet, repolishing every widget once.
+"""
+import logging
+from string import Template
+
+from .constants import STYLES, THEMES, THEME
+
+# Palette color names understood besides hex and rgb()/rgba() notation
+NAMED_COLORS = {
+    "white": (255, 255, 255, 255),
+    "black": (0, 0, 0, 255),
+    "transparent": (0, 0, 0, 0)
+}
+
+# Filled style sheets per THEMES name
+_stylesheets = {}
+_current = None
+
+
+def build_stylesheet(name):
+    """
+    Fill the STYLES templates with a theme palette
+    Args:
+        name (str): THEMES key
+    Returns:
+        str: Complete application style sheet
+    Raises:
+        KeyError: If the theme is unknown or lacks a color a template uses
+    """
+    return Template("\n".join(STYLES.values())).substitute(THEMES[name])
+
+
+def stylesheet(name):
+    """Application style sheet of a theme, built on first use"""
+    sheet = _stylesheets.get(name)
+    if sheet is None:
+        sheet = build_stylesheet(name)
+        _stylesheets[name] = sheet
+    return sheet
+
+
+def current_theme():
+    """Name of the applied theme, None before apply_theme"""
+    return _current
+
+
+def apply_theme(app, name=None):
+    """
+    Install a theme's style sheet on the application
+    Args:
+        app (QApplication): Application whose widgets are restyled
+        name (str): THEMES key, THEME["default"] when omitted
+    """
+    global _current
+    name = name or THEME["default"]
+    if name == _current:
+        return
+    app.setStyleSheet(stylesheet(name))
+    _current = name
+    logging.getLogger(__name__).info(f"Applied {name} theme")
+
+
+def parse_color(text):
+    """
+    Components of a palette color, for widgets that paint with QColor instead of style sheets
+    Args:
+        text (str): "#RRGGBB", "#RGB", "rgb(r, g, b)", "rgba(r, g, b, alpha 0-1)" or a
+            NAMED_COLORS name
+    Returns:
+        tuple: (red, green, blue, alpha), each 0-255
+    Raises:
+        ValueError: If the color notation is not understood
+    """
+    text = text.strip().lower()
+    if text in NAMED_COLORS:
+        return NAMED_COLORS[text]
+    if text.startswith("#"):
+        digits = text[1:]
+        if len(digits) == 3:
+            digits = "".join(digit * 2 for digit in digits)
+        if len(digits) == 6:
+            return tuple(int(digits[i:i + 2], 16) for i in (0, 2, 4)) + (255,)
+    elif text.endswith(")") and (text.startswith("rgb(") or text.startswith("rgba(")):
+        parts = [part.strip() for part in text[text.index("(") + 1:-1].split(",")]
+        if len(parts) in (3, 4):
+            alpha = round(float(parts[3]) * 255) if len(parts) == 4 else 255
+            return tuple(int(part) for part in parts[:3]) + (alpha,)
+    raise ValueError(f"Unsupported palette color {text!r}")
+
+
+def set_style_property(widget, name, value):
+    """
+    Set a dynamic property matched by the style sheet, repolishing only on a change
+    Args:
+        widget (QWidget): Styled widget
+        name (str): Property name used in the selectors
+        value: str or bool property value
+    """
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
@@ -0,0 +1,285 @@
+"""
+Theme engine switching between day and night with every asset prepared ahead of time
+
+Each theme has its application style sheet, a QPalette, and a normal and a blurred
+background. The backgrounds of the other themes are decoded, dimmed and blurred on a pool
+thread at startup, and all of them are scaled to the window size whenever it changes, so a
+switch only swaps prepared objects and fits in one frame: one style sheet repolish, one
+palette and a cached pixmap brush per window. Themes change manually (set_theme, toggle) or
+automatically from the clock or an ambient light level.
+"""
+import logging
+import time
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QPalette, QPixmap
+
+from .constants import THEME, THEMES
+from .image_utils import create_background_variants
+from .theme import apply_theme, parse_color
+
+MODES = ("manual", "clock", "ambient")
+# Modes offered on the command line; ambient needs a light sensor calling set_ambient_light,
+# and nothing in the dashboard provides one yet
+CLI_MODES = ("manual", "clock")
+
+
+def day_minutes(text):
+    """Minutes since midnight of an "HH:MM" time"""
+    hours, minutes = text.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def clock_theme(now, day_start=THEME["day_start"], night_start=THEME["night_start"]):
+    """
+    Theme for a local time
+    Args:
+        now (time.struct_time): Local time
+        day_start (str): "HH:MM" from which day applies
+        night_start (str): "HH:MM" from which night applies
+    Returns:
+        str: "day" or "night"
+    """
+    minutes = now.tm_hour * 60 + now.tm_min
+    start, end = day_minutes(day_start), day_minutes(night_start)
+    if start <= end:
+        return "day" if start <= minutes < end else "night"
+    # Day wraps past midnight
+    return "night" if end <= minutes < start else "day"
+
+
+def build_palette(palette):
+    """QPalette of a THEMES palette, for widget parts the style sheet does not cover"""
+    def color(name):
+        return QColor(*parse_color(palette[name]))
+
+    qpalette = QPalette()
+    qpalette.setColor(QPalette.ColorRole.Window, color("WINDOW"))
+    qpalette.setColor(QPalette.ColorRole.WindowText, color("TEXT"))
+    qpalette.setColor(QPalette.ColorRole.Base, color("SURFACE"))
+    qpalette.setColor(QPalette.ColorRole.AlternateBase, color("OVERLAY"))
+    qpalette.setColor(QPalette.ColorRole.Text, color("TEXT"))
+    qpalette.setColor(QPalette.ColorRole.PlaceholderText, color("TEXT_MUTED"))
+    qpalette.setColor(QPalette.ColorRole.Button, color("SURFACE"))
+    qpalette.setColor(QPalette.ColorRole.ButtonText, color("TEXT"))
+    qpalette.setColor(QPalette.ColorRole.ToolTipBase, color("SURFACE"))
+    qpalette.setColor(QPalette.ColorRole.ToolTipText, color("TEXT"))
+    return qpalette
+
+
+def render_background(name, path):
+    """Normal and blurred background QImages of a theme"""
+    return create_background_variants(
+        path, THEME["blur_radius"], THEME["brightness"].get(name, 1.0))
+
+
+class BackgroundSignals(QObject):
+    # (theme, normal QImage, blurred QImage)
+    finished = pyqtSignal(str, object, object)
+
+
+class BackgroundTask(QRunnable):
+    """Decodes, dims and blurs the background of one theme on a pool thread"""
+    def __init__(self, name, path, signals):
+        super().__init__()
+        self.name = name
+        self.path = path
+        self.signals = signals
+
+    def run(self):
+        normal, blurred = render_background(self.name, self.path)
+        self.signals.finished.emit(self.name, normal, blurred)
+
+
+class ThemeVariant:
+    __slots__ = ("name", "palette", "images")
+
+    def __init__(self, name, palette):
+        self.name = name
+        self.palette = build_palette(palette)
+        # (normal, blurred) QImages once rendered
+        self.images = None
+
+
+class ThemeEngine(QObject):
+    # Emitted after a switch with the new theme name; windows swap in their cached backgrounds
+    theme_changed = pyqtSignal(str)
+
+    def __init__(self, app, theme=None, mode=THEME["mode"], background=THEME["background"],
+                 parent=None):
+        """
+        Args:
+            app (QApplication): Application whose style sheet and palette are switched
+            theme (str): THEMES key to start with, THEME["default"] when omitted
+            mode (str): One of MODES
+            background (str): Path of the background image
+            parent (QObject): Parent object
+        """
+        super().__init__(parent)
+        self.logger = logging.getLogger(__name__)
+        self.app = app
+        self.background_path = background
+        self.variants = {name: ThemeVariant(name, palette) for name, palette in THEMES.items()}
+        self.current = theme or THEME["default"]
+        self.mode = "manual"
+        self.switches = 0
+        self.last_switch_ms = None
+
+        # Scaled pixmaps per (theme, blurred, width, height), oldest dropped first
+        self.pixmaps = {}
+        # Window sizes the backgrounds are kept scaled for, enough to fill the pixmap cache
+        self.sizes = []
+        self.max_sizes = max(THEME["pixmap_cache"] // (2 * len(self.variants)), 1)
+
+        # The first frame needs the starting theme's background, the rest can follow
+        self.variants[self.current].images = render_background(self.current, background)
+        self.signals = BackgroundSignals(self)
+        self.signals.finished.connect(self.background_ready)
+        for name in self.variants:
+            if name != self.current:
+                QThreadPool.globalInstance().start(BackgroundTask(name, background, self.signals))
+
+        apply_theme(app, self.current)
+        app.setPalette(self.variants[self.current].palette)
+
+        self.clock_timer = QTimer(self)
+        self.clock_timer.timeout.connect(self.check_clock)
+        self.set_mode(mode)
+
+    def background_ready(self, name, normal, blurred):
+        """Keep a theme's rendered background and scale it for the known window sizes"""
+        self.variants[name].images = (normal, blurred)
+        for size in self.sizes:
+            for is_blurred in (False, True):
+                self.scaled(name, is_blurred, size)
+
+    def images(self, name):
+        """Rendered backgrounds of a theme, rendered here if the pool thread has not finished"""
+        variant = self.variants[name]
+        if variant.images is None:
+            self.logger.warning(f"Rendering the {name} background on the UI thread")
+            variant.images = render_background(name, self.background_path)
+        return variant.images
+
+    def scaled(self, name, blurred, size):
+        """
+        Background pixmap of a theme scaled to cover a window, cached
+        Args:
+            name (str): THEMES key
+            blurred (bool): Blurred variant shown behind widgets
+            size (QSize): Window size
+        Returns:
+            QPixmap: Scaled background
+        """
+        key = (name, blurred, size.width(), size.height())
+        pixmap = self.pixmaps.get(key)
+        if pixmap is None:
+            image = self.images(name)[1 if blurred else 0]
+            pixmap = QPixmap.fromImage(image.scaled(
+                size,
+                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                Qt.TransformationMode.SmoothTransformation
+            ))
+            if len(self.pixmaps) >= THEME["pixmap_cache"]:
+                del self.pixmaps[next(iter(self.pixmaps))]
+            self.pixmaps[key] = pixmap
+        return pixmap
+
+    def background(self, blurred, size):
+        """Current theme's background for a window of the given size"""
+        return self.scaled(self.current, blurred, size)
+
+    def prepare(self, size):
+        """
+        Scale every theme's backgrounds for a window size before they are shown; the current
+        theme's at once, the others once the event loop is idle
+        """
+        key = (size.width(), size.height())
+        if any((s.width(), s.height()) == key for s in self.sizes):
+            return
+        self.sizes.append(size)
+        del self.sizes[:-self.max_sizes]
+        for blurred in (False, True):
+            self.scaled(self.current, blurred, size)
+        QTimer.singleShot(0, lambda: self.prepare_others(size))
+
+    def prepare_others(self, size):
+        """Scale the backgrounds of the themes not shown, if already rendered"""
+        for name, variant in self.variants.items():
+            if name != self.current and variant.images is not None:
+                for blurred in (False, True):
+                    self.scaled(name, blurred, size)
+
+    def set_theme(self, name):
+        """
+        Switch to a theme using only prepared assets
+        Args:
+            name (str): THEMES key
+        """
+        if name == self.current:
+            return
+        if name not in self.variants:
+            raise ValueError(f"Unknown theme {name!r}")
+        start = time.perf_counter()
+        apply_theme(self.app, name)
+        self.app.setPalette(self.variants[name].palette)
+        self.current = name
+        self.theme_changed.emit(name)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        self.switches += 1
+        self.last_switch_ms = elapsed
+        if elapsed > THEME["frame_budget"]:
+            self.logger.warning(f"Switch to {name} theme took {elapsed:.1f} ms")
+        else:
+            self.logger.info(f"Switched to {name} theme in {elapsed:.1f} ms")
+
+    def toggle(self):
+        """Manually switch between day and night, ending automatic switching"""
+        self.set_mode("manual")
+        self.set_theme("day" if self.current == "night" else "night")
+
+    def set_mode(self, mode):
+        """
+        Select how the theme is chosen
+        Args:
+            mode (str): "manual", "clock" to follow THEME day_start/night_start, or "ambient"
+                to follow set_ambient_light
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown theme mode {mode!r}; choose from {', '.join(MODES)}")
+        self.mode = mode
+        if mode == "clock":
+            self.clock_timer.start(THEME["clock_interval"])
+            self.check_clock()
+        else:
+            self.clock_timer.stop()
+
+    def check_clock(self):
+        """Apply the theme for the current local time"""
+        if self.mode == "clock":
+            self.set_theme(clock_theme(time.localtime()))
+
+    def set_ambient_light(self, lux):
+        """
+        Follow an ambient light reading, with hysteresis between THEME ambient_night and
+        ambient_day so readings around one level do not flicker the theme
+        Args:
+            lux (float): Ambient light level
+        """
+        if self.mode != "ambient":
+            return
+        if lux < THEME["ambient_night"]:
+            self.set_theme("night")
+        elif lux > THEME["ambient_day"]:
+            self.set_theme("day")
+
+    def stats(self):
+        """Return switch counters and cache sizes"""
+        return {
+            "theme": self.current,
+            "mode": self.mode,
+            "switches": self.switches,
+            "last_switch_ms": self.last_switch_ms,
+            "pixmaps": len(self.pixmaps)
+        }
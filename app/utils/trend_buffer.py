@@ -0,0 +1,93 @@
+"""
+Fixed-size metric history with incremental min/max decimation for trend rendering
+"""
+import math
+from array import array
+
+
+class TrendBuffer:
+    def __init__(self, capacity=600, columns=100):
+        """
+        Args:
+            capacity (int): Number of samples of history kept
+            columns (int): Number of pixel columns the history is decimated to
+        """
+        self.capacity = capacity
+        self.values = array("d", bytes(8 * capacity))
+        self.head = 0
+        self.count = 0
+        # Samples ever appended, the absolute index of the next one
+        self.total = 0
+        self.set_columns(columns)
+
+    def set_columns(self, columns):
+        """Re-bucket the history for a new pixel width"""
+        columns = max(int(columns), 1)
+        self.column_count = columns
+        self.bucket_size = max(math.ceil(self.capacity / columns), 1)
+        # Bucket n holds samples n * bucket_size onwards; one spare slot for the newest bucket
+        self.bucket_count = columns + 1
+        self.mins = array("d", [math.inf]) * self.bucket_count
+        self.maxs = array("d", [-math.inf]) * self.bucket_count
+
+        # Replay the raw history into the new buckets
+        for index, value in enumerate(self.history(), self.total - self.count):
+            self._add_to_bucket(index, value)
+
+    def append(self, value):
+        """Add a sample in O(1), overwriting the oldest once full"""
+        self.values[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+        self._add_to_bucket(self.total, value)
+        self.total += 1
+
+    def _add_to_bucket(self, index, value):
+        """Fold the sample with an absolute index into its bucket, resetting a reused slot"""
+        slot = (index // self.bucket_size) % self.bucket_count
+        if index % self.bucket_size == 0:
+            self.mins[slot] = math.inf
+            self.maxs[slot] = -math.inf
+        if value < self.mins[slot]:
+            self.mins[slot] = value
+        if value > self.maxs[slot]:
+            self.maxs[slot] = value
+
+    def history(self):
+        """Raw samples, oldest first"""
+        start = (self.head - self.count) % self.capacity
+        for i in range(self.count):
+            yield self.values[(start + i) % self.capacity]
+
+    def columns(self):
+        """
+        Decimated history, oldest first, in O(columns) regardless of history length
+        Returns:
+            list: (min, max) per bucket
+        """
+        if self.count == 0:
+            return []
+        size = self.bucket_size
+        oldest = self.total - self.count
+        last = (self.total - 1) // size
+        if self.count < self.capacity:
+            first = oldest // size
+        else:
+            # A bucket that lost samples to eviction would still show them, so it is skipped
+            first = -(-oldest // size)
+        first = max(first, last - self.column_count + 1)
+        mins, maxs, count = self.mins, self.maxs, self.bucket_count
+        return [(mins[bucket % count], maxs[bucket % count]) for bucket in range(first, last + 1)]
+
+    def latest(self):
+        """Most recent sample, or None when empty"""
+        if self.count == 0:
+            return None
+        return self.values[(self.head - 1) % self.capacity]
+
+    def clear(self):
+        """Drop all history"""
+        self.head = 0
+        self.count = 0
+        self.set_columns(self.column_count)
@@ -0,0 +1,97 @@
+"""
+Quantized value formatting with a cache of recently rendered strings
+
+Values are first rounded to the field's display step (0.1 °C, 1 %, ...) and the rounded
+integer keys stand in for the value: equal keys render equal text, so callers compare keys to
+skip unchanged updates and only new keys are formatted.
+"""
+import math
+
+from .constants import FORMAT_CACHE
+
+
+def step_format(step):
+    """Format spec showing exactly the decimals of a step, e.g. ".1f" for 0.1"""
+    if step >= 1:
+        return ".0f"
+    return f".{max(-math.floor(math.log10(step) + 1e-9), 0)}f"
+
+
+class QuantizedFormatter:
+    def __init__(self, template, step=None, value_format=None, separator=" / ",
+                 cache_size=FORMAT_CACHE["size"]):
+        """
+        Args:
+            template (str): Text with a single "{}" slot for the formatted value(s)
+            step (float): Display resolution, None formats values exactly as received
+            value_format (str): Format spec per value, derived from step when omitted
+            separator (str): Joins the values of a vector
+            cache_size (int): Rendered strings kept before the cache is reset
+        """
+        self.template = template
+        self.step = step
+        if value_format is None:
+            value_format = step_format(step) if step else ""
+        self.value_format = "{:" + value_format + "}"
+        self.separator = separator
+        self.cache_size = cache_size
+        self.texts = {}
+        self.elements = {}
+        self.hits = 0
+        self.misses = 0
+
+    def quantize(self, value):
+        """
+        Key identifying the rendered text of a value
+        Args:
+            value: Number, or a sequence of numbers for vector fields
+        Returns:
+            int, float or tuple: Step count(s), or the value itself without a step
+        """
+        step = self.step
+        if isinstance(value, (list, tuple)):
+            if step is None:
+                return tuple(value)
+            return tuple(round(v / step) for v in value)
+        if step is None:
+            return value
+        return round(value / step)
+
+    def text(self, key):
+        """Rendered text for a quantized key, formatted only on a cache miss"""
+        text = self.texts.get(key)
+        if text is not None:
+            self.hits += 1
+            return text
+        self.misses += 1
+        if len(self.texts) >= self.cache_size:
+            # Values move slowly; dropping everything is cheaper than tracking recency
+            self.texts.clear()
+            self.elements.clear()
+        if isinstance(key, tuple):
+            text = self.template.format(self.separator.join(map(self._element, key)))
+        else:
+            text = self.template.format(self._element(key))
+        self.texts[key] = text
+        return text
+
+    def _element(self, key):
+        """Formatted text of one quantized value"""
+        text = self.elements.get(key)
+        if text is None:
+            value = key if self.step is None else key * self.step
+            text = self.value_format.format(value)
+            self.elements[key] = text
+        return text
+
+    def format(self, value):
+        """Rendered text for a raw value"""
+        return self.text(self.quantize(value))
+
+    def value(self, key):
+        """Value a key stands for, rounded to the step"""
+        if self.step is None:
+            return key
+        if isinstance(key, tuple):
+            return tuple(k * self.step for k in key)
+        return key * self.step
@@ -0,0 +1,148 @@
+"""
+Declarative metric widget specs compiled once into a render plan
+
+A spec is plain data (see WIDGET_SPECS in constants): the payload topic it reads, an optional
+card title and its sections, each a title and a list of metric entries:
+    key         Payload field
+    name        Label shown before the value
+    unit        Defaults to METRIC_UNITS[key]
+    step        Display resolution such as 0.1; values are quantized to it before formatting
+    format      Value format spec, derived from step when omitted
+    template    Tile text around the value, default "{name}: {value}{unit}"
+    thresholds  {"warning", "critical"}, defaults to WARNING_THRESHOLDS[key]; a critical level
+                below the warning level means low values are bad. None disables severity
+    series      Values per sample, more than 1 for vector fields such as the four tires
+    separator   Joins the elements of a vector, default " / "
+    trend       Draw a sparkline of the field under its tile
+"""
+from operator import attrgetter
+
+from .constants import METRIC_UNITS, WARNING_THRESHOLDS, WIDGET_SPECS
+from .value_format import QuantizedFormatter
+from ..services.payloads import TOPIC_PAYLOADS
+
+DEFAULT_TEMPLATE = "{name}: {value}{unit}"
+DEFAULT_SEPARATOR = " / "
+
+# Compiled plans per WIDGET_SPECS name
+_plans = {}
+
+
+def threshold_severity(warning, critical):
+    """
+    Severity function for a pair of thresholds
+    Args:
+        warning (float): Level at which values become WARNING
+        critical (float): Level at which values become CRITICAL, below warning for low limits
+    Returns:
+        callable: value -> "NORMAL", "WARNING" or "CRITICAL"
+    """
+    if critical < warning:
+        def severity(value):
+            if value <= critical:
+                return "CRITICAL"
+            if value <= warning:
+                return "WARNING"
+            return "NORMAL"
+    else:
+        def severity(value):
+            if value >= critical:
+                return "CRITICAL"
+            if value >= warning:
+                return "WARNING"
+            return "NORMAL"
+    return severity
+
+
+class MetricBinding:
+    __slots__ = (
+        "key", "name", "unit", "get", "formatter", "severity", "worst", "series", "trend"
+    )
+
+    def __init__(self, entry):
+        """
+        Args:
+            entry (dict): Metric entry of a spec section
+        """
+        self.key = entry["key"]
+        self.name = entry["name"]
+        self.unit = entry.get("unit", METRIC_UNITS.get(self.key, ""))
+        self.get = attrgetter(self.key)
+        self.series = entry.get("series", 1)
+        self.trend = bool(entry.get("trend", False))
+
+        # Name and unit are substituted once; only the value slot is left for each update
+        template = entry.get("template", DEFAULT_TEMPLATE)
+        template = template.replace("{name}", self.name).replace("{unit}", self.unit)
+        self.formatter = QuantizedFormatter(
+            template.replace("{value}", "{}"),
+            step=entry.get("step"),
+            value_format=entry.get("format"),
+            separator=entry.get("separator", DEFAULT_SEPARATOR)
+        )
+
+        limits = entry.get("thresholds", WARNING_THRESHOLDS.get(self.key))
+        self.severity = (
+            threshold_severity(limits["warning"], limits["critical"]) if limits else None
+        )
+        # Element of a vector its severity is judged by; the lowest for low limits
+        self.worst = min if limits and limits["critical"] < limits["warning"] else max
+
+    def format(self, value):
+        """Tile text for a scalar value or a sequence of series values"""
+        return self.formatter.format(value)
+
+
+class RenderPlan:
+    def __init__(self, spec):
+        """
+        Compile a widget spec
+        Args:
+            spec (dict): {"topic", "title", "sections"} as described in the module docstring
+        Raises:
+            ValueError: If a metric names a field the topic's payload does not have
+        """
+        self.topic = spec.get("topic", "vehicle_data")
+        self.title = spec.get("title")
+        payload_type = TOPIC_PAYLOADS[self.topic]
+        fields = {name for name, _ in payload_type._fields}
+
+        self.sections = []
+        self.bindings = []
+        for title, entries in spec["sections"]:
+            bindings = []
+            for entry in entries:
+                if entry["key"] not in fields:
+                    raise ValueError(
+                        f"{payload_type.__name__} has no field {entry['key']!r} for a metric"
+                    )
+                bindings.append(MetricBinding(entry))
+            self.sections.append((title, bindings))
+            self.bindings.extend(bindings)
+
+        # Split by shape so the update loop needs no per-metric branching
+        self.scalars = tuple(binding for binding in self.bindings if binding.series == 1)
+        self.vectors = tuple(binding for binding in self.bindings if binding.series > 1)
+        self.trends = {binding.key: binding.series for binding in self.bindings if binding.trend}
+
+    def panel_sections(self):
+        """Sections in the (title, [(key, name, unit), ...]) form MetricsPanel lays out"""
+        return [
+            (title, [(binding.key, binding.name, binding.unit) for binding in bindings])
+            for title, bindings in self.sections
+        ]
+
+
+def widget_plan(name):
+    """
+    Render plan of a WIDGET_SPECS entry, compiled on first use
+    Args:
+        name (str): Widget type, a WIDGET_SPECS key
+    Returns:
+        RenderPlan: Shared compiled plan
+    """
+    plan = _plans.get(name)
+    if plan is None:
+        plan = RenderPlan(WIDGET_SPECS[name])
+        _plans[name] = plan
+    return plan
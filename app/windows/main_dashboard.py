@@ -1,31 +1,55 @@
 """
 Main dashboard window for the infotainment system
 """
+import logging
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QFrame, QApplication, QLabel
 )
-from PyQt6.QtGui import QPixmap, QPalette, QBrush, QColor
+from PyQt6.QtGui import QPalette, QBrush, QKeySequence, QShortcut
 from PyQt6.QtCore import Qt, QTimer
 
 from ..components.draggable_button import DraggableButton
 from ..components.drop_area import DropArea
 from ..components.state_widget import StateWidget
 from ..components.fault_widget import FaultWidget
-from ..utils.image_utils import create_blurred_background
-from ..utils.constants import COLORS, STYLES
+from ..components.charging_popup import ChargingPopup
+from ..components.latency_overlay import LatencyOverlay, PaintProbe
+from ..components.metrics_panel import use_theme_colors
+from ..utils.theme import set_style_property
+from ..utils.theme_engine import ThemeEngine
+from ..utils.constants import (
+    LATENCY_TRACING, UI_UPDATES, FAULT_HISTORY, FAULT_DEBOUNCE, CHARGING,
+    VEHICLE_STATES, THEME, WIDGET_SPECS
+)
 from ..services.data_service import DataService
+from ..services.fault_history import FaultHistory
+from ..services.fault_debouncer import FaultDebouncer
+from ..services.charging_session import ChargingSession
+from ..services.latency_tracer import tracer
+from ..services.update_batcher import UpdateBatcher
 
 class MainDash(QMainWindow):
-    def __init__(self):
+    def __init__(self, data_service=None, fault_history=None, layout_store=None, screen=None,
+                 theme_engine=None):
         super().__init__()
+        # Display the window is sized for and placed on
+        self.target_screen = screen if screen is not None else QApplication.primaryScreen()
+        # Shared by every window so themes switch together
+        self.theme_engine = (
+            theme_engine if theme_engine is not None else ThemeEngine(QApplication.instance())
+        )
+        self.fault_history = fault_history if fault_history is not None else FaultHistory()
+        self.layout_store = layout_store
         self.setup_ui()
-        self.setup_data_service()
+        self.setup_data_service(data_service)
+        if tracer.enabled:
+            self.setup_latency_tracing()
         
     def setup_ui(self):
         """Initialize the UI"""
         # Get screen dimensions
-        screen_geometry = QApplication.primaryScreen().availableGeometry()
+        screen_geometry = self.target_screen.availableGeometry()
         screen_width = screen_geometry.width()
         screen_height = screen_geometry.height()
 
@@ -38,36 +62,35 @@ class MainDash(QMainWindow):
 
         # Set window properties
         self.setWindowTitle("Vehicle Infotainment System")
-        self.setGeometry(100, 100, target_width, target_height)
-        self.setStyleSheet(STYLES["main_window"])
+        self.setGeometry(screen_geometry.x() + 100, screen_geometry.y() + 100,
+                         target_width, target_height)
 
         # Create central widget
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
         self.main_layout = QVBoxLayout(self.central_widget)
 
-        # Load background
-        self.background_image_path = "assets/modern_sports_car_offcenter_right.jpg"
-        self.normal_background = QPixmap(self.background_image_path)
-        self.blurred_background = create_blurred_background(self.background_image_path)
-        self.set_background(self.normal_background)
+        # Background and painted colors of the current theme, prepared for this window size
+        self.background_blurred = False
+        self.theme_engine.prepare(self.size())
+        use_theme_colors(self.theme_engine.current)
+        self.set_background(False)
+        self.theme_engine.theme_changed.connect(self.theme_changed)
+        self.theme_shortcut = QShortcut(QKeySequence(THEME["toggle_shortcut"]), self)
+        self.theme_shortcut.activated.connect(self.theme_engine.toggle)
 
         # Status bar for connection status
         self.status_label = QLabel()
-        self.status_label.setStyleSheet("""
-            QLabel {
-                background-color: rgba(0, 0, 0, 0.7);
-                color: white;
-                padding: 5px;
-                border-radius: 3px;
-            }
-        """)
+        self.status_label.setObjectName("connection_status")
         self.main_layout.addWidget(self.status_label, alignment=Qt.AlignmentFlag.AlignRight)
         self.status_label.hide()
 
         # Display Area
-        self.display_area = DropArea()
+        self.display_area = DropArea(self.fault_history, self.layout_store)
         self.main_layout.addWidget(self.display_area)
+        # Rebuilt before the window is first shown, so no intermediate layout is painted
+        if self.display_area.restore_layout():
+            self.set_blurred_background()
 
         # Bottom Bar
         self.setup_bottom_bar(target_height)
@@ -78,12 +101,7 @@ class MainDash(QMainWindow):
     def setup_bottom_bar(self, window_height):
         """Setup the bottom app bar"""
         self.bottom_bar = QFrame()
-        self.bottom_bar.setStyleSheet(f"""
-            QFrame {{
-                background-color: {COLORS['BACKGROUND']};
-                border-top: 1px solid {COLORS['BORDER']};
-            }}
-        """)
+        self.bottom_bar.setObjectName("bottom_bar")
         
         self.bottom_layout = QHBoxLayout(self.bottom_bar)
         self.bottom_layout.setContentsMargins(15, 5, 15, 5)
@@ -98,7 +116,8 @@ class MainDash(QMainWindow):
             "Media",
             "Climate",
             "Phone",
-            "Vehicle Info",
+            *WIDGET_SPECS,
+            "Fault History",
             "Settings"
         ]
 
@@ -110,85 +129,258 @@ class MainDash(QMainWindow):
 
         self.main_layout.addWidget(self.bottom_bar)
 
-    def setup_data_service(self):
-        """Initialize and connect the data service"""
-        self.data_service = DataService()
+    def setup_data_service(self, data_service=None):
+        """
+        Initialize and connect the data service, or any source with the same signals
+        (ReplayService, or a DataHub subscription shared with other windows)
+        """
+        self.data_service = data_service if data_service is not None else DataService()
         
-        # Connect signals
-        self.data_service.data_updated.connect(self.update_vehicle_data)
-        self.data_service.state_updated.connect(self.update_vehicle_state)
-        self.data_service.fault_updated.connect(self.update_fault_status)
+        # Faults are debounced in the data path, before batching and dispatch, unless a
+        # DataHub shared with other windows already debounced and recorded them
+        self.observe_faults = not getattr(self.data_service, "faults_observed", False)
+        self.fault_debouncer = (
+            FaultDebouncer() if FAULT_DEBOUNCE["enabled"] and self.observe_faults else None
+        )
+
+        # Connect signals, through the frame-paced batcher when enabled
+        if UI_UPDATES["batching"]:
+            self.setup_update_batcher()
+            batcher = self.update_batcher
+            self.dispatch_vehicle_data = lambda data: batcher.submit("vehicle_data", data)
+            self.dispatch_vehicle_state = lambda data: batcher.submit("vehicle_state", data)
+            self.dispatch_fault_status = lambda data: batcher.submit("fault_status", data)
+        else:
+            self.update_batcher = None
+            self.dispatch_vehicle_data = self.update_vehicle_data
+            self.dispatch_vehicle_state = self.update_vehicle_state
+            self.dispatch_fault_status = self.update_fault_status
+        self.data_service.data_updated.connect(self.receive_vehicle_data)
+        self.data_service.state_updated.connect(self.receive_vehicle_state)
+        self.data_service.fault_updated.connect(self.receive_fault_status)
         self.data_service.connection_status_changed.connect(self.update_connection_status)
+
+        self.fault_flush_timer = QTimer(self)
+        self.fault_flush_timer.timeout.connect(self.fault_history.flush)
+        self.fault_flush_timer.start(FAULT_HISTORY["flush_interval"])
+
+        # Charging sessions open the popup, which refreshes at a reduced rate
+        self.charging_session = ChargingSession()
+        self.charging_popup = None
+        self.charging_timer = QTimer(self)
+        self.charging_timer.timeout.connect(self.refresh_charging_popup)
+        self.charging_timer.setInterval(CHARGING["popup_interval"])
         
         # Start monitoring
         self.data_service.start_monitoring()
 
+    def setup_update_batcher(self):
+        """Create the batcher applying the latest payload per topic once per frame"""
+        self.update_batcher = UpdateBatcher(
+            {
+                "vehicle_state": self.update_vehicle_state,
+                "fault_status": self.update_fault_status,
+                "vehicle_data": self.update_vehicle_data
+            },
+            self.frame_interval(),
+            parent=self
+        )
+        if UI_UPDATES["stats_interval"]:
+            self.batch_stats_timer = QTimer(self)
+            self.batch_stats_timer.timeout.connect(self.log_batch_stats)
+            self.batch_stats_timer.start(UI_UPDATES["stats_interval"])
+
+    def frame_interval(self):
+        """Batch interval in ms from the configured UI rate or the display refresh rate"""
+        rate = UI_UPDATES["ui_rate"]
+        if not rate:
+            rate = min(self.target_screen.refreshRate() or UI_UPDATES["max_ui_rate"],
+                       UI_UPDATES["max_ui_rate"])
+        return max(int(1000 / rate), 1)
+
+    def log_batch_stats(self):
+        """Log how many updates were coalesced away by the batcher"""
+        stats = self.update_batcher.stats()
+        logging.getLogger(__name__).info(
+            f"UI batches: {stats['frames']} frames, "
+            f"{stats['updates_per_frame']:.2f} updates/frame, "
+            f"coalesced {stats['coalesced']} ({stats['coalesced_ratio']:.1%})"
+        )
+
+    def receive_vehicle_data(self, data):
+        """Track charging and debounce the embedded fault status, then dispatch vehicle data"""
+        if data.vehicle_state is not None:
+            self.track_charging(data.vehicle_state)
+        if self.charging_session.active:
+            self.charging_session.add_sample(
+                data.charge_percent, data.charging_rate, data.battery_temp)
+        if self.fault_debouncer is not None and data.fault_status is not None:
+            # Copied rather than modified, other windows may share the payload
+            fault_status, changed = self.fault_debouncer.apply(data.fault_status)
+            data = data.replace(fault_status=fault_status)
+            if changed:
+                self.fault_history.observe(data.fault_status)
+        self.dispatch_vehicle_data(data)
+
+    def receive_vehicle_state(self, state_data):
+        """Track charging, then dispatch the vehicle state"""
+        self.track_charging(state_data)
+        self.dispatch_vehicle_state(state_data)
+
+    def track_charging(self, state_data):
+        """Start or end the charging session on CHARGE state transitions"""
+        charging = state_data.primary_state == VEHICLE_STATES["CHARGE"]
+        if charging == self.charging_session.active:
+            return
+        if charging:
+            self.charging_session.start()
+            if self.charging_popup is None:
+                self.charging_popup = ChargingPopup(self)
+            self.charging_popup.show()
+            # Fill it now rather than showing "--" until the first timer tick
+            self.refresh_charging_popup()
+            self.charging_timer.start()
+        elif state_data.primary_state in VEHICLE_STATES:
+            self.charging_session.stop()
+            self.charging_timer.stop()
+            self.charging_popup.hide()
+
+    def refresh_charging_popup(self):
+        """Show the latest charging estimate"""
+        if self.charging_popup is not None and self.charging_popup.isVisible():
+            self.charging_popup.update_session(self.charging_session.estimate())
+
+    def receive_fault_status(self, fault_data):
+        """Debounce a raw fault snapshot, dispatching it while faults are shown or changing"""
+        if self.fault_debouncer is None:
+            if self.observe_faults:
+                self.fault_history.observe(fault_data)
+            self.dispatch_fault_status(fault_data)
+            return
+        fault_data, changed = self.fault_debouncer.apply(fault_data)
+        if changed:
+            self.fault_history.observe(fault_data)
+        # While faults are active, their elapsed time still has to refresh
+        if changed or fault_data.active:
+            self.dispatch_fault_status(fault_data)
+
+    def spec_widgets(self, topic):
+        """Placed WIDGET_SPECS widgets whose spec reads a topic"""
+        return [
+            widget for widget in self.display_area.widgets
+            if getattr(widget, 'plan', None) is not None and widget.plan.topic == topic
+        ]
+
     def update_vehicle_data(self, data):
         """Update all vehicle-related widgets with new data"""
-        if "Vehicle Info" in self.display_area.widgets:
-            for widget in self.display_area.widgets:
-                if hasattr(widget, 'update_data'):
-                    widget.update_data(data)
+        if tracer.enabled:
+            tracer.mark("vehicle_data", "dispatch")
+        updated = False
+        for widget in self.spec_widgets("vehicle_data"):
+            widget.update_data(data)
+            updated = True
+        if updated and tracer.enabled:
+            tracer.mark("vehicle_data", "update")
 
     def update_vehicle_state(self, state_data):
         """Update state-specific widgets"""
+        if tracer.enabled:
+            tracer.mark("vehicle_state", "dispatch")
+        updated = False
         for widget in self.display_area.widgets:
             if hasattr(widget, 'state_widget'):
                 widget.state_widget.update_state(state_data)
+                updated = True
+        for widget in self.spec_widgets("vehicle_state"):
+            widget.update_data(state_data)
+            updated = True
+        if updated and tracer.enabled:
+            tracer.mark("vehicle_state", "update")
 
     def update_fault_status(self, fault_data):
         """Update fault-specific widgets"""
+        if tracer.enabled:
+            tracer.mark("fault_status", "dispatch")
+        updated = False
         for widget in self.display_area.widgets:
             if hasattr(widget, 'fault_widget'):
                 widget.fault_widget.update_fault_status(fault_data)
+                updated = True
+        for widget in self.spec_widgets("fault_status"):
+            widget.update_data(fault_data)
+            updated = True
+        if updated and tracer.enabled:
+            tracer.mark("fault_status", "update")
+
+    def setup_latency_tracing(self):
+        """Install the paint probe, debug overlay and periodic latency log"""
+        self.paint_probe = PaintProbe(self.display_area, self)
+        QApplication.instance().installEventFilter(self.paint_probe)
+
+        if LATENCY_TRACING["overlay"]:
+            self.latency_overlay = LatencyOverlay(self.central_widget)
+            self.latency_overlay.move(10, 10)
+            self.latency_overlay.show()
+
+        if LATENCY_TRACING["log_interval"]:
+            self.latency_log_timer = QTimer(self)
+            self.latency_log_timer.timeout.connect(self.log_latency)
+            self.latency_log_timer.start(LATENCY_TRACING["log_interval"])
+
+    def log_latency(self):
+        """Log receive-to-paint latency percentiles per topic"""
+        summary = tracer.format_summary()
+        if summary:
+            logging.getLogger(__name__).info(f"Data-to-pixel latency\n{summary}")
 
     def update_connection_status(self, connected):
         """Update the connection status display"""
+        set_style_property(self.status_label, "connected", bool(connected))
         if connected:
             self.status_label.setText("✓ Connected")
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    background-color: rgba(0, 150, 0, 0.7);
-                    color: white;
-                    padding: 5px;
-                    border-radius: 3px;
-                }
-            """)
             # Hide after 3 seconds if connected
             QTimer.singleShot(3000, self.status_label.hide)
         else:
             self.status_label.setText("⚠ Connection Lost")
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    background-color: rgba(200, 0, 0, 0.7);
-                    color: white;
-                    padding: 5px;
-                    border-radius: 3px;
-                }
-            """)
             self.status_label.show()
 
-    def set_background(self, pixmap):
-        """Set the window background"""
-        scaled_background = pixmap.scaled(
-            self.size(),
-            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-            Qt.TransformationMode.SmoothTransformation
-        )
+    def set_background(self, blurred):
+        """Set the window background to the current theme's normal or blurred variant"""
+        self.background_blurred = blurred
+        # Already scaled to the window by the theme engine, so this only swaps a brush
+        background = self.theme_engine.background(blurred, self.size())
         palette = self.central_widget.palette()
-        palette.setBrush(QPalette.ColorRole.Window, QBrush(scaled_background))
+        palette.setBrush(QPalette.ColorRole.Window, QBrush(background))
         self.central_widget.setPalette(palette)
         self.central_widget.setAutoFillBackground(True)
 
     def set_blurred_background(self):
         """Set blurred background when widgets are present"""
-        self.set_background(self.blurred_background)
+        self.set_background(True)
 
     def restore_background(self):
         """Restore normal background when no widgets are present"""
-        self.set_background(self.normal_background)
+        self.set_background(False)
+
+    def theme_changed(self, name):
+        """Swap in the new theme's painted colors and prepared background"""
+        use_theme_colors(name)
+        self.set_background(self.background_blurred)
+
+    def resizeEvent(self, event):
+        """Rescale every theme's backgrounds for the new window size"""
+        super().resizeEvent(event)
+        self.theme_engine.prepare(self.size())
+        self.set_background(self.background_blurred)
 
     def closeEvent(self, event):
         """Clean up when closing"""
         self.data_service.stop_monitoring()
+        if hasattr(self.data_service, 'stop_recording'):
+            self.data_service.stop_recording()
+        if hasattr(self.data_service, 'stop_bus'):
+            self.data_service.stop_bus()
+        if hasattr(self.data_service, 'stop_session'):
+            self.data_service.stop_session()
+        self.display_area.save_pending_layout()
         super().closeEvent(event)
\ No newline at end of file
@@ -0,0 +1,114 @@
+"""
+Benchmark of client request throughput and latency against the local mock backend
+
+Polls the mock backend with the same session, headers and decoders DataService uses.
+Run from the project root:
+    python -m benchmarks.bench_client --latency 5 --jitter 2 --drop-rate 0.01
+"""
+import argparse
+import statistics
+import threading
+import time
+
+import requests
+
+from app.utils.constants import API_ENDPOINTS, WIRE_FORMAT
+from app.services.binary_codec import decode_binary
+from app.services.decoding import decode_payload
+from app.services.payloads import VehicleMetrics, VehicleState, FaultStatus
+from app.simulator.scenarios import VehicleSimulator, SCENARIOS
+from app.simulator.server import MockBackendServer
+
+ENDPOINTS = {
+    "vehicle_data": (API_ENDPOINTS["vehicle_data"], VehicleMetrics),
+    "vehicle_state": (API_ENDPOINTS["vehicle_state"], VehicleState),
+    "fault_status": (API_ENDPOINTS["fault_status"], FaultStatus)
+}
+
+
+def percentile(samples, fraction):
+    """Return a percentile of a list of samples"""
+    if len(samples) < 2:
+        return samples[0] if samples else 0.0
+    return statistics.quantiles(samples, n=100, method="inclusive")[int(fraction * 100) - 1]
+
+
+def run(base_url, binary, requests_per_endpoint):
+    """Poll every endpoint and return per-endpoint latency samples and totals"""
+    session = requests.Session()
+    if binary:
+        session.headers["Accept"] = (
+            f"{WIRE_FORMAT['binary_content_type']}, {WIRE_FORMAT['json_content_type']};q=0.5"
+        )
+    else:
+        session.headers["Accept"] = WIRE_FORMAT["json_content_type"]
+
+    results = {}
+    for topic, (path, payload_type) in ENDPOINTS.items():
+        latencies = []
+        failures = 0
+        received_bytes = 0
+        for _ in range(requests_per_endpoint):
+            start = time.perf_counter()
+            response = session.get(f"{base_url}{path}", timeout=1.0)
+            if response.status_code != 200:
+                failures += 1
+                continue
+            content_type = response.headers.get("Content-Type", "")
+            if content_type.startswith(WIRE_FORMAT["binary_content_type"]):
+                decode_binary(response.content, payload_type)
+            else:
+                decode_payload(response.content, payload_type)
+            latencies.append((time.perf_counter() - start) * 1000)
+            received_bytes += len(response.content)
+        results[topic] = (latencies, failures, received_bytes)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500, help="Requests per endpoint")
+    parser.add_argument("--scenario", choices=SCENARIOS, default="drive")
+    parser.add_argument("--latency", type=float, default=0.0, help="Server delay (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Server delay jitter (ms)")
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--payload-size", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    simulator = VehicleSimulator(scenario=args.scenario, seed=args.seed)
+    server = MockBackendServer(
+        ("127.0.0.1", 0), simulator,
+        latency=args.latency,
+        jitter=args.jitter,
+        drop_rate=args.drop_rate,
+        payload_size=args.payload_size,
+        seed=args.seed
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        print(
+            f"{'format':<8}{'topic':<16}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}"
+            f"{'p99 ms':>9}{'avg B':>8}{'failed':>8}"
+        )
+        for binary in (False, True):
+            for topic, (latencies, failures, received_bytes) in run(
+                    base_url, binary, args.requests).items():
+                ok = len(latencies)
+                rate = ok / (sum(latencies) / 1000) if ok else 0.0
+                print(
+                    f"{'binary' if binary else 'json':<8}{topic:<16}{rate:>9.0f}"
+                    f"{percentile(latencies, 0.50):>9.2f}{percentile(latencies, 0.95):>9.2f}"
+                    f"{percentile(latencies, 0.99):>9.2f}{received_bytes // max(ok, 1):>8}"
+                    f"{failures:>8}"
+                )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark of per-message decode cost for backend payloads
+
+Compares the stdlib json + dict access path against the fast parser + typed payload path.
+Run from the project root:
+    python -m benchmarks.bench_decode
+"""
+import argparse
+import json
+import timeit
+
+from app.services import decoding
+from app.services.payloads import VehicleMetrics, VehicleState, FaultStatus
+from .samples import SAMPLE_STATE, SAMPLE_FAULT, SAMPLE_VEHICLE_DATA
+
+
+TOPICS = {
+    "vehicle_state": (SAMPLE_STATE, VehicleState),
+    "fault_status": (SAMPLE_FAULT, FaultStatus),
+    "vehicle_data": (SAMPLE_VEHICLE_DATA, VehicleMetrics)
+}
+
+
+def consume_dict(data):
+    """Field access pattern of the widgets on a plain dict"""
+    for key in ("charge_percent", "power_output", "motor_temp", "battery_temp"):
+        if key in data:
+            data[key]
+    data.get("tire_temp")
+    data.get("tire_pressure")
+
+
+def consume_payload(data):
+    """Field access pattern of the widgets on a typed payload"""
+    data.charge_percent
+    data.power_output
+    data.motor_temp
+    data.battery_temp
+    data.tire_temp
+    data.tire_pressure
+
+
+def bench(stmt, number):
+    """Return the best per-call time in microseconds"""
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=20000, help="Decodes per repeat")
+    args = parser.parse_args()
+
+    print(f"JSON backend: {decoding.JSON_BACKEND}")
+    print(f"{'topic':<16}{'bytes':>8}{'json+dict us':>16}{'fast+typed us':>16}{'speedup':>10}")
+
+    for topic, (sample, payload_type) in TOPICS.items():
+        raw = json.dumps(sample).encode()
+        is_metrics = payload_type is VehicleMetrics
+
+        def stdlib_path():
+            data = json.loads(raw)
+            if is_metrics:
+                consume_dict(data)
+
+        def typed_path():
+            data = decoding.decode_payload(raw, payload_type)
+            if is_metrics:
+                consume_payload(data)
+
+        baseline = bench(stdlib_path, args.number)
+        fast = bench(typed_path, args.number)
+        print(f"{topic:<16}{len(raw):>8}{baseline:>16.2f}{fast:>16.2f}{baseline / fast:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark of drop-point resolution and relayout cost as the slot count grows
+
+Compares the precomputed slot index against a linear scan of slot rectangles. With --qt,
+also times a full QGridLayout relayout under the offscreen Qt platform.
+Run from the project root:
+    python -m benchmarks.bench_layout_engine
+    python -m benchmarks.bench_layout_engine --qt
+"""
+import argparse
+import itertools
+import math
+import random
+import timeit
+
+from app.utils.layout_engine import LayoutTemplate
+
+SLOT_COUNTS = (4, 16, 64, 256, 1024)
+
+
+def grid_spec(slots):
+    """Near-square grid spec with at least the given number of slots"""
+    columns = math.ceil(math.sqrt(slots))
+    rows = math.ceil(slots / columns)
+    return ("grid", (1,) * rows, (1,) * columns)
+
+
+def nested_spec(slots):
+    """Alternating rows/columns splits with uneven weights, slots approximately"""
+    if slots <= 1:
+        return None
+    half = slots // 2
+    kind = "columns" if slots % 3 else "rows"
+    return (kind, (2, 1), (nested_spec(half), nested_spec(slots - half)))
+
+
+def linear_slot_at(slots, x, y):
+    """Reference lookup scanning every slot rectangle"""
+    for index, (left, top, right, bottom) in enumerate(slots):
+        if left <= x < right and top <= y < bottom:
+            return index
+    return len(slots) - 1
+
+
+def bench(stmt, number):
+    """Return the best per-call time in microseconds"""
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def bench_qt(templates):
+    """Time a full QGridLayout relayout of each template with placeholder widgets"""
+    import os
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication, QWidget, QGridLayout
+
+    app = QApplication.instance() or QApplication([])
+    print(f"\n{'template':<10}{'slots':>8}{'qt relayout ms':>16}")
+    for name, template in templates:
+        area = QWidget()
+        area.resize(1920, 1080)
+        layout = QGridLayout(area)
+        widgets = [QWidget() for _ in range(len(template))]
+
+        def relayout():
+            for widget in widgets:
+                layout.removeWidget(widget)
+            for row, stretch in enumerate(template.row_stretch):
+                layout.setRowStretch(row, stretch)
+            for column, stretch in enumerate(template.column_stretch):
+                layout.setColumnStretch(column, stretch)
+            for widget, cell in zip(widgets, template.cells):
+                layout.addWidget(widget, *cell)
+            layout.activate()
+
+        elapsed = min(timeit.repeat(relayout, number=5, repeat=3)) / 5 * 1e3
+        print(f"{name:<10}{len(template):>8}{elapsed:>16.2f}")
+        area.deleteLater()
+    app.processEvents()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=20000, help="Lookups per repeat")
+    parser.add_argument("--qt", action="store_true", help="Also time QGridLayout relayouts")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    points = [(rng.random(), rng.random()) for _ in range(1024)]
+
+    print(f"{'template':<10}{'slots':>8}{'build ms':>10}{'index us':>10}{'linear us':>11}")
+    templates = []
+    for slots in SLOT_COUNTS:
+        for name, spec in (("grid", grid_spec(slots)), ("nested", nested_spec(slots))):
+            build = min(timeit.repeat(lambda: LayoutTemplate(spec), number=1, repeat=3)) * 1e3
+            template = LayoutTemplate(spec)
+            templates.append((name, template))
+            rects = [tuple(float(edge) for edge in slot) for slot in template.slots]
+
+            # Same answers from both lookups before timing them
+            for x, y in points[:64]:
+                assert template.slot_at(x, y) == linear_slot_at(rects, x, y)
+
+            cycle = itertools.cycle(points)
+            indexed = bench(lambda: template.slot_at(*next(cycle)), args.number)
+            linear = bench(lambda: linear_slot_at(rects, *next(cycle)), max(args.number // 10, 1))
+            print(f"{name:<10}{len(template):>8}{build:>10.2f}{indexed:>10.2f}{linear:>11.2f}")
+
+    if args.qt:
+        bench_qt(templates)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark of drive session export, caller cost per sample and sustained write throughput
+
+Records a stream cycling through decoded vehicle data, state and fault payloads into a session
+in a temporary directory, once per available format (CSV, and Parquet when pyarrow is
+installed), as fast as possible or paced to a sample rate. Reports the time record() takes on
+the polling thread, the rows per second written until close() returns, the samples dropped
+because the writer queue was full and the size of the session on disk. An unpaced run outruns
+any writer; the highest rate without drops is the sustained throughput.
+Run from the project root:
+    python -m benchmarks.bench_session_recorder
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from app.services.payloads import VehicleMetrics, VehicleState, FaultStatus
+from app.services.session_recorder import SessionRecorder, FORMATS, pyarrow
+from app.utils.constants import SESSION_RECORDING
+from .samples import SAMPLE_VEHICLE_DATA, SAMPLE_STATE, SAMPLE_FAULT
+
+
+def make_stream(count):
+    """Samples in the proportions the backend is polled at, mostly vehicle data"""
+    data = VehicleMetrics.from_dict(SAMPLE_VEHICLE_DATA)
+    state = VehicleState.from_dict(SAMPLE_STATE)
+    fault = FaultStatus.from_dict(SAMPLE_FAULT)
+    stream = []
+    for index in range(count):
+        if index % 10 == 5:
+            stream.append(("vehicle_state", state))
+        elif index % 10 == 9:
+            stream.append(("fault_status", fault))
+        else:
+            stream.append(("vehicle_data", data.replace(motor_temp=data.motor_temp + index % 50)))
+    return stream
+
+
+def directory_size(path):
+    """Total size in bytes of the files in a directory"""
+    return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+
+
+def run(file_format, stream, args):
+    """Record the stream in one format, returning caller and writer timings"""
+    with tempfile.TemporaryDirectory() as directory:
+        recorder = SessionRecorder(
+            directory, file_format, batch_size=args.batch_size,
+            queue_batches=args.queue_batches, chunk_rows=args.chunk_rows
+        )
+        interval = 1 / args.rate if args.rate else 0
+        record_time = 0
+        start = time.perf_counter()
+        for index, (topic, payload) in enumerate(stream):
+            if interval:
+                # Pace in steps of 100 samples, sleeping off the time ahead of schedule
+                if index % 100 == 0:
+                    ahead = start + index * interval - time.perf_counter()
+                    if ahead > 0:
+                        time.sleep(ahead)
+            before = time.perf_counter()
+            recorder.record(topic, payload)
+            record_time += time.perf_counter() - before
+        recorder.close()
+        total_time = time.perf_counter() - start
+        stats = recorder.stats()
+        return {
+            "record_us": record_time / len(stream) * 1e6,
+            "rows_per_s": stats["written"] / total_time,
+            "dropped": stats["dropped"],
+            "mb": directory_size(recorder.path) / 1e6
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--samples", type=int, default=200000, help="Samples recorded per format")
+    parser.add_argument("--rate", type=float, default=0,
+                        help="Samples per second to record at, 0 for as fast as possible")
+    parser.add_argument("--batch-size", type=int, default=SESSION_RECORDING["batch_size"],
+                        help="Samples handed to the writer thread at once")
+    parser.add_argument("--queue-batches", type=int, default=SESSION_RECORDING["queue_batches"],
+                        help="Batches the writer queue holds before dropping")
+    parser.add_argument("--chunk-rows", type=int, default=SESSION_RECORDING["chunk_rows"],
+                        help="Rows per chunk file")
+    args = parser.parse_args()
+
+    formats = [name for name in FORMATS if name != "parquet" or pyarrow is not None]
+    stream = make_stream(args.samples)
+
+    rate = f"{args.rate:.0f}/s" if args.rate else "unpaced"
+    print(f"{args.samples} samples {rate}, batches of {args.batch_size}, "
+          f"queue of {args.queue_batches} batches")
+    print(f"{'format':<10}{'record us':>11}{'rows/s':>11}{'dropped':>9}{'MB':>8}")
+    for file_format in formats:
+        result = run(file_format, stream, args)
+        print(
+            f"{file_format:<10}{result['record_us']:>11.2f}{result['rows_per_s']:>11.0f}"
+            f"{result['dropped']:>9}{result['mb']:>8.1f}"
+        )
+    if pyarrow is None:
+        print("\nParquet skipped: pyarrow is not installed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark of the UI-process cost of reading the shared-memory snapshot each frame
+
+Compares decoding JSON responses in the UI process against reading the snapshot the
+acquisition process publishes: an idle frame (nothing new), a frame with a new payload on
+every topic, and a contended run against a writer process publishing as fast as it can.
+Run from the project root:
+    python -m benchmarks.bench_shared_snapshot
+"""
+import argparse
+import json
+import multiprocessing
+import time
+import timeit
+
+from app.services import decoding
+from app.services.payloads import VehicleMetrics, VehicleState, FaultStatus
+from app.services.shared_snapshot import SnapshotReader, SnapshotWriter
+from .samples import SAMPLE_STATE, SAMPLE_FAULT, SAMPLE_VEHICLE_DATA
+
+TOPICS = {
+    "vehicle_data": (SAMPLE_VEHICLE_DATA, VehicleMetrics),
+    "vehicle_state": (SAMPLE_STATE, VehicleState),
+    "fault_status": (SAMPLE_FAULT, FaultStatus)
+}
+SLOT_SIZE = 1024
+
+
+def bench(stmt, number):
+    """Return the best per-call time in microseconds"""
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def hammer(name, stop_event):
+    """Writer process publishing every topic in a tight loop"""
+    writer = SnapshotWriter(name, SLOT_SIZE)
+    payloads = [(topic, payload_type.from_dict(sample))
+                for topic, (sample, payload_type) in TOPICS.items()]
+    while not stop_event.is_set():
+        for topic, payload in payloads:
+            writer.write(topic, payload)
+    writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=20000, help="Frames per repeat")
+    parser.add_argument("--seconds", type=float, default=2.0,
+                        help="Duration of the contended run")
+    args = parser.parse_args()
+
+    bodies = [(json.dumps(sample).encode(), payload_type)
+              for sample, payload_type in TOPICS.values()]
+    json_frame = bench(
+        lambda: [decoding.decode_payload(body, payload_type) for body, payload_type in bodies],
+        args.number
+    )
+
+    reader = SnapshotReader(SLOT_SIZE)
+    writer = SnapshotWriter(reader.name, SLOT_SIZE)
+    payloads = [(topic, payload_type.from_dict(sample))
+                for topic, (sample, payload_type) in TOPICS.items()]
+    for topic, payload in payloads:
+        writer.write(topic, payload)
+
+    def read_frame():
+        for topic in TOPICS:
+            reader.read(topic)
+
+    def new_frame():
+        # Write cost included, since nothing else moves the counters in this process
+        for topic, payload in payloads:
+            writer.write(topic, payload)
+        read_frame()
+
+    idle_frame = bench(read_frame, args.number)
+    write_only = bench(lambda: [writer.write(topic, payload) for topic, payload in payloads],
+                       args.number)
+    changed_frame = bench(new_frame, args.number) - write_only
+    writer.close()
+
+    print(f"JSON backend: {decoding.JSON_BACKEND}")
+    print(f"{'per frame, all topics':<32}{'us':>8}")
+    print(f"{'json decode in UI process':<32}{json_frame:>8.2f}")
+    print(f"{'snapshot read, unchanged':<32}{idle_frame:>8.2f}")
+    print(f"{'snapshot read, all changed':<32}{changed_frame:>8.2f}")
+    print(f"{'snapshot write (acquisition)':<32}{write_only:>8.2f}")
+
+    # Reads against a writer process that never pauses
+    context = multiprocessing.get_context("spawn")
+    stop_event = context.Event()
+    process = context.Process(target=hammer, args=(reader.name, stop_event))
+    process.start()
+    # Let the spawned interpreter finish importing before timing
+    time.sleep(1.0)
+    frames = received = 0
+    deadline = time.perf_counter() + args.seconds
+    while time.perf_counter() < deadline:
+        for topic in TOPICS:
+            if reader.read(topic) is not None:
+                received += 1
+        frames += 1
+    stop_event.set()
+    process.join()
+    print(
+        f"\ncontended: {frames / args.seconds:,.0f} frames/s, {received:,} payloads read "
+        f"up to sequence {max(reader.seen.values()):,}, "
+        f"{reader.torn} torn reads given up ({reader.torn / max(frames * len(TOPICS), 1):.2%})"
+    )
+    reader.close()
+
+
+if __name__ == "__main__":
+    main()
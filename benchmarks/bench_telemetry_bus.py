@@ -0,0 +1,92 @@
+"""
+Benchmark of telemetry bus fan-out throughput to growing numbers of subscriber processes
+
+The dashboard side publishes vehicle_data payloads as fast as it can while each subscriber
+process decodes everything it receives. Reports publish cost, frames delivered per second
+across all subscribers and frames dropped for subscribers that fell behind, also as a share
+of the frames due to all subscribers.
+Run from the project root:
+    python -m benchmarks.bench_telemetry_bus
+"""
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+
+from app.services.payloads import VehicleMetrics
+from app.services.telemetry_bus import TelemetryBus, BusClient
+from .samples import SAMPLE_VEHICLE_DATA
+
+SUBSCRIBER_COUNTS = (1, 4, 16)
+
+
+def subscriber(path, results):
+    """Subscriber process: decode frames until the bus goes quiet, then report"""
+    received = 0
+    last = None
+    with BusClient(("vehicle_data",), path) as client:
+        while client.receive(timeout=1.0) is not None:
+            received += 1
+            last = time.perf_counter()
+    results.put((received, last))
+
+
+def run(context, path, subscribers, messages, max_backlog):
+    """Publish to a set of subscriber processes, returning the measured figures"""
+    bus = TelemetryBus(path, max_backlog=max_backlog)
+    results = context.Queue()
+    processes = [context.Process(target=subscriber, args=(path, results))
+                 for _ in range(subscribers)]
+    for process in processes:
+        process.start()
+    # Wait for every subscriber to have sent its filter
+    while sum(1 for connection in list(bus.connections.values()) if connection.mask) < subscribers:
+        time.sleep(0.01)
+
+    payload = VehicleMetrics.from_dict(SAMPLE_VEHICLE_DATA)
+    start = time.perf_counter()
+    for _ in range(messages):
+        bus.publish("vehicle_data", payload)
+    publish_time = time.perf_counter() - start
+
+    reports = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    stats = bus.stats()
+    bus.close()
+
+    received = sum(count for count, _ in reports)
+    finished = max((last for _, last in reports if last is not None), default=start)
+    return {
+        "publish_us": publish_time / messages * 1e6,
+        "delivered_per_s": received / max(finished - start, 1e-9),
+        "received": received,
+        "dropped": stats["dropped"],
+        "drop_rate": stats["dropped"] / (messages * subscribers)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=20000, help="Payloads published per run")
+    parser.add_argument("--backlog", type=int, default=262144,
+                        help="Unsent bytes per subscriber before frames are dropped")
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    path = os.path.join(tempfile.mkdtemp(), "bench_bus.sock")
+    print(
+        f"{'subscribers':>11}{'publish us':>12}{'delivered/s':>14}{'received':>10}"
+        f"{'dropped':>9}{'drop %':>8}"
+    )
+    for subscribers in SUBSCRIBER_COUNTS:
+        result = run(context, path, subscribers, args.messages, args.backlog)
+        print(
+            f"{subscribers:>11}{result['publish_us']:>12.2f}{result['delivered_per_s']:>14,.0f}"
+            f"{result['received']:>10}{result['dropped']:>9}{result['drop_rate']:>8.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+Benchmark of widget polish cost, per-instance inline style sheets vs the shared theme
+
+Builds cards shaped like the Vehicle Info status area (card, header, state and substate labels,
+status flags, an app button) under the offscreen Qt platform. The inline path gives every widget
+its own style sheet the way the components used to; the themed path sets object names and
+dynamic properties matched by the one application style sheet. Reports polish time per widget,
+the cost of restyling the state label on a state change and of switching day to night, then
+times full ThemeEngine switches (style sheet, palette, prepared background) against rendering
+the background variants on demand.
+Run from the project root:
+    python -m benchmarks.bench_theme
+"""
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse
+import itertools
+import statistics
+import sys
+import time
+from string import Template
+
+from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel, QPushButton
+from PyQt6.QtCore import Qt, QSize, QThreadPool
+
+from app.utils.constants import THEMES, THEME, VEHICLE_STATES
+from app.utils.theme import apply_theme, set_style_property
+from app.utils.theme_engine import ThemeEngine, render_background
+
+FLAGS = ("MOTOR_READY", "BATTERY_OK", "CHARGING_CONNECTED", "DOORS_LOCKED")
+
+# Per-instance sheets as the components set them before the shared theme
+INLINE_CARD = Template("""
+    QWidget {
+        background-color: $SURFACE;
+        border: 1px solid $SURFACE_BORDER;
+        border-radius: 10px;
+    }
+""")
+INLINE_STATE = Template("""
+    QLabel {
+        font-size: 24px;
+        font-weight: bold;
+        color: $color;
+        padding: 5px;
+        border-radius: 5px;
+        background-color: $OVERLAY;
+    }
+""")
+INLINE_SUBSTATE = Template("QLabel { font-size: 16px; color: $TEXT_MUTED; padding: 3px; }")
+INLINE_FLAG = Template("""
+    QLabel {
+        background-color: $FLAG;
+        color: $FLAG_TEXT;
+        border-radius: 4px;
+        padding: 4px 8px;
+        font-size: 11px;
+    }
+""")
+INLINE_BUTTON = Template("""
+    QPushButton {
+        background-color: $BUTTON;
+        border: 1px solid $BORDER;
+        border-radius: 10px;
+    }
+    QPushButton:hover {
+        background-color: $BUTTON_HOVER;
+    }
+""")
+
+
+def build_card(inline, palette):
+    """One card widget tree, styled inline or through object names and properties"""
+    card = QWidget()
+    layout = QVBoxLayout(card)
+    header = QLabel("Vehicle Information")
+    state = QLabel("PARK")
+    substate = QLabel("READY")
+    flags = [QLabel(flag.replace("_", " ")) for flag in FLAGS]
+    button = QPushButton()
+    QVBoxLayout(button).addWidget(QLabel("Vehicle Info"))
+    for widget in [header, state, substate, *flags, button]:
+        layout.addWidget(widget)
+
+    if inline:
+        card.setStyleSheet(INLINE_CARD.substitute(palette))
+        header.setStyleSheet("font-size: 18px; font-weight: bold;")
+        state.setStyleSheet(INLINE_STATE.substitute(palette, color=palette["PARK"]))
+        substate.setStyleSheet(INLINE_SUBSTATE.substitute(palette))
+        for label in flags:
+            label.setStyleSheet(INLINE_FLAG.substitute(palette))
+        button.setStyleSheet(INLINE_BUTTON.substitute(palette))
+    else:
+        card.setObjectName("vehicle_widget")
+        header.setObjectName("card_header")
+        state.setObjectName("state_label")
+        state.setProperty("state", "PARK")
+        substate.setObjectName("substate_label")
+        for label, flag in zip(flags, FLAGS):
+            label.setObjectName("status_flag")
+            label.setProperty("flag", flag)
+        button.setObjectName("app_button")
+    return card, state, substate, flags, button
+
+
+def polish(cards):
+    """Polish every widget of the cards, returning the widget count"""
+    count = 0
+    for card in cards:
+        card.ensurePolished()
+        for widget in card.findChildren(QWidget):
+            widget.ensurePolished()
+            count += 1
+    return count + len(cards)
+
+
+def run(app, inline, cards, changes):
+    """Time building and polishing, state restyles and a theme switch for one path"""
+    day, night = THEMES["day"], THEMES["night"]
+    start = time.perf_counter()
+    built = [build_card(inline, day) for _ in range(cards)]
+    widgets = polish(card for card, *_ in built)
+    polish_time = time.perf_counter() - start
+
+    states = itertools.cycle(VEHICLE_STATES)
+    labels = itertools.cycle([state for _, state, *_ in built])
+    start = time.perf_counter()
+    for _ in range(changes):
+        label, name = next(labels), next(states)
+        if inline:
+            label.setStyleSheet(INLINE_STATE.substitute(day, color=day.get(name, day["TEXT"])))
+        else:
+            set_style_property(label, "state", name)
+        label.ensurePolished()
+    restyle_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if inline:
+        # Every sheet is rebuilt and reparsed with the other palette
+        for card, state, substate, flags, button in built:
+            card.setStyleSheet(INLINE_CARD.substitute(night))
+            state.setStyleSheet(INLINE_STATE.substitute(night, color=night["PARK"]))
+            substate.setStyleSheet(INLINE_SUBSTATE.substitute(night))
+            for label in flags:
+                label.setStyleSheet(INLINE_FLAG.substitute(night))
+            button.setStyleSheet(INLINE_BUTTON.substitute(night))
+    else:
+        apply_theme(app, "night")
+    polish(card for card, *_ in built)
+    switch_time = time.perf_counter() - start
+
+    for card, *_ in built:
+        card.deleteLater()
+    app.processEvents()
+    return {
+        "widgets": widgets,
+        "polish_us": polish_time / widgets * 1e6,
+        "restyle_us": restyle_time / changes * 1e6,
+        "switch_ms": switch_time * 1e3
+    }
+
+
+def engine_switches(app, cards, switches, size):
+    """Time ThemeEngine switches with prepared assets and one on-demand background render"""
+    engine = ThemeEngine(app, "day")
+    # Let the pool thread deliver the night background and the deferred scaling run
+    QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+    engine.prepare(size)
+    app.processEvents()
+
+    built = [build_card(False, THEMES["day"]) for _ in range(cards)]
+    polish(card for card, *_ in built)
+    times = []
+    for index in range(switches):
+        start = time.perf_counter()
+        engine.set_theme("night" if index % 2 == 0 else "day")
+        engine.background(True, size)
+        polish(card for card, *_ in built)
+        times.append((time.perf_counter() - start) * 1e3)
+
+    # What every switch would cost if the variants were rendered when needed
+    start = time.perf_counter()
+    for image in render_background("night", THEME["background"]):
+        image.scaled(size, Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                     Qt.TransformationMode.SmoothTransformation)
+    on_demand = (time.perf_counter() - start) * 1e3
+    return statistics.median(times), max(times), on_demand
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cards", type=int, default=50, help="Card widget trees built per path")
+    parser.add_argument("--changes", type=int, default=2000, help="State label restyles timed")
+    parser.add_argument("--switches", type=int, default=20, help="Theme engine switches timed")
+    parser.add_argument("--size", default="1920x1080", help="Window size backgrounds cover")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    # Inline first, while the application has no style sheet of its own
+    results = {"inline": run(app, True, args.cards, args.changes)}
+    apply_theme(app, "day")
+    results["themed"] = run(app, False, args.cards, args.changes)
+
+    print(f"{args.cards} cards of {results['themed']['widgets'] // args.cards} widgets")
+    print(f"{'path':<10}{'polish us/widget':>18}{'restyle us':>12}{'switch ms':>11}")
+    for name, result in results.items():
+        print(
+            f"{name:<10}{result['polish_us']:>18.1f}{result['restyle_us']:>12.1f}"
+            f"{result['switch_ms']:>11.1f}"
+        )
+
+    width, height = (int(part) for part in args.size.split("x"))
+    median, worst, on_demand = engine_switches(app, args.cards, args.switches, QSize(width, height))
+    print(
+        f"\nengine switch at {args.size}: median {median:.1f} ms, worst {worst:.1f} ms "
+        f"(frame budget {THEME['frame_budget']} ms); rendering variants on demand "
+        f"{on_demand:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
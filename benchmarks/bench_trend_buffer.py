@@ -0,0 +1,48 @@
+"""
+Benchmark of sparkline history append and decimation cost
+
+Shows that appending a sample and reading the decimated columns for a repaint cost the
+same regardless of how much history is kept. Run from the project root:
+    python -m benchmarks.bench_trend_buffer
+"""
+import argparse
+import timeit
+
+from app.utils.trend_buffer import TrendBuffer
+
+
+def naive_columns(samples, columns):
+    """Decimate the full history on every repaint, as a chart redraw would"""
+    size = max(-(-len(samples) // columns), 1)
+    return [
+        (min(samples[i:i + size]), max(samples[i:i + size]))
+        for i in range(0, len(samples), size)
+    ]
+
+
+def bench(stmt, number):
+    """Return the best per-call time in microseconds"""
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--columns", type=int, default=200, help="Sparkline width in pixels")
+    parser.add_argument("--number", type=int, default=2000, help="Calls per repeat")
+    args = parser.parse_args()
+
+    print(f"{'capacity':>10}{'append us':>12}{'columns us':>12}{'naive us':>12}")
+    for capacity in (300, 3000, 30000):
+        buffer = TrendBuffer(capacity, args.columns)
+        for i in range(capacity):
+            buffer.append(i % 97)
+        samples = list(buffer.history())
+
+        append = bench(lambda: buffer.append(42.0), args.number * 10)
+        columns = bench(buffer.columns, args.number)
+        naive = bench(lambda: naive_columns(samples, args.columns), max(args.number // 20, 1))
+        print(f"{capacity:>10}{append:>12.2f}{columns:>12.1f}{naive:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
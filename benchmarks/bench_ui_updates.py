@@ -0,0 +1,299 @@
+"""
+Headless benchmark of the UI update path with 1, 2 and 3 dashboard widgets
+
+Drives simulated payloads through MainDash under the offscreen Qt platform and reports
+per-update latency percentiles, Python allocations and repaint counts.
+Run from the project root:
+    python -m benchmarks.bench_ui_updates --rate 25 --duration 5 --output bench_ui.json
+    python -m benchmarks.bench_ui_updates --baseline bench_ui.json
+"""
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QObject, QEvent, pyqtSignal
+
+from app.windows.main_dashboard import MainDash
+from app.services.payloads import VehicleMetrics, VehicleState, FaultStatus
+from app.simulator.scenarios import VehicleSimulator, SCENARIOS
+
+WIDGET_COUNTS = (1, 2, 3)
+
+# Component methods timed on every widget instance
+TIMED_METHODS = (
+    ("VehicleWidget.update_data", lambda w: [w]),
+    ("StateWidget.update_state", lambda w: [w.state_widget]),
+    ("FaultWidget.update_fault_status", lambda w: [w.fault_widget])
+)
+
+
+class SyntheticFeed(QObject):
+    """Data source with the DataService signals that never touches the network"""
+    data_updated = pyqtSignal(object)
+    state_updated = pyqtSignal(object)
+    fault_updated = pyqtSignal(object)
+    connection_status_changed = pyqtSignal(bool)
+
+    def start_monitoring(self):
+        pass
+
+    def stop_monitoring(self):
+        pass
+
+
+class PaintCounter(QObject):
+    """Application-wide event filter counting paint events per widget class"""
+    def __init__(self):
+        super().__init__()
+        self.counts = Counter()
+        self.enabled = False
+
+    def eventFilter(self, obj, event):
+        if self.enabled and event.type() == QEvent.Type.Paint:
+            self.counts[type(obj).__name__] += 1
+        return False
+
+
+class FakeClock:
+    """Clock advanced explicitly so simulated payloads do not depend on wall time"""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def generate_payloads(scenario, rate, ticks, seed):
+    """Pre-build (state, fault, metrics) payload ticks so generation is not timed"""
+    clock = FakeClock()
+    simulator = VehicleSimulator(scenario=scenario, seed=seed, clock=clock)
+    frames = []
+    for _ in range(ticks):
+        clock.now += 1.0 / rate
+        frames.append((
+            VehicleState.from_dict(simulator.vehicle_state()),
+            FaultStatus.from_dict(simulator.fault_status()),
+            VehicleMetrics.from_dict(simulator.vehicle_data())
+        ))
+    return frames
+
+
+def summarize(samples):
+    """Latency percentiles in microseconds"""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    if len(ordered) > 1:
+        cuts = statistics.quantiles(ordered, n=100, method="inclusive")
+    else:
+        cuts = ordered * 99
+    return {
+        "count": len(ordered),
+        "mean_us": statistics.fmean(ordered),
+        "p50_us": cuts[49],
+        "p95_us": cuts[94],
+        "p99_us": cuts[98],
+        "max_us": ordered[-1]
+    }
+
+
+def wrap_timed(target, method_name, samples):
+    """Replace a bound method on an instance with a timing wrapper"""
+    original = getattr(target, method_name)
+
+    def timed(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            samples.append((time.perf_counter_ns() - start) / 1000)
+
+    setattr(target, method_name, timed)
+
+
+def build_window(app, widget_count):
+    """Create a dashboard with widget_count Vehicle Info widgets laid out"""
+    feed = SyntheticFeed()
+    window = MainDash(feed)
+    window.show()
+    window.set_blurred_background()
+    for position in range(widget_count):
+        window.display_area.add_widget("Vehicle Info", position)
+    app.processEvents()
+    return window, feed
+
+
+def run_case(app, paint_counter, widget_count, frames, rate):
+    """Drive all frames through one dashboard configuration"""
+    window, feed = build_window(app, widget_count)
+    display_area = window.display_area
+
+    relayout = []
+    start = time.perf_counter_ns()
+    display_area.rearrange_widgets()
+    relayout.append((time.perf_counter_ns() - start) / 1000)
+    app.processEvents()
+
+    method_samples = defaultdict(list)
+    for name, targets in TIMED_METHODS:
+        method_name = name.split(".")[1]
+        for widget in display_area.widgets:
+            for target in targets(widget):
+                wrap_timed(target, method_name, method_samples[name])
+
+    batcher = window.update_batcher
+    topic_samples = defaultdict(list)
+    signals = (
+        ("vehicle_state", feed.state_updated),
+        ("fault_status", feed.fault_updated),
+        ("vehicle_data", feed.data_updated)
+    )
+
+    paint_counter.counts.clear()
+    paint_counter.enabled = True
+    interval = 1.0 / rate
+    next_tick = time.perf_counter()
+    for frame in frames:
+        for (topic, signal), payload in zip(signals, frame):
+            start = time.perf_counter_ns()
+            signal.emit(payload)
+            topic_samples[topic].append((time.perf_counter_ns() - start) / 1000)
+        if batcher is not None:
+            # Apply the frame's batch explicitly so it is timed as one update pass
+            start = time.perf_counter_ns()
+            batcher.flush()
+            topic_samples["batch_flush"].append((time.perf_counter_ns() - start) / 1000)
+        app.processEvents()
+
+        next_tick += interval
+        delay = next_tick - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+    app.processEvents()
+    paint_counter.enabled = False
+    repaints = dict(paint_counter.counts)
+
+    # Separate untimed pass for allocations, tracemalloc slows everything down
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for frame in frames:
+        for (_, signal), payload in zip(signals, frame):
+            signal.emit(payload)
+        if batcher is not None:
+            batcher.flush()
+        app.processEvents()
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    diff = after.compare_to(before, "filename")
+    allocations = {
+        "allocated_bytes_per_tick": sum(max(d.size_diff, 0) for d in diff) / len(frames),
+        "allocated_blocks_per_tick": sum(max(d.count_diff, 0) for d in diff) / len(frames),
+        "peak_traced_bytes": peak
+    }
+
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+
+    return {
+        "widgets": widget_count,
+        "topics": {topic: summarize(samples) for topic, samples in topic_samples.items()},
+        "methods": {name: summarize(samples) for name, samples in method_samples.items()},
+        "rearrange_widgets": summarize(relayout),
+        "repaints": repaints,
+        "repaints_per_tick": sum(repaints.values()) / len(frames),
+        "allocations": allocations,
+        "batching": batcher.stats() if batcher is not None else None
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Print p95 changes against a baseline run, returning True if any regressed"""
+    regressed = False
+    base_cases = {case["widgets"]: case for case in baseline["cases"]}
+    for case in results["cases"]:
+        base = base_cases.get(case["widgets"])
+        if base is None:
+            continue
+        for topic, stats in case["topics"].items():
+            base_p95 = base["topics"].get(topic, {}).get("p95_us")
+            if not base_p95:
+                continue
+            change = stats["p95_us"] / base_p95 - 1
+            flag = ""
+            if change > tolerance:
+                flag = "  REGRESSION"
+                regressed = True
+            print(f"{case['widgets']} widget(s) {topic:<14} p95 {change:+.1%}{flag}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rate", type=float, default=10.0, help="Ticks per second")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per case")
+    parser.add_argument("--scenario", choices=SCENARIOS, default="drive")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default="bench_ui_results.json",
+                        help="Where to save the results as JSON")
+    parser.add_argument("--baseline", help="Previous results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed p95 increase over the baseline before failing")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    app = QApplication(sys.argv[:1])
+    paint_counter = PaintCounter()
+    app.installEventFilter(paint_counter)
+
+    ticks = max(int(args.rate * args.duration), 1)
+    frames = generate_payloads(args.scenario, args.rate, ticks, args.seed)
+
+    results = {
+        "config": {
+            "rate": args.rate,
+            "duration": args.duration,
+            "scenario": args.scenario,
+            "seed": args.seed,
+            "platform": os.environ["QT_QPA_PLATFORM"],
+            "python": sys.version.split()[0]
+        },
+        "cases": []
+    }
+    for widget_count in WIDGET_COUNTS:
+        case = run_case(app, paint_counter, widget_count, frames, args.rate)
+        results["cases"].append(case)
+        for topic, stats in case["topics"].items():
+            print(
+                f"{widget_count} widget(s) {topic:<14} p50 {stats['p50_us']:8.1f}us "
+                f"p95 {stats['p95_us']:8.1f}us p99 {stats['p99_us']:8.1f}us"
+            )
+        print(
+            f"{widget_count} widget(s) repaints/tick {case['repaints_per_tick']:.1f}, "
+            f"alloc {case['allocations']['allocated_bytes_per_tick']:.0f} B/tick"
+        )
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Saved results to {args.output}")
+
+    if baseline is not None:
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
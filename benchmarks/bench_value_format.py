@@ -0,0 +1,97 @@
+"""
+Benchmark of per-tick metric text formatting with and without quantization and caching
+
+Feeds a drifting, noisy VehicleMetrics stream through the Vehicle Info render plan. The plain
+path formats every received value the way the widget used to; the quantized path rounds each
+value to its display step, skips values whose key is unchanged and formats only cache misses.
+Reports time per tick and the share of ticks that would have called set_metric.
+Run from the project root:
+    python -m benchmarks.bench_value_format
+"""
+import argparse
+import random
+import timeit
+
+from app.services.payloads import VehicleMetrics
+from app.utils.widget_spec import widget_plan
+from .samples import SAMPLE_VEHICLE_DATA
+
+
+def make_stream(count, noise, seed):
+    """Payloads drifting slowly with sensor noise around the sample values"""
+    rng = random.Random(seed)
+    base = VehicleMetrics.from_dict(SAMPLE_VEHICLE_DATA)
+    stream = []
+    for tick in range(count):
+        drift = tick * 0.002
+        payload = base.replace(
+            charge_percent=base.charge_percent + drift * 0.5,
+            power_output=round(base.power_output + drift + rng.gauss(0, noise), 3),
+            motor_temp=round(base.motor_temp + drift + rng.gauss(0, noise), 3),
+            battery_temp=round(base.battery_temp + drift * 0.5 + rng.gauss(0, noise), 3),
+            tire_temp=[round(t + drift + rng.gauss(0, noise), 3) for t in base.tire_temp],
+            tire_pressure=[round(p + rng.gauss(0, noise), 3) for p in base.tire_pressure]
+        )
+        stream.append(payload)
+    return stream
+
+
+def plain_texts(plan, stream, shown):
+    """Format every value unquantized, counting texts that differ from the shown ones"""
+    updates = 0
+    for payload in stream:
+        for binding in plan.bindings:
+            value = binding.get(payload)
+            if binding.series > 1:
+                text = f"{binding.name}: {' / '.join(f'{v}' for v in value)}{binding.unit}"
+            else:
+                text = f"{binding.name}: {value}{binding.unit}"
+            if shown.get(binding.key) != text:
+                shown[binding.key] = text
+                updates += 1
+    return updates
+
+
+def quantized_texts(plan, stream, shown):
+    """Quantize every value and format only keys that changed"""
+    updates = 0
+    for payload in stream:
+        for binding in plan.bindings:
+            formatter = binding.formatter
+            key = formatter.quantize(binding.get(payload))
+            if shown.get(binding.key) != key:
+                shown[binding.key] = key
+                formatter.text(key)
+                updates += 1
+    return updates
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ticks", type=int, default=2000, help="Payloads in the stream")
+    parser.add_argument("--noise", type=float, default=0.02,
+                        help="Sensor noise standard deviation")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    plan = widget_plan("Vehicle Info")
+    stream = make_stream(args.ticks, args.noise, args.seed)
+    metrics = len(plan.bindings)
+
+    results = {}
+    for name, run in (("plain", plain_texts), ("quantized", quantized_texts)):
+        updates = run(plan, stream, {})
+        elapsed = min(timeit.repeat(lambda: run(plan, stream, {}), number=1, repeat=5))
+        results[name] = (elapsed / args.ticks * 1e6, updates / (args.ticks * metrics))
+
+    print(f"{args.ticks} ticks of {metrics} metrics, noise {args.noise}")
+    print(f"{'path':<12}{'us/tick':>10}{'updates':>10}")
+    for name, (per_tick, update_share) in results.items():
+        print(f"{name:<12}{per_tick:>10.2f}{update_share:>10.1%}")
+    hits = sum(binding.formatter.hits for binding in plan.bindings)
+    misses = sum(binding.formatter.misses for binding in plan.bindings)
+    print(f"\nformat cache hit rate {hits / max(hits + misses, 1):.1%}")
+
+
+if __name__ == "__main__":
+    main()
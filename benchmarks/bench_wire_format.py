@@ -0,0 +1,64 @@
+"""
+Benchmark of bytes on the wire and decode time for the JSON and binary telemetry formats
+
+Run from the project root:
+    python -m benchmarks.bench_wire_format
+"""
+import argparse
+import json
+import timeit
+
+from app.services import decoding
+from app.services.binary_codec import encode_payload, decode_binary
+from app.services.payloads import VehicleMetrics, VehicleState, FaultStatus
+from .samples import SAMPLE_STATE, SAMPLE_FAULT, SAMPLE_VEHICLE_DATA
+
+
+TOPICS = {
+    "vehicle_state": (SAMPLE_STATE, VehicleState),
+    "fault_status": (SAMPLE_FAULT, FaultStatus),
+    "vehicle_data": (SAMPLE_VEHICLE_DATA, VehicleMetrics)
+}
+
+# Messages per second across all topics at the default update intervals
+MESSAGE_RATE = 25
+
+
+def bench(func, number):
+    """Return the best per-call time in microseconds"""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=20000, help="Decodes per repeat")
+    args = parser.parse_args()
+
+    print(f"JSON backend: {decoding.JSON_BACKEND}")
+    print(
+        f"{'topic':<16}{'json B':>8}{'binary B':>10}"
+        f"{'stdlib us':>11}{'json us':>10}{'binary us':>11}"
+    )
+
+    for topic, (sample, payload_type) in TOPICS.items():
+        json_raw = json.dumps(sample).encode()
+        binary_raw = encode_payload(payload_type.from_dict(sample))
+
+        stdlib_time = bench(lambda: payload_type.from_dict(json.loads(json_raw)), args.number)
+        json_time = bench(lambda: decoding.decode_payload(json_raw, payload_type), args.number)
+        binary_time = bench(lambda: decode_binary(binary_raw, payload_type), args.number)
+        print(
+            f"{topic:<16}{len(json_raw):>8}{len(binary_raw):>10}"
+            f"{stdlib_time:>11.2f}{json_time:>10.2f}{binary_time:>11.2f}"
+        )
+
+    json_rate = len(json.dumps(SAMPLE_VEHICLE_DATA).encode()) * MESSAGE_RATE
+    binary_rate = len(encode_payload(VehicleMetrics.from_dict(SAMPLE_VEHICLE_DATA))) * MESSAGE_RATE
+    print(
+        f"\nvehicle_data at {MESSAGE_RATE} msg/s: "
+        f"{json_rate / 1024:.1f} KiB/s json, {binary_rate / 1024:.1f} KiB/s binary"
+    )
+
+
+if __name__ == "__main__":
+    main()
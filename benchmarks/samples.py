@@ -0,0 +1,32 @@
+"""
+Representative backend payloads shared by the benchmarks
+"""
+
+SAMPLE_STATE = {
+    "primary_state": "DRIVE",
+    "sub_state": "ACTIVE",
+    "status_flags": ["MOTOR_READY", "BATTERY_OK", "SYSTEMS_CHECK_PASS"],
+    "message_counter": 41235
+}
+
+SAMPLE_FAULT = {
+    "active": True,
+    "source": "BATTERY",
+    "type": "TEMP_HIGH",
+    "severity": 2,
+    "timestamp": 15234
+}
+
+SAMPLE_VEHICLE_DATA = {
+    "charge_percent": 67,
+    "charging_rate": 0.0,
+    "power_output": 85.4,
+    "motor_temp": 72.5,
+    "battery_temp": 38.2,
+    "inverter_temp": 55.1,
+    "brake_temp": 120.4,
+    "tire_temp": [65.2, 66.1, 63.8, 64.9],
+    "tire_pressure": [33.5, 33.7, 32.9, 33.1],
+    "vehicle_state": SAMPLE_STATE,
+    "fault_status": SAMPLE_FAULT
+}
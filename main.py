@@ -3,6 +3,8 @@ Main entry point for the infotainment dashboard application
 """
 import sys
 import os
+import argparse
+import logging
 from pathlib import Path
 
 # Add project root to Python path
@@ -12,21 +14,138 @@ sys.path.append(project_root)
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
 from app.windows.main_dashboard import MainDash
+from app.services.data_service import DataService
+from app.services.replay_service import ReplayService
+from app.services.latency_tracer import tracer
+from app.services.fault_history import FaultHistory
+from app.services.layout_store import LayoutStore
+from app.services.data_hub import DataHub
+from app.services.acquisition_process import ProcessDataService
+from app.utils.constants import (
+    LAYOUT_STATE, DISPLAYS, TELEMETRY_BUS, THEMES, THEME, SESSION_RECORDING
+)
+from app.utils.theme_engine import ThemeEngine, CLI_MODES
+
+
+def parse_args():
+    """Parse dashboard options, leaving Qt arguments for QApplication"""
+    parser = argparse.ArgumentParser(description="Vehicle infotainment dashboard")
+    parser.add_argument("--record", metavar="PATH",
+                        help="Append every received payload to a telemetry recording")
+    parser.add_argument("--replay", metavar="PATH",
+                        help="Replay a telemetry recording instead of polling the backend")
+    parser.add_argument("--replay-speed", type=float, default=1.0,
+                        help="Replay speed multiplier, 0 for as fast as possible")
+    parser.add_argument("--replay-loop", action="store_true",
+                        help="Restart the replay when the recording ends")
+    parser.add_argument("--acquisition-process", action="store_true",
+                        help="Poll the backend in a separate process and read its "
+                             "shared-memory snapshot every frame")
+    parser.add_argument("--bus", metavar="PATH", nargs="?", const=TELEMETRY_BUS["path"],
+                        help="Republish live telemetry on a local Unix-socket bus "
+                             f"(default {TELEMETRY_BUS['path']})")
+    parser.add_argument("--session", metavar="DIR", nargs="?",
+                        const=SESSION_RECORDING["directory"],
+                        help="Export every decoded sample of the drive to chunked CSV/Parquet "
+                             "files in a new session directory "
+                             f"(default {SESSION_RECORDING['directory']})")
+    parser.add_argument("--session-format", choices=("auto", "csv", "parquet"),
+                        default=SESSION_RECORDING["format"],
+                        help="Session file format; auto writes Parquet when pyarrow is installed")
+    parser.add_argument("--fault-db", metavar="PATH",
+                        help="Persist the fault history to a SQLite file")
+    parser.add_argument("--layout", metavar="PATH", default=LAYOUT_STATE["path"],
+                        help="File the widget layout is saved to and restored from")
+    parser.add_argument("--displays", metavar="NAMES",
+                        help="Comma-separated DISPLAYS entries to open, one window each, "
+                             "sharing one data source")
+    parser.add_argument("--theme", choices=sorted(THEMES), default=THEME["default"],
+                        help="Color theme to start with")
+    parser.add_argument("--theme-mode", choices=CLI_MODES, default=THEME["mode"],
+                        help="Keep the theme (manual, toggled with "
+                             f"{THEME['toggle_shortcut']}) or follow the clock")
+    parser.add_argument("--trace-latency", action="store_true",
+                        help="Measure data-to-pixel latency and show the debug overlay")
+    return parser.parse_known_args()
+
+
+def create_data_service(args):
+    """Create the live or replayed data source selected on the command line"""
+    if args.replay:
+        return ReplayService(args.replay, speed=args.replay_speed, loop=args.replay_loop)
+    if args.acquisition_process:
+        return ProcessDataService(record_path=args.record, bus_path=args.bus,
+                                  session_dir=args.session, session_format=args.session_format)
+    data_service = DataService()
+    if args.record:
+        data_service.start_recording(args.record)
+    if args.bus:
+        try:
+            data_service.start_bus(args.bus)
+        except OSError as e:
+            sys.exit(f"Cannot start the telemetry bus: {e}")
+    if args.session:
+        data_service.start_session(args.session, args.session_format)
+    return data_service
+
+
+def display_layout_path(path, name):
+    """Per-display layout file next to the one given with --layout"""
+    root, ext = os.path.splitext(path)
+    return f"{root}-{name}{ext}"
+
+
+def create_display_windows(args, app, fault_history, theme_engine):
+    """Open one MainDash per requested display, fed by a single shared data source"""
+    names = [name.strip() for name in args.displays.split(",") if name.strip()]
+    unknown = [name for name in names if name not in DISPLAYS]
+    if unknown:
+        sys.exit(f"Unknown display(s): {', '.join(unknown)}; choose from {', '.join(DISPLAYS)}")
+
+    # Faults are debounced and recorded once in the hub, not per window
+    hub = DataHub(create_data_service(args), fault_history)
+    app.aboutToQuit.connect(hub.close)
+    screens = app.screens()
+    windows = []
+    for name in names:
+        config = DISPLAYS[name]
+        screen = screens[config["screen"]] if config["screen"] < len(screens) else None
+        window = MainDash(hub.subscribe(config["topics"]), fault_history,
+                          LayoutStore(display_layout_path(args.layout, name)), screen,
+                          theme_engine)
+        window.setWindowTitle(f"{window.windowTitle()} - {name}")
+        window.show()
+        windows.append(window)
+    return windows
 
 
 def main():
     """Initialize and run the application"""
-    app = QApplication(sys.argv)
+    args, qt_args = parse_args()
+    app = QApplication(sys.argv[:1] + qt_args)
+    if args.trace_latency:
+        tracer.enabled = True
+        logging.basicConfig(level=logging.INFO)
     
     # Enable OpenGL support if available
     if hasattr(Qt, 'AA_UseOpenGLES'):
         app.setAttribute(Qt.ApplicationAttribute.AA_UseOpenGLES)
     elif hasattr(Qt, 'AA_UseDesktopOpenGL'):
         app.setAttribute(Qt.ApplicationAttribute.AA_UseDesktopOpenGL)
+
+    # Themes shared by every window, their assets prepared once up front
+    theme_engine = ThemeEngine(app, args.theme, args.theme_mode)
     
-    # Create and show the main window
-    window = MainDash()
-    window.show()
+    # Create and show the main window, or one window per display
+    fault_history = FaultHistory(db_path=args.fault_db)
+    if args.displays:
+        windows = create_display_windows(args, app, fault_history, theme_engine)
+    else:
+        window = MainDash(create_data_service(args), fault_history, LayoutStore(args.layout),
+                          theme_engine=theme_engine)
+        window.show()
+    # Shared by every window, so closed once after the last one (and the data hub)
+    app.aboutToQuit.connect(fault_history.close)
     
     # Start the event loop
     sys.exit(app.exec())